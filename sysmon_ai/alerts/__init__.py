@@ -9,11 +9,11 @@ from .rules import (
     ThresholdRule,
 )
 
-__all__ = [
+__all__ = (
     "Notifier",
     "RuleEngine",
     "AlertRule",
     "ThresholdRule",
     "AnomalyRule",
     "ForecastRule",
-]
+)
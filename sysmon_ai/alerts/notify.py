@@ -2,10 +2,19 @@
 
 import logging
 import sys
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_COLOR = "\033[92m"  # Green
+_SEV_COLORS = {
+    "critical": "\033[91m",  # Red
+    "warning": "\033[93m",  # Yellow
+    "info": _DEFAULT_COLOR,
+}
+_SOUND_SEVERITIES = frozenset(("critical", "warning"))
+_TEMPLATE = "\n{c}[{s}] {m}\033[0m\n".format
+
 
 class Notifier:
     """
@@ -31,23 +40,41 @@ class Notifier:
             alert: Alert dict with message, severity, etc.
         """
         severity = alert.get("severity", "info")
-        message = alert.get("message", "")
+        sys.stderr.write(_format_alert(severity, alert.get("message", "")))
 
-        # Console notification with color
-        if severity == "critical":
-            color = "\033[91m"  # Red
-        elif severity == "warning":
-            color = "\033[93m"  # Yellow
-        else:
-            color, reset = "\033[92m", "\033[0m"
+        # Sound alert
+        if self.enable_sound and severity in _SOUND_SEVERITIES:
+            self._play_sound()
 
-        print(
-            f"\n{color}[{severity.upper()}] {message}{reset}",
-            file=sys.stderr,
-        )
+    def notify_batch(
+        self,
+        alerts: Iterable[Union[Dict[str, Any], Tuple[str, str, str, float]]],
+    ) -> None:
+        """
+        Send notifications for several alerts with a single write.
 
-        # Sound alert
-        if self.enable_sound and severity in ("critical", "warning"):
+        Args:
+            alerts: Alert dicts, or (rule, severity, message, ts) tuples
+                as yielded by RuleEngine.iter_alerts
+        """
+        lines = []
+        audible = False
+        for alert in alerts:
+            if isinstance(alert, tuple):
+                _, severity, message, _ = alert
+            else:
+                severity = alert.get("severity", "info")
+                message = alert.get("message", "")
+            lines.append(_format_alert(severity, message))
+            audible = audible or severity in _SOUND_SEVERITIES
+
+        if not lines:
+            return
+
+        sys.stderr.write("".join(lines))
+        sys.stderr.flush()
+
+        if self.enable_sound and audible:
             self._play_sound()
 
     def _play_sound(self) -> None:
@@ -57,3 +84,12 @@ class Notifier:
             print("\a", end="", flush=True)
         except Exception as e:
             logger.debug(f"Failed to play sound: {e}")
+
+
+def _format_alert(severity: str, message: str) -> str:
+    """Format alert as a colored console line."""
+    return _TEMPLATE(
+        c=_SEV_COLORS.get(severity, _DEFAULT_COLOR),
+        s=severity.upper(),
+        m=message,
+    )
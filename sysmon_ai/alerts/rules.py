@@ -1,16 +1,36 @@
 """Alert rules and triggers."""
 
 import logging
-from typing import Any, Dict, List, Optional
+import operator
+from itertools import chain
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+import numpy as np
 
 from sysmon_ai.config import ThresholdConfig
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
+_ANOMALY_MSG = "Anomaly detected (score=%.3f)"
+
 
 class AlertRule:
     """Base alert rule."""
 
+    __slots__ = ("name", "severity")
+
     def __init__(self, name: str, severity: str = "warning"):
         """
         Initialize rule.
@@ -34,10 +54,45 @@ class AlertRule:
         """
         raise NotImplementedError
 
+    def batch_mask(self, df: "pd.DataFrame") -> np.ndarray:
+        """
+        Evaluate rule on every row of a dataframe.
+
+        Subclasses with a vectorized form should override this; the
+        default falls back to calling `evaluate` per row.
+
+        Args:
+            df: Input data, one sample per row
+
+        Returns:
+            Boolean array, True where the rule triggers
+        """
+        records = df.to_dict("records")
+        return np.fromiter(
+            (bool(self.evaluate(r)) for r in records),
+            dtype=bool,
+            count=len(records),
+        )
+
+    def batch_message(self, df: "pd.DataFrame", idx: int) -> str:
+        """
+        Build alert message for a triggered row.
+
+        Args:
+            df: Input data, one sample per row
+            idx: Positional index of the triggered row
+
+        Returns:
+            Alert message
+        """
+        return self.evaluate(df.iloc[idx].to_dict()) or ""
+
 
 class ThresholdRule(AlertRule):
     """Metric threshold alert rule."""
 
+    __slots__ = ("metric", "threshold", "_msg_fmt")
+
     def __init__(
         self,
         name: str,
@@ -57,6 +112,7 @@ class ThresholdRule(AlertRule):
         super().__init__(name, severity)
         self.metric = metric
         self.threshold = threshold
+        self._msg_fmt = f"{metric} exceeded threshold: %.1f >= {threshold}"
 
     def evaluate(self, data: Dict[str, Any]) -> Optional[str]:
         """Evaluate threshold."""
@@ -65,17 +121,34 @@ class ThresholdRule(AlertRule):
             return None
 
         if value >= self.threshold:
-            return (
-                f"{self.metric} exceeded threshold: "
-                f"{value:.1f} >= {self.threshold}"
-            )
+            return self.format_message(value)
 
         return None
 
+    def format_message(self, value: float) -> str:
+        """Format alert message for a value that crossed the threshold."""
+        return self._msg_fmt % value
+
+    def batch_mask(self, df: "pd.DataFrame") -> np.ndarray:
+        """Evaluate threshold on a whole column."""
+        if self.metric not in df.columns:
+            return np.zeros(len(df), dtype=bool)
+
+        values: np.ndarray = df[self.metric].to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        return values >= self.threshold
+
+    def batch_message(self, df: "pd.DataFrame", idx: int) -> str:
+        """Format threshold message for a triggered row."""
+        return self.format_message(df[self.metric].iat[idx])
+
 
 class AnomalyRule(AlertRule):
     """Anomaly detection alert rule."""
 
+    __slots__ = ()
+
     def __init__(self, name: str = "anomaly_detected"):
         """Initialize anomaly rule."""
         super().__init__(name, severity="critical")
@@ -83,14 +156,28 @@ class AnomalyRule(AlertRule):
     def evaluate(self, data: Dict[str, Any]) -> Optional[str]:
         """Check for anomaly flag."""
         if data.get("is_anomaly"):
-            score = data.get("score", 0)
-            return f"Anomaly detected (score={score:.3f})"
+            return _ANOMALY_MSG % (data.get("score", 0),)
         return None
 
+    def batch_mask(self, df: "pd.DataFrame") -> np.ndarray:
+        """Read anomaly flags from the `is_anomaly` column."""
+        if "is_anomaly" not in df.columns:
+            return np.zeros(len(df), dtype=bool)
+
+        flags: np.ndarray = df["is_anomaly"].fillna(False).to_numpy(dtype=bool)
+        return flags
+
+    def batch_message(self, df: "pd.DataFrame", idx: int) -> str:
+        """Format anomaly message for a triggered row."""
+        score = df["score"].iat[idx] if "score" in df.columns else 0
+        return _ANOMALY_MSG % score
+
 
 class ForecastRule(AlertRule):
     """Forecast-based alert rule."""
 
+    __slots__ = ("metric", "horizon_hours", "_horizon_minutes", "_msg_fmt")
+
     def __init__(
         self,
         name: str,
@@ -108,22 +195,34 @@ class ForecastRule(AlertRule):
         super().__init__(name, severity="warning")
         self.metric = metric
         self.horizon_hours = horizon_hours
+        self._horizon_minutes = horizon_hours * 60
+        self._msg_fmt = f"{metric} will reach threshold in %.1fh"
 
     def evaluate(self, data: Dict[str, Any]) -> Optional[str]:
         """Evaluate forecast."""
-        forecast = data.get("forecast", {}).get(self.metric)
+        forecasts = data.get("forecast")
+        forecast = forecasts.get(self.metric) if forecasts else None
         if not forecast:
             return None
 
-        time_min = forecast.get("time_to_threshold_minutes", float("inf"))
+        time_min = forecast.get("time_to_threshold_minutes")
+        if time_min is None:
+            return None
 
-        if time_min < (self.horizon_hours * 60):
-            hours = time_min / 60
-            return f"{self.metric} will reach threshold in {hours:.1f}h"
+        if time_min < self._horizon_minutes:
+            return self._msg_fmt % (time_min / 60,)
 
         return None
 
 
+def _tuple_getter(keys: List[str]) -> Callable[[Dict[str, Any]], tuple]:
+    """Build a getter returning the values of `keys` as a tuple."""
+    if len(keys) == 1:
+        key = keys[0]
+        return lambda data: (data[key],)
+    return operator.itemgetter(*keys)
+
+
 class RuleEngine:
     """
     Evaluates alert rules and generates alerts.
@@ -139,35 +238,130 @@ class RuleEngine:
             thresholds: Threshold configuration
         """
         self.thresholds = thresholds
-        self.rules: List[AlertRule] = []
-        self._last_alerts: Dict[str, float] = {}
+        self._rules: List[AlertRule] = []
         self._cooldown_seconds = 60  # Prevent alert spam
 
+        # Earliest timestamp each rule (by position) may fire again; the
+        # cached minimum lets evaluate bail out when every rule is cooling
+        self._next_eligible = np.empty(0, dtype=np.float64)
+        self._min_next_eligible = float("inf")
+
+        self._reset_compiled()
+
         # Default rules
         self._add_default_rules()
 
     def _add_default_rules(self) -> None:
         """Add default threshold rules."""
-        self.rules.append(
+        self.add_rule(
             ThresholdRule(
                 "cpu_high", "cpu_pct", self.thresholds.cpu_pct, "warning"
             )
         )
-        self.rules.append(
+        self.add_rule(
             ThresholdRule(
                 "mem_high", "mem_pct", self.thresholds.mem_pct, "warning"
             )
         )
-        self.rules.append(
+        self.add_rule(
             ThresholdRule(
                 "swap_high", "swap_pct", self.thresholds.swap_pct, "warning"
             )
         )
-        self.rules.append(AnomalyRule())
+        self.add_rule(AnomalyRule())
+
+    @property
+    def rules(self) -> Tuple[AlertRule, ...]:
+        """
+        Registered rules in evaluation order.
+
+        Read-only: evaluation runs on arrays compiled from the rules, so
+        changes go through add_rule and remove_rule.
+        """
+        return tuple(self._rules)
 
     def add_rule(self, rule: AlertRule) -> None:
         """Add custom rule."""
-        self.rules.append(rule)
+        self._rules.append(rule)
+        self._next_eligible = np.append(self._next_eligible, -np.inf)
+        self._min_next_eligible = float("-inf")
+        self._compile_rule(len(self._rules) - 1, rule)
+
+    def remove_rule(self, name: str) -> bool:
+        """
+        Remove every rule with the given name.
+
+        Remaining rules keep their cooldowns.
+
+        Args:
+            name: Rule name
+
+        Returns:
+            True if a rule was removed
+        """
+        kept = [
+            (rule, next_ts)
+            for rule, next_ts in zip(self._rules, self._next_eligible)
+            if rule.name != name
+        ]
+        if len(kept) == len(self._rules):
+            return False
+
+        self._rules = [rule for rule, _ in kept]
+        self._reset_compiled()
+        for order, rule in enumerate(self._rules):
+            self._compile_rule(order, rule)
+        self._next_eligible = np.array(
+            [next_ts for _, next_ts in kept], dtype=np.float64
+        )
+        self._min_next_eligible = float("-inf")
+        return True
+
+    def _reset_compiled(self) -> None:
+        """Clear the per-rule dispatch state built by _compile_rule."""
+        # Per-rule attributes as parallel lists indexed by position, so
+        # the evaluate loop avoids attribute lookups on rule objects
+        self._rule_names: List[str] = []
+        self._rule_sev: List[str] = []
+
+        # Threshold rules compiled into parallel arrays for a single
+        # vector compare; all other rules are evaluated one by one
+        self._threshold_order: List[int] = []
+        self._threshold_metrics: List[str] = []
+        self._threshold_values = np.empty(0, dtype=np.float64)
+        self._threshold_format: List[Callable[[float], str]] = []
+        self._threshold_getter: Optional[
+            Callable[[Dict[str, Any]], tuple]
+        ] = None
+        self._other_order: List[int] = []
+        self._other_eval: List[Callable[[Dict[str, Any]], Optional[str]]] = []
+
+        # Forecast rules only fire on forecast data, so they are kept apart
+        # and skipped as a group when a sample carries none
+        self._forecast_order: List[int] = []
+        self._forecast_eval: List[
+            Callable[[Dict[str, Any]], Optional[str]]
+        ] = []
+
+    def _compile_rule(self, order: int, rule: AlertRule) -> None:
+        """Append a rule at position `order` to the dispatch state."""
+        self._rule_names.append(rule.name)
+        self._rule_sev.append(rule.severity)
+
+        if isinstance(rule, ThresholdRule):
+            self._threshold_order.append(order)
+            self._threshold_metrics.append(rule.metric)
+            self._threshold_values = np.append(
+                self._threshold_values, float(rule.threshold)
+            )
+            self._threshold_format.append(rule.format_message)
+            self._threshold_getter = _tuple_getter(self._threshold_metrics)
+        elif isinstance(rule, ForecastRule):
+            self._forecast_order.append(order)
+            self._forecast_eval.append(rule.evaluate)
+        else:
+            self._other_order.append(order)
+            self._other_eval.append(rule.evaluate)
 
     def evaluate(
         self,
@@ -184,26 +378,192 @@ class RuleEngine:
         Returns:
             List of alert dicts
         """
-        alerts = []
+        return [
+            {"rule": name, "severity": severity, "message": message, "ts": ts}
+            for name, severity, message, ts in self.iter_alerts(
+                data, current_ts
+            )
+        ]
+
+    def iter_alerts(
+        self,
+        data: Dict[str, Any],
+        current_ts: float,
+    ) -> Iterator[Tuple[str, str, str, float]]:
+        """
+        Evaluate all rules, yielding triggered alerts as tuples.
 
-        for rule in self.rules:
-            # Check cooldown
-            last_alert_ts = self._last_alerts.get(rule.name, 0)
-            if current_ts - last_alert_ts < self._cooldown_seconds:
+        Cooldowns are recorded as each alert is yielded, so the generator
+        should be consumed fully.
+
+        Args:
+            data: Input data
+            current_ts: Current timestamp
+
+        Yields:
+            (rule, severity, message, ts) per triggered rule, in rule order
+        """
+        if current_ts < self._min_next_eligible:
+            return
+
+        next_eligible = self._next_eligible
+        fired: List[tuple] = []
+        message: Optional[str]
+
+        # Set exactly when threshold rules exist (see add_rule)
+        getter = self._threshold_getter
+        if getter is not None:
+            # Samples normally carry every metric, so try a single
+            # itemgetter call before falling back to per-key .get().
+            # Missing or None metrics become NaN and never compare true.
+            try:
+                raw = getter(data)
+            except KeyError:
+                raw = tuple(data.get(m) for m in self._threshold_metrics)
+            values = np.array(raw, dtype=np.float64)
+            for i in np.flatnonzero(values >= self._threshold_values):
+                order = self._threshold_order[i]
+                if current_ts < next_eligible[order]:
+                    continue
+                message = self._threshold_format[i](values[i])
+                fired.append((order, message))
+
+        for order, evaluate in zip(self._other_order, self._other_eval):
+            if current_ts < next_eligible[order]:
                 continue
 
             # Evaluate rule
-            message = rule.evaluate(data)
+            message = evaluate(data)
             if message:
-                alerts.append(
-                    {
-                        "rule": rule.name,
-                        "severity": rule.severity,
-                        "message": message,
-                        "ts": current_ts,
-                    }
+                fired.append((order, message))
+
+        if self._forecast_order and data.get("forecast"):
+            for order, evaluate in zip(
+                self._forecast_order, self._forecast_eval
+            ):
+                if current_ts < next_eligible[order]:
+                    continue
+                message = evaluate(data)
+                if message:
+                    fired.append((order, message))
+
+        if not fired:
+            return
+
+        if len(fired) > 1:
+            fired.sort(key=lambda item: item[0])
+
+        names = self._rule_names
+        severities = self._rule_sev
+        next_ts = current_ts + self._cooldown_seconds
+        for order, message in fired:
+            next_eligible[order] = next_ts
+            logger.info(f"Alert triggered: {names[order]} - {message}")
+            yield names[order], severities[order], message, current_ts
+
+        # A stale (lower) minimum is safe, it only skips the early return
+        self._min_next_eligible = float(next_eligible.min())
+
+    def evaluate_batch(
+        self,
+        df: "pd.DataFrame",
+        ts: np.ndarray,
+    ) -> List[Dict[str, Any]]:
+        """
+        Evaluate all rules over a batch of samples.
+
+        Equivalent to calling `evaluate` once per row in order, but each
+        rule is evaluated on whole columns and only rows that pass the
+        cooldown are formatted into alerts. Threshold rules share a single
+        2-D compare over their metric columns.
+
+        Args:
+            df: Input data, one sample per row
+            ts: Timestamp per row, sorted ascending
+
+        Returns:
+            List of alert dicts ordered by row, then rule
+        """
+        ts = np.asarray(ts, dtype=np.float64)
+        fired: List[tuple] = []
+        masks = self._threshold_batch_masks(df)
+
+        # Same compiled dispatch order as iter_alerts; alerts are sorted
+        # by (row, rule position) below
+        rules = self._rules
+        for order in chain(
+            self._threshold_order, self._other_order, self._forecast_order
+        ):
+            rule = rules[order]
+            mask = masks.get(order)
+            if mask is None:
+                mask = rule.batch_mask(df)
+
+            fire_idx = np.flatnonzero(mask)
+            if fire_idx.size == 0:
+                continue
+
+            # Walk the firing rows, jumping past each cooldown window
+            fire_ts = ts[fire_idx]
+            next_ok = self._next_eligible[order]
+            pos = int(np.searchsorted(fire_ts, next_ok, side="left"))
+
+            while pos < fire_idx.size:
+                idx = int(fire_idx[pos])
+                alert_ts = float(fire_ts[pos])
+                fired.append(
+                    (
+                        idx,
+                        order,
+                        {
+                            "rule": rule.name,
+                            "severity": rule.severity,
+                            "message": rule.batch_message(df, idx),
+                            "ts": alert_ts,
+                        },
+                    )
                 )
-                self._last_alerts[rule.name] = current_ts
-                logger.info(f"Alert triggered: {rule.name} - {message}")
+                next_ok = alert_ts + self._cooldown_seconds
+                pos = int(np.searchsorted(fire_ts, next_ok, side="left"))
+
+            self._next_eligible[order] = next_ok
+
+        fired.sort(key=lambda item: (item[0], item[1]))
+        alerts = [alert for _, _, alert in fired]
+
+        if alerts:
+            self._min_next_eligible = float(self._next_eligible.min())
+            logger.info(f"Batch evaluation triggered {len(alerts)} alerts")
 
         return alerts
+
+    def _threshold_batch_masks(
+        self, df: "pd.DataFrame"
+    ) -> Dict[int, np.ndarray]:
+        """
+        Compare all threshold rule columns against their thresholds.
+
+        Args:
+            df: Input data, one sample per row
+
+        Returns:
+            Dict mapping rule order to boolean mask, for threshold rules
+            whose metric column is present
+        """
+        present = [
+            i
+            for i, metric in enumerate(self._threshold_metrics)
+            if metric in df.columns
+        ]
+        if not present:
+            return {}
+
+        values = df[[self._threshold_metrics[i] for i in present]].to_numpy(
+            dtype=np.float64, na_value=np.nan
+        )
+        hits = values >= self._threshold_values[present]
+
+        return {
+            self._threshold_order[i]: hits[:, col]
+            for col, i in enumerate(present)
+        }
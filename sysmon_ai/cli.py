@@ -1,25 +1,24 @@
 """Command-line interface using Typer."""
 
+import logging
 import sys
 import threading
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 import typer
 from rich.console import Console
 
 from sysmon_ai import __version__
 from sysmon_ai.config import Config
-from sysmon_ai.data import Repository
-from sysmon_ai.detection import AnomalyDetector
-from sysmon_ai.evaluation import Evaluator
-from sysmon_ai.features import FeatureTransformer
-from sysmon_ai.ingest import BatchWriter, MetricsSampler
 from sysmon_ai.logging_setup import setup_logging
-from sysmon_ai.models import IsolationForestModel
-from sysmon_ai.ui import Dashboard
-from sysmon_ai.utils import get_time_range, parse_duration
+from sysmon_ai.utils import (
+    get_os_info,
+    get_os_version,
+    get_time_range,
+    parse_duration,
+)
 
 app = typer.Typer(
     name="sysmon",
@@ -29,6 +28,9 @@ app = typer.Typer(
 
 console = Console()
 
+# Collector loop logs writer stats once per this many samples
+_STATS_LOG_EVERY = 100
+
 
 @app.command()
 def init(
@@ -38,6 +40,8 @@ def init(
     ),
 ) -> None:
     """Initialize database and configuration."""
+    from sysmon_ai.data import Repository
+
     console.print(
         f"[bold cyan]Initializing sysmon v{__version__}...[/bold cyan]"
     )
@@ -56,7 +60,10 @@ def init(
     )
 
     # Initialize repository
-    repo = Repository(config.storage.db_path)
+    repo = Repository(
+        config.storage.db_path,
+        shard_by_month=config.storage.shard_by_month,
+    )
     repo.connect()
     repo.initialize_schema()
 
@@ -87,6 +94,9 @@ def start(
     ),
 ) -> None:
     """Start metrics collection."""
+    from sysmon_ai.data import Repository
+    from sysmon_ai.ingest import BatchWriter, MetricsSampler
+
     config = Config.load(config_path) if config_path else Config()
     if db_path:
         config.storage.db_path = db_path
@@ -101,9 +111,17 @@ def start(
     console.print(f"  Database: {config.storage.db_path}")
 
     # Initialize components
-    repo = Repository(config.storage.db_path)
+    repo = Repository(
+        config.storage.db_path,
+        shard_by_month=config.storage.shard_by_month,
+    )
     repo.connect()
 
+    # With shard_by_month, move finished months out of the main table
+    # now and again at each month rollover while collecting
+    repo.archive_samples()
+    archive_ts = repo.next_archive_ts()
+
     sampler = MetricsSampler(config.host)
     writer = BatchWriter(
         repo,
@@ -115,26 +133,52 @@ def start(
 
     # Collection loop
     try:
-        start_time = time.time()
-        end_time = (
-            start_time + parse_duration(duration) if duration else float("inf")
+        # Deadlines are kept on the monotonic clock: each sample is
+        # scheduled relative to the previous deadline rather than to when
+        # sample() returned, so sampling time does not accumulate as drift.
+        rate_ns = int(config.sampling.rate_seconds * 1e9)
+        now_ns = time.monotonic_ns()
+        end_ns = (
+            now_ns + parse_duration(duration) * 1_000_000_000
+            if duration
+            else None
         )
+        next_deadline = now_ns
         sample_count = 0
+        ticks_to_log = _STATS_LOG_EVERY
+        log_stats = logger.isEnabledFor(logging.INFO)
 
-        while time.time() < end_time:
+        while end_ns is None or now_ns < end_ns:
             sample = sampler.sample()
             writer.enqueue(sample)
             sample_count += 1
 
-            if sample_count % 100 == 0:
-                stats = writer.get_stats()
-                logger.info(
-                    f"Collected {sample_count} samples "
-                    f"(written={stats['written']}, queued={stats['queued']}, "
-                    f"dropped={stats['dropped']})"
-                )
-
-            time.sleep(config.sampling.rate_seconds)
+            if archive_ts is not None and sample["ts"] >= archive_ts:
+                with writer.paused():
+                    repo.archive_samples()
+                archive_ts = repo.next_archive_ts()
+
+            ticks_to_log -= 1
+            if not ticks_to_log:
+                ticks_to_log = _STATS_LOG_EVERY
+                if log_stats:
+                    stats = writer.get_stats()
+                    logger.info(
+                        "Collected %d samples "
+                        "(written=%d, queued=%d, dropped=%d)",
+                        sample_count,
+                        stats["written"],
+                        stats["queued"],
+                        stats["dropped"],
+                    )
+
+            now_ns = time.monotonic_ns()
+            next_deadline += rate_ns
+            if next_deadline < now_ns:
+                # Fell more than a period behind; resync instead of bursting
+                next_deadline = now_ns
+            time.sleep((next_deadline - now_ns) / 1e9)
+            now_ns = time.monotonic_ns()
 
     except KeyboardInterrupt:
         console.print("\n[yellow]Stopping collector...[/yellow]")
@@ -160,6 +204,11 @@ def train(
     host: Optional[str] = typer.Option(None, "--host", help="Filter by host"),
 ) -> None:
     """Train anomaly detection model."""
+    from sysmon_ai.data import Repository
+    from sysmon_ai.detection import AnomalyDetector
+    from sysmon_ai.features import FeatureTransformer
+    from sysmon_ai.models import IsolationForestModel
+
     config = Config.load(config_path) if config_path else Config()
     if db_path:
         config.storage.db_path = db_path
@@ -171,7 +220,10 @@ def train(
     console.print(f"  Database: {config.storage.db_path}")
 
     # Initialize components
-    repo = Repository(config.storage.db_path)
+    repo = Repository(
+        config.storage.db_path,
+        shard_by_month=config.storage.shard_by_month,
+    )
     repo.connect()
 
     model = IsolationForestModel(
@@ -218,6 +270,11 @@ def detect(
     ),
 ) -> None:
     """Run anomaly detection on historical data."""
+    from sysmon_ai.data import Repository
+    from sysmon_ai.detection import AnomalyDetector
+    from sysmon_ai.features import FeatureTransformer
+    from sysmon_ai.models import IsolationForestModel
+
     config = Config.load(config_path) if config_path else Config()
     if db_path:
         config.storage.db_path = db_path
@@ -227,7 +284,10 @@ def detect(
     console.print("[bold cyan]Running anomaly detection...[/bold cyan]")
 
     # Initialize
-    repo = Repository(config.storage.db_path)
+    repo = Repository(
+        config.storage.db_path,
+        shard_by_month=config.storage.shard_by_month,
+    )
     repo.connect()
 
     model = IsolationForestModel(random_state=config.anomaly.random_state)
@@ -258,13 +318,7 @@ def detect(
         # Extract and save events
         if save_events and anomaly_count > 0:
             events = detector.extract_anomalies(df, scores, is_anomaly)
-            for event in events:
-                repo.write_event(
-                    event_type="anomaly",
-                    score=event["score"],
-                    metric_tags=event["metric_tags"],
-                    explanation=event["explanation"],
-                )
+            repo.write_events_bulk(events, event_type="anomaly")
 
             console.print(f"  Saved {len(events)} events to database")
 
@@ -284,6 +338,13 @@ def dashboard(
     ),
 ) -> None:
     """Launch live dashboard."""
+    from sysmon_ai.data import Repository
+    from sysmon_ai.detection import AnomalyDetector
+    from sysmon_ai.features import FeatureTransformer
+    from sysmon_ai.ingest import MetricsSampler
+    from sysmon_ai.models import IsolationForestModel
+    from sysmon_ai.ui import Dashboard
+
     config = Config.load(config_path) if config_path else Config()
     if db_path:
         config.storage.db_path = db_path
@@ -294,7 +355,10 @@ def dashboard(
     console.print("  Press Ctrl+C to stop")
 
     # Initialize components
-    repo = Repository(config.storage.db_path)
+    repo = Repository(
+        config.storage.db_path,
+        shard_by_month=config.storage.shard_by_month,
+    )
     repo.connect()
 
     sampler = MetricsSampler(config.host)
@@ -308,16 +372,18 @@ def dashboard(
 
     stop_event = threading.Event()
 
-    def data_callback() -> tuple:
-        sample = sampler.sample()
-        db_stats = repo.get_stats()
+    # Reused across frames: the renderer only reads these, so the empty
+    # placeholders and the result list are allocated once, not per frame.
+    # TODO: Implement live detection and alerts
+    no_anomalies: Dict[str, bool] = {}
+    no_alerts: List[Dict[str, Any]] = []
+    no_forecasts: Dict[str, Dict[str, float]] = {}
+    result: List[Any] = [None, no_anomalies, no_alerts, no_forecasts, None]
 
-        # TODO: Implement live detection and alerts
-        anomalies = {}
-        alerts = []
-        forecasts = {}
-
-        return sample, anomalies, alerts, forecasts, db_stats
+    def data_callback() -> List[Any]:
+        result[0] = sampler.sample()
+        result[4] = repo.get_stats()
+        return result
 
     try:
         dashboard_ui.run_live(data_callback, stop_event)
@@ -346,8 +412,19 @@ def evaluate(
     test_samples: int = typer.Option(
         20000, "--test-samples", help="Test samples"
     ),
+    persist: bool = typer.Option(
+        False,
+        "--persist/--no-persist",
+        help="Round-trip samples through the database",
+    ),
 ) -> None:
     """Run evaluation with synthetic data."""
+    from sysmon_ai.data import Repository
+    from sysmon_ai.detection import AnomalyDetector
+    from sysmon_ai.evaluation import Evaluator
+    from sysmon_ai.features import FeatureTransformer
+    from sysmon_ai.models import IsolationForestModel
+
     config = Config.load(config_path) if config_path else Config()
     if db_path:
         config.storage.db_path = db_path
@@ -360,7 +437,10 @@ def evaluate(
     console.print(f"  Output: {output_dir}")
 
     # Initialize
-    repo = Repository(config.storage.db_path)
+    repo = Repository(
+        config.storage.db_path,
+        shard_by_month=config.storage.shard_by_month,
+    )
     repo.connect()
     repo.initialize_schema()
 
@@ -381,6 +461,7 @@ def evaluate(
             n_train=train_samples,
             n_test=test_samples,
             contamination=0.05,
+            persist=persist,
         )
 
         console.print("[bold green]✓ Evaluation complete[/bold green]")
@@ -403,6 +484,9 @@ def evaluate(
 @app.command()
 def export(
     db_path: str = typer.Option("sysmon.db", "--db", help="Database path"),
+    config_path: Optional[Path] = typer.Option(
+        None, "--config", help="Config file"
+    ),
     window: str = typer.Option("24h", "--window", help="Export window"),
     output: Path = typer.Option("export.csv", "--to", help="Output file"),
     format: str = typer.Option(
@@ -410,18 +494,38 @@ def export(
     ),
 ) -> None:
     """Export samples to file."""
+    from sysmon_ai.data import Repository
+
+    config = Config.load(config_path) if config_path else Config()
+    if db_path:
+        config.storage.db_path = db_path
+
     console.print("[bold cyan]Exporting data...[/bold cyan]")
 
-    repo = Repository(db_path)
+    # Shards hold archived months, so a long window needs them attached
+    repo = Repository(
+        config.storage.db_path,
+        shard_by_month=config.storage.shard_by_month,
+    )
     repo.connect()
 
     start_ts, end_ts = get_time_range(window)
-    df = repo.read_samples(start_ts, end_ts)
+    df = repo.read_samples(start_ts, end_ts, downcast=False)
 
     if format == "csv":
-        df.to_csv(output, index=False)
+        df.to_csv(output, index=False, lineterminator="\n")
     elif format == "json":
-        df.to_json(output, orient="records", indent=2)
+        try:
+            import orjson
+        except ImportError:
+            df.to_json(output, orient="records", indent=2)
+        else:
+            output.write_bytes(
+                orjson.dumps(
+                    df.to_dict("records"),
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                )
+            )
     else:
         console.print(f"[bold red]✗ Unknown format: {format}[/bold red]")
         repo.close()
@@ -435,10 +539,24 @@ def export(
 
 
 @app.command()
-def version() -> None:
+def version(
+    verbose: bool = typer.Option(
+        False, "--verbose", "-v", help="Also show OS details"
+    ),
+) -> None:
     """Show version information."""
     console.print(f"sysmon v{__version__}")
 
+    if not verbose:
+        return
+
+    os_info = get_os_info()
+    console.print(
+        f"  OS: {os_info['system']} {os_info['release']} "
+        f"({os_info['machine']})"
+    )
+    console.print(f"  OS version: {get_os_version()}")
+
 
 if __name__ == "__main__":
     app()
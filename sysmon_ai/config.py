@@ -1,14 +1,37 @@
 """Configuration management with YAML + environment overrides."""
 
+import functools
 import os
+import platform
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
 
+# Env value classifiers, matched in order by _parse_env_value
+_BOOL_RE = re.compile(r"^(?:true|yes|1|false|no|0)$", re.IGNORECASE)
+_INT_RE = re.compile(r"^[+-]?\d+$")
+_FLOAT_RE = re.compile(
+    r"^[+-]?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][+-]?\d+)?$"
+)
+_TRUE_VALUES = frozenset(("true", "yes", "1"))
 
-@dataclass
+# libyaml-backed loader/dumper when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Environment variable -> config key path
+_ENV_MAPPING = {
+    "SYSMON_HOST": ("host",),
+    "SYSMON_DB_PATH": ("storage", "db_path"),
+    "SYSMON_SAMPLING_RATE": ("sampling", "rate_seconds"),
+    "SYSMON_LOG_LEVEL": ("logging", "level"),
+}
+
+
+@dataclass(slots=True)
 class SamplingConfig:
     """Metrics sampling configuration."""
 
@@ -17,16 +40,17 @@ class SamplingConfig:
     max_queue_size: int = 10000
 
 
-@dataclass
+@dataclass(slots=True)
 class StorageConfig:
     """Database storage configuration."""
 
     db_path: str = "sysmon.db"
     retention_days: int = 30
     wal_checkpoint_interval: int = 1000
+    shard_by_month: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class AnomalyConfig:
     """Anomaly detection configuration."""
 
@@ -38,17 +62,17 @@ class AnomalyConfig:
     target_fpr: float = 0.05
 
 
-@dataclass
+@dataclass(slots=True)
 class ForecastConfig:
     """Forecasting configuration."""
 
     horizon_hours: int = 72
     min_training_samples: int = 1000
-    algo: str = "linear"  # linear or gbr
+    algo: str = "linear"  # linear or hgb (gbr)
     confidence_level: float = 0.95
 
 
-@dataclass
+@dataclass(slots=True)
 class ThresholdConfig:
     """Alert thresholds for metrics."""
 
@@ -58,7 +82,7 @@ class ThresholdConfig:
     swap_pct: float = 80.0
 
 
-@dataclass
+@dataclass(slots=True)
 class DashboardConfig:
     """Dashboard UI configuration."""
 
@@ -68,7 +92,7 @@ class DashboardConfig:
     ascii_fallback: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class LoggingConfig:
     """Logging configuration."""
 
@@ -78,11 +102,12 @@ class LoggingConfig:
     backup_count: int = 5
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Master configuration."""
 
-    host: str = field(default_factory=lambda: os.uname().nodename)
+    # Resolved per instance; platform caches its uname() result
+    host: str = field(default_factory=platform.node)
     sampling: SamplingConfig = field(default_factory=SamplingConfig)
     storage: StorageConfig = field(default_factory=StorageConfig)
     anomaly: AnomalyConfig = field(default_factory=AnomalyConfig)
@@ -102,29 +127,17 @@ class Config:
         Returns:
             Config instance with merged values.
         """
-        config_dict: Dict[str, Any] = {}
-
         if path and path.exists():
-            with open(path, "r") as f:
-                config_dict = yaml.safe_load(f) or {}
-
-        # Environment overrides
-        env_mapping = {
-            "SYSMON_HOST": ("host",),
-            "SYSMON_DB_PATH": ("storage", "db_path"),
-            "SYSMON_SAMPLING_RATE": ("sampling", "rate_seconds"),
-            "SYSMON_LOG_LEVEL": ("logging", "level"),
-        }
+            path_key, mtime_ns = str(path), path.stat().st_mtime_ns
+        else:
+            path_key, mtime_ns = "", 0
 
-        for env_key, path_tuple in env_mapping.items():
-            if env_val := os.getenv(env_key):
-                current = config_dict
-                for key in path_tuple[:-1]:
-                    current = current.setdefault(key, {})
-                current[path_tuple[-1]] = _parse_env_value(env_val)
+        env = tuple(os.getenv(key) for key in _ENV_MAPPING)
+        config_dict = _load_config_dict(path_key, mtime_ns, env)
+        host = config_dict.get("host")
 
         return cls(
-            host=config_dict.get("host", os.uname().nodename),
+            host=platform.node() if host is None else host,
             sampling=_build_nested(
                 SamplingConfig, config_dict.get("sampling", {})
             ),
@@ -161,6 +174,7 @@ class Config:
                 "db_path": self.storage.db_path,
                 "retention_days": self.storage.retention_days,
                 "wal_checkpoint_interval": self.storage.wal_checkpoint_interval,
+                "shard_by_month": self.storage.shard_by_month,
             },
             "anomaly": {
                 "contamination": self.anomaly.contamination,
@@ -198,7 +212,47 @@ class Config:
 
         path.parent.mkdir(parents=True, exist_ok=True)
         with open(path, "w") as f:
-            yaml.safe_dump(config_dict, f, default_flow_style=False)
+            yaml.dump(
+                config_dict,
+                f,
+                Dumper=_YAML_DUMPER,
+                default_flow_style=False,
+            )
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_dict(
+    path: str, mtime_ns: int, env: Tuple[Optional[str], ...]
+) -> Dict[str, Any]:
+    """
+    Parse YAML config and apply environment overrides.
+
+    Cached on file path, modification time and the override values, so
+    repeated loads of an unchanged file skip YAML parsing. The returned
+    dict is shared between callers and must not be mutated.
+
+    Args:
+        path: Config file path, or empty string for none
+        mtime_ns: File modification time (part of the cache key)
+        env: Values of the variables in _ENV_MAPPING, in order
+
+    Returns:
+        Merged config dict
+    """
+    config_dict: Dict[str, Any] = {}
+
+    if path:
+        with open(path, "r") as f:
+            config_dict = yaml.load(f, Loader=_YAML_LOADER) or {}
+
+    for env_val, path_tuple in zip(env, _ENV_MAPPING.values()):
+        if env_val:
+            current = config_dict
+            for key in path_tuple[:-1]:
+                current = current.setdefault(key, {})
+            current[path_tuple[-1]] = _parse_env_value(env_val)
+
+    return config_dict
 
 
 def _build_nested(cls: type, data: Dict[str, Any]) -> Any:
@@ -210,16 +264,10 @@ def _build_nested(cls: type, data: Dict[str, Any]) -> Any:
 
 def _parse_env_value(value: str) -> Any:
     """Parse environment variable value to appropriate type."""
-    if value.lower() in ("true", "yes", "1"):
-        return True
-    if value.lower() in ("false", "no", "0"):
-        return False
-    try:
+    if _BOOL_RE.match(value):
+        return value.lower() in _TRUE_VALUES
+    if _INT_RE.match(value):
         return int(value)
-    except ValueError:
-        pass
-    try:
+    if _FLOAT_RE.match(value):
         return float(value)
-    except ValueError:
-        pass
     return value
@@ -1,5 +1,5 @@
 """Data layer package."""
 
-from .repository import Repository
+from .repository import SAMPLE_COLUMNS, Repository
 
-__all__ = ["Repository"]
+__all__ = ["Repository", "SAMPLE_COLUMNS"]
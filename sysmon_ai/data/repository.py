@@ -1,31 +1,260 @@
 """Repository pattern for SQLite database access."""
 
+import io
 import json
 import logging
+import re
 import sqlite3
+from contextlib import closing, contextmanager
+from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import pandas as pd
 
-from sysmon_ai.utils import now_utc_ts
+from sysmon_ai.utils import now_utc_ts, ts_to_utc
 
 logger = logging.getLogger(__name__)
 
+# Column order of positional sample rows (see write_sample_rows)
+SAMPLE_COLUMNS = (
+    "ts",
+    "host",
+    "cpu_pct",
+    "mem_pct",
+    "disk_read_bps",
+    "disk_write_bps",
+    "net_up_bps",
+    "net_down_bps",
+    "swap_pct",
+    "proc_count",
+    "cpu_temp",
+)
+
+# Rows per write transaction for bulk inserts
+_WRITE_CHUNK_ROWS = 10000
+
+# PRAGMA auto_vacuum value for INCREMENTAL mode
+_AUTO_VACUUM_INCREMENTAL = 2
+
+# Max free pages released per prune (~40MB at 4KB pages)
+_VACUUM_PAGES = 10000
+
+# Rows fetched per chunk in read_samples
+_READ_CHUNK_ROWS = 50000
+
+# Compact in-memory dtypes for sample columns
+_COMPACT_DTYPES = {
+    "ts": "int64",
+    "host": "category",
+    "cpu_pct": "float32",
+    "mem_pct": "float32",
+    "disk_read_bps": "float32",
+    "disk_write_bps": "float32",
+    "net_up_bps": "float32",
+    "net_down_bps": "float32",
+    "swap_pct": "float32",
+    "proc_count": "int32",
+    "cpu_temp": "float32",
+}
+
+# Prepared statements kept per connection (sqlite3 default is 128)
+_STATEMENT_CACHE_SIZE = 256
+
+# Schema name prefix for attached monthly sample shards (s_YYYYMM)
+_SHARD_SCHEMA_PREFIX = "s_"
+
+# SQLite's default SQLITE_MAX_ATTACHED limit
+_MAX_ATTACHED_SHARDS = 10
+
+_SHARD_SCHEMA_SQL = """
+    CREATE TABLE IF NOT EXISTS {schema}.samples (
+        ts INTEGER NOT NULL,
+        host_id INTEGER NOT NULL,
+        cpu_pct REAL NOT NULL,
+        mem_pct REAL NOT NULL,
+        disk_read_bps INTEGER NOT NULL,
+        disk_write_bps INTEGER NOT NULL,
+        net_up_bps INTEGER NOT NULL,
+        net_down_bps INTEGER NOT NULL,
+        swap_pct REAL NOT NULL,
+        proc_count INTEGER NOT NULL,
+        cpu_temp REAL
+    );
+    CREATE INDEX IF NOT EXISTS {schema}.idx_samples_ts ON samples(ts);
+    CREATE INDEX IF NOT EXISTS {schema}.idx_samples_host_ts
+        ON samples(host_id, ts);
+"""
+
+_ARCHIVE_SAMPLES_SQL = """
+    INSERT INTO {schema}.samples (
+        ts, host_id, cpu_pct, mem_pct, disk_read_bps, disk_write_bps,
+        net_up_bps, net_down_bps, swap_pct, proc_count, cpu_temp
+    )
+    SELECT ts, host_id, cpu_pct, mem_pct, disk_read_bps, disk_write_bps,
+           net_up_bps, net_down_bps, swap_pct, proc_count, cpu_temp
+    FROM main.samples
+    WHERE ts >= ? AND ts < ?
+"""
+
+_INSERT_SAMPLES_SQL = """
+    INSERT INTO samples (
+        ts, host_id, cpu_pct, mem_pct, disk_read_bps, disk_write_bps,
+        net_up_bps, net_down_bps, swap_pct, proc_count, cpu_temp
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SELECT_SAMPLES_SQL = """
+    SELECT s.ts, h.name AS host, s.cpu_pct, s.mem_pct, s.disk_read_bps,
+           s.disk_write_bps, s.net_up_bps, s.net_down_bps, s.swap_pct,
+           s.proc_count, s.cpu_temp
+    FROM samples AS s JOIN hosts AS h ON h.id = s.host_id
+    WHERE s.ts BETWEEN ? AND ?
+    ORDER BY ts ASC
+"""
+
+_SELECT_SAMPLES_HOST_SQL = """
+    SELECT s.ts, h.name AS host, s.cpu_pct, s.mem_pct, s.disk_read_bps,
+           s.disk_write_bps, s.net_up_bps, s.net_down_bps, s.swap_pct,
+           s.proc_count, s.cpu_temp
+    FROM samples AS s JOIN hosts AS h ON h.id = s.host_id
+    WHERE s.ts BETWEEN ? AND ?
+      AND s.host_id = (SELECT id FROM hosts WHERE name = ?)
+    ORDER BY ts ASC
+"""
+
+_SELECT_HOST_ID_SQL = "SELECT id FROM hosts WHERE name = ?"
+
+_INSERT_HOST_SQL = "INSERT OR IGNORE INTO hosts (name) VALUES (?)"
+
+# Version 1 databases stored the host name on every sample row. Runs
+# inside one transaction around schema.sql, which creates hosts and the
+# new samples table once the old one and its indexes are out of the way.
+_MIGRATE_HOSTS_PRE_SQL = """
+    DROP INDEX IF EXISTS idx_samples_ts;
+    DROP INDEX IF EXISTS idx_samples_host_ts;
+    ALTER TABLE samples RENAME TO samples_v1;
+"""
+
+_MIGRATE_HOSTS_POST_SQL = """
+    INSERT OR IGNORE INTO hosts (name) SELECT DISTINCT host FROM samples_v1;
+    INSERT INTO samples (
+        ts, host_id, cpu_pct, mem_pct, disk_read_bps, disk_write_bps,
+        net_up_bps, net_down_bps, swap_pct, proc_count, cpu_temp
+    )
+    SELECT v.ts, h.id, v.cpu_pct, v.mem_pct, v.disk_read_bps,
+           v.disk_write_bps, v.net_up_bps, v.net_down_bps, v.swap_pct,
+           v.proc_count, v.cpu_temp
+    FROM samples_v1 AS v JOIN hosts AS h ON h.name = v.host;
+    DROP TABLE samples_v1;
+"""
+
+_PRUNE_SAMPLES_SQL = "DELETE FROM samples WHERE ts < ?"
+
+_SAVE_MODEL_SQL = """
+    INSERT OR REPLACE INTO models
+    (name, algo, version, trained_at, meta_json, blob)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_LOAD_MODEL_SQL = """
+    SELECT algo, version, trained_at, meta_json, blob
+    FROM models WHERE name = ?
+"""
+
+_MODEL_ROWID_SQL = "SELECT rowid FROM models WHERE name = ?"
+
+_MODEL_BLOB_SQL = "SELECT blob FROM models WHERE name = ?"
+
+_INSERT_EVENT_SQL = """
+    INSERT INTO events (ts, type, score, metric_tags, explanation)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_SELECT_EVENTS_SQL = """
+    SELECT id, ts, type, score, metric_tags, explanation
+    FROM events
+    WHERE ts BETWEEN ? AND ?
+    ORDER BY ts DESC
+"""
+
+_SELECT_EVENTS_TYPE_SQL = """
+    SELECT id, ts, type, score, metric_tags, explanation
+    FROM events
+    WHERE ts BETWEEN ? AND ? AND type = ?
+    ORDER BY ts DESC
+"""
+
+_STATS_SQL = """
+    SELECT
+        (SELECT COUNT(*) FROM samples),
+        (SELECT COUNT(*) FROM models),
+        (SELECT COUNT(*) FROM events)
+"""
+
+
+class _BlobReader(io.RawIOBase):
+    """Raw stream adapter over a sqlite3.Blob, for io.BufferedReader."""
+
+    def __init__(self, blob: Any):
+        self._blob = blob
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        data = self._blob.read(len(buffer))
+        n = len(data)
+        buffer[:n] = data
+        return n
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._blob.seek(offset, whence)
+        return self.tell()
+
+    def tell(self) -> int:
+        position: int = self._blob.tell()
+        return position
+
 
 class Repository:
     """SQLite repository with WAL mode for concurrent access."""
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, shard_by_month: bool = False):
         """
         Initialize repository with database path.
 
         Args:
             db_path: Path to SQLite database file
+            shard_by_month: Keep only the current month's samples in the
+                main database and archive older months into
+                ``<stem>_YYYYMM<suffix>`` files next to it, attached on
+                connect (see archive_samples)
         """
         self.db_path = Path(db_path)
+        self.shard_by_month = shard_by_month
         self._conn: Optional[sqlite3.Connection] = None
 
+        # Host name -> hosts.id, filled lazily by _resolve_host_id
+        self._host_ids: Dict[str, int] = {}
+
+        # Attached shard schema name -> [start_ts, end_ts) of its month
+        self._shards: Dict[str, Tuple[int, int]] = {}
+
     def connect(self) -> None:
         """Establish database connection with optimized PRAGMAs."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -34,15 +263,29 @@ class Repository:
             self.db_path,
             check_same_thread=False,
             isolation_level=None,  # Autocommit mode
+            cached_statements=_STATEMENT_CACHE_SIZE,
         )
 
+        # Must precede the first write (journal_mode=WAL writes the
+        # header); a no-op on existing databases
+        self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+
         # Enable WAL mode and performance optimizations
         self._conn.execute("PRAGMA journal_mode=WAL")
         self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA journal_size_limit=67108864")  # 64MB
         self._conn.execute("PRAGMA cache_size=-64000")  # 64MB cache
         self._conn.execute("PRAGMA temp_store=MEMORY")
         self._conn.execute("PRAGMA mmap_size=268435456")  # 256MB mmap
 
+        # Upgrade version 1 databases before anything reads samples, so
+        # every command works on them, not just those that initialize
+        if self._has_host_column():
+            self.initialize_schema()
+
+        if self.shard_by_month:
+            self._attach_shards()
+
         logger.info(f"Database connected: {self.db_path}")
 
     def close(self) -> None:
@@ -50,8 +293,111 @@ class Repository:
         if self._conn:
             self._conn.close()
             self._conn = None
+            self._shards.clear()
+            self._host_ids.clear()
             logger.info("Database connection closed")
 
+    def _shard_path(self, month: str) -> Path:
+        """Return the archive file path for a YYYYMM month key."""
+        return self.db_path.with_name(
+            f"{self.db_path.stem}_{month}{self.db_path.suffix}"
+        )
+
+    def _shard_months(self) -> List[str]:
+        """Return month keys of shard files on disk, newest first."""
+        pattern = re.compile(
+            rf"{re.escape(self.db_path.stem)}_(\d{{6}})"
+            rf"{re.escape(self.db_path.suffix)}"
+        )
+        return sorted(
+            (
+                m.group(1)
+                for path in self.db_path.parent.iterdir()
+                if (m := pattern.fullmatch(path.name))
+            ),
+            reverse=True,
+        )
+
+    def _attach_shards(self) -> None:
+        """Attach existing monthly shard files, newest first."""
+        months = self._shard_months()
+
+        if len(months) > _MAX_ATTACHED_SHARDS:
+            logger.warning(
+                f"{len(months)} sample shards found; attaching the newest "
+                f"{_MAX_ATTACHED_SHARDS}"
+            )
+
+        for month in months[:_MAX_ATTACHED_SHARDS]:
+            self._attach_shard(month)
+
+    def _attach_shard(self, month: str) -> str:
+        """
+        Attach (creating if needed) the shard for a YYYYMM month key.
+
+        Args:
+            month: Month key
+
+        Returns:
+            Schema name of the attached shard
+        """
+        if not self._conn:
+            raise RuntimeError("Database not connected")
+
+        schema = f"{_SHARD_SCHEMA_PREFIX}{month}"
+        if schema in self._shards:
+            return schema
+
+        if len(self._shards) >= _MAX_ATTACHED_SHARDS:
+            oldest = min(self._shards)
+            logger.warning(f"Attach limit reached; detaching {oldest}")
+            self._detach_shard(oldest)
+
+        self._conn.execute(
+            f"ATTACH DATABASE ? AS {schema}", (str(self._shard_path(month)),)
+        )
+        self._conn.executescript(_SHARD_SCHEMA_SQL.format(schema=schema))
+        self._shards[schema] = _month_bounds(month)
+        return schema
+
+    def _detach_shard(self, schema: str) -> None:
+        """Detach an attached shard schema."""
+        if not self._conn:
+            raise RuntimeError("Database not connected")
+
+        self._conn.execute(f"DETACH DATABASE {schema}")
+        del self._shards[schema]
+
+    def _sample_query(
+        self, start_ts: int, end_ts: int, host: Optional[str]
+    ) -> Tuple[str, Tuple[Any, ...]]:
+        """Build the samples range query across main and shard tables."""
+        if host:
+            query = _SELECT_SAMPLES_HOST_SQL
+            params: Tuple[Any, ...] = (start_ts, end_ts, host)
+        else:
+            query = _SELECT_SAMPLES_SQL
+            params = (start_ts, end_ts)
+
+        schemas = [
+            schema
+            for schema, (lo, hi) in self._shards.items()
+            if lo <= end_ts and start_ts < hi
+        ]
+        if not schemas:
+            return query, params
+
+        # Same WHERE pushed into each branch so every table uses its index
+        branch, order = query.rsplit("ORDER BY", 1)
+        branches = [branch] + [
+            branch.replace("FROM samples", f"FROM {schema}.samples")
+            for schema in schemas
+        ]
+        return (
+            "UNION ALL".join(branches) + "ORDER BY" + order,
+            params * len(branches),
+        )
+
     def initialize_schema(self) -> None:
         """Initialize database schema from SQL file."""
         if not self._conn:
@@ -61,9 +407,38 @@ class Repository:
         with open(schema_path, "r") as f:
             schema_sql = f.read()
 
-        self._conn.executescript(schema_sql)
+        if self._has_host_column():
+            logger.info("Migrating samples to interned host ids...")
+            try:
+                self._conn.executescript(
+                    "BEGIN IMMEDIATE;"
+                    + _MIGRATE_HOSTS_PRE_SQL
+                    + schema_sql
+                    + _MIGRATE_HOSTS_POST_SQL
+                    + "COMMIT;"
+                )
+            except BaseException:
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+                raise
+        else:
+            self._conn.executescript(schema_sql)
+
+        # Refresh planner statistics so range queries pick the indexes
+        self._conn.execute("ANALYZE")
         logger.info("Database schema initialized")
 
+    def _has_host_column(self) -> bool:
+        """Whether samples still has the version 1 host name column."""
+        if not self._conn:
+            raise RuntimeError("Database not connected")
+
+        columns = {
+            row[1]
+            for row in self._conn.execute("PRAGMA table_info(samples)")
+        }
+        return "host" in columns
+
     def write_samples(self, samples: List[Dict[str, Any]]) -> int:
         """
         Batch insert metric samples.
@@ -80,17 +455,11 @@ class Repository:
         if not samples:
             return 0
 
-        insert_sql = """
-            INSERT INTO samples (
-                ts, host, cpu_pct, mem_pct, disk_read_bps, disk_write_bps,
-                net_up_bps, net_down_bps, swap_pct, proc_count, cpu_temp
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-
-        rows = [
+        resolve = self._resolve_host_id
+        rows = (
             (
                 s["ts"],
-                s["host"],
+                resolve(s["host"]),
                 s["cpu_pct"],
                 s["mem_pct"],
                 s["disk_read_bps"],
@@ -102,26 +471,198 @@ class Repository:
                 s.get("cpu_temp"),
             )
             for s in samples
+        )
+
+        return self._insert_sample_rows(rows)
+
+    def write_samples_df(self, df: pd.DataFrame) -> int:
+        """
+        Batch insert metric samples from a DataFrame.
+
+        Each column is converted to Python scalars in one tolist() call
+        and the columns are zipped into row tuples, avoiding the per-row
+        dict construction of to_dict("records"). Hosts are resolved once
+        per distinct name. A missing cpu_temp column is written as NULL.
+
+        Args:
+            df: DataFrame with SAMPLE_COLUMNS columns
+
+        Returns:
+            Number of rows inserted
+        """
+        if not self._conn:
+            raise RuntimeError("Database not connected")
+
+        if df.empty:
+            return 0
+
+        n = len(df)
+        columns = [
+            df[col].tolist() if col in df.columns else [None] * n
+            for col in SAMPLE_COLUMNS
         ]
 
-        cursor = self._conn.executemany(insert_sql, rows)
-        count = cursor.rowcount
+        codes, names = pd.factorize(df["host"])
+        host_ids = [self._resolve_host_id(name) for name in names]
+        columns[1] = [host_ids[code] for code in codes.tolist()]
+
+        return self._insert_sample_rows(zip(*columns))
+
+    def write_samples_columnar(self, columns: Dict[str, Sequence[Any]]) -> int:
+        """
+        Batch insert metric samples given as one sequence per column.
+
+        The columns are zipped straight into row tuples, so no per-row
+        dict is hashed. A missing cpu_temp column is written as NULL.
+
+        Args:
+            columns: Column name to equal-length values, keyed by
+                SAMPLE_COLUMNS
+
+        Returns:
+            Number of rows inserted
+        """
+        if not self._conn:
+            raise RuntimeError("Database not connected")
+
+        hosts = columns["host"]
+        if not hosts:
+            return 0
+
+        n = len(hosts)
+        values = [
+            columns[col] if col in columns else [None] * n
+            for col in SAMPLE_COLUMNS
+        ]
+        resolve = self._resolve_host_id
+        values[1] = [resolve(host) for host in hosts]
+
+        return self._insert_sample_rows(zip(*values))
+
+    def write_sample_rows(self, rows: Iterable[Tuple[Any, ...]]) -> int:
+        """
+        Batch insert metric samples given as positional tuples.
+
+        Rows are consumed lazily, so a generator (e.g. from
+        DataFrame.itertuples) is inserted without materializing a list.
+
+        Args:
+            rows: Tuples of values in SAMPLE_COLUMNS order
+
+        Returns:
+            Number of rows inserted
+        """
+        if not self._conn:
+            raise RuntimeError("Database not connected")
+
+        resolve = self._resolve_host_id
+        return self._insert_sample_rows(
+            (row[0], resolve(row[1]), *row[2:]) for row in rows
+        )
+
+    def _insert_sample_rows(self, rows: Iterable[Tuple[Any, ...]]) -> int:
+        """
+        Insert sample rows whose host is already a hosts.id.
+
+        Args:
+            rows: Tuples in SAMPLE_COLUMNS order with host_id for host
+
+        Returns:
+            Number of rows inserted
+        """
+        count = self._executemany_chunked(_INSERT_SAMPLES_SQL, rows)
         logger.debug(f"Inserted {count} samples")
         return count
 
+    def _resolve_host_id(self, host: str) -> int:
+        """
+        Return the hosts.id for a host name, inserting it if new.
+
+        Args:
+            host: Host name
+
+        Returns:
+            Host id
+        """
+        host_id = self._host_ids.get(host)
+        if host_id is not None:
+            return host_id
+
+        if not self._conn:
+            raise RuntimeError("Database not connected")
+
+        self._conn.execute(_INSERT_HOST_SQL, (host,))
+        row = self._conn.execute(_SELECT_HOST_ID_SQL, (host,)).fetchone()
+        new_id: int = row[0]
+
+        # Outside a transaction the host row is committed (bulk writers
+        # resolve hosts before each chunk's BEGIN). Inside a caller's
+        # transaction a later ROLLBACK would remove it, so leave the id
+        # uncached rather than hand out a dangling host_id afterwards.
+        if not self._conn.in_transaction:
+            self._host_ids[host] = new_id
+        return new_id
+
+    def _executemany_chunked(
+        self, sql: str, rows: Iterable[Tuple[Any, ...]]
+    ) -> int:
+        """
+        Run executemany in explicit transactions of bounded size.
+
+        In autocommit mode every executemany call is its own implicit
+        transaction; wrapping each chunk in BEGIN IMMEDIATE/COMMIT keeps
+        one commit per chunk while bounding the dirty page set. If the
+        caller already holds a transaction, rows are inserted into it
+        without committing.
+
+        Args:
+            sql: Parameterized statement
+            rows: Parameter tuples
+
+        Returns:
+            Number of rows affected
+        """
+        if not self._conn:
+            raise RuntimeError("Database not connected")
+
+        if self._conn.in_transaction:
+            return self._conn.executemany(sql, rows).rowcount
+
+        it = iter(rows)
+        count = 0
+        while chunk := list(islice(it, _WRITE_CHUNK_ROWS)):
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = self._conn.executemany(sql, chunk)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+                raise
+            count += cursor.rowcount
+
+        return count
+
     def read_samples(
         self,
         start_ts: int,
         end_ts: int,
         host: Optional[str] = None,
+        downcast: bool = True,
     ) -> pd.DataFrame:
         """
         Read samples in time range.
 
+        Rows are fetched in chunks so the full result never exists as
+        Python row objects at once.
+
         Args:
             start_ts: Start timestamp (inclusive)
             end_ts: End timestamp (inclusive)
             host: Optional host filter
+            downcast: Store metric columns as float32/int32 and host as
+                category. Disable when exact float64 values are needed
+                (e.g. exports).
 
         Returns:
             DataFrame with samples
@@ -129,21 +670,24 @@ class Repository:
         if not self._conn:
             raise RuntimeError("Database not connected")
 
-        query = """
-            SELECT ts, host, cpu_pct, mem_pct, disk_read_bps, disk_write_bps,
-                   net_up_bps, net_down_bps, swap_pct, proc_count, cpu_temp
-            FROM samples
-            WHERE ts BETWEEN ? AND ?
-        """
-        params: Tuple[Any, ...] = (start_ts, end_ts)
+        query, params = self._sample_query(start_ts, end_ts, host)
 
-        if host:
-            query += " AND host = ?"
-            params = (start_ts, end_ts, host)
+        chunks = list(
+            pd.read_sql_query(
+                query,
+                self._conn,
+                params=params,
+                chunksize=_READ_CHUNK_ROWS,
+            )
+        )
+        if chunks:
+            df = pd.concat(chunks, ignore_index=True)
+        else:
+            df = pd.DataFrame(columns=list(SAMPLE_COLUMNS))
 
-        query += " ORDER BY ts ASC"
+        if downcast:
+            df = df.astype(_COMPACT_DTYPES)
 
-        df = pd.read_sql_query(query, self._conn, params=params)
         logger.debug(f"Read {len(df)} samples from {start_ts} to {end_ts}")
         return df
 
@@ -171,11 +715,7 @@ class Repository:
         meta_json = json.dumps(meta) if meta else None
 
         self._conn.execute(
-            """
-            INSERT OR REPLACE INTO models
-            (name, algo, version, trained_at, meta_json, blob)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
+            _SAVE_MODEL_SQL,
             (name, algo, version, now_utc_ts(), meta_json, blob),
         )
         logger.info(
@@ -195,13 +735,7 @@ class Repository:
         if not self._conn:
             raise RuntimeError("Database not connected")
 
-        cursor = self._conn.execute(
-            """
-            SELECT algo, version, trained_at, meta_json, blob
-            FROM models WHERE name = ?
-            """,
-            (name,),
-        )
+        cursor = self._conn.execute(_LOAD_MODEL_SQL, (name,))
         row = cursor.fetchone()
 
         if not row:
@@ -218,6 +752,41 @@ class Repository:
             "blob": blob,
         }
 
+    @contextmanager
+    def open_model_blob(self, name: str) -> Iterator[Optional[BinaryIO]]:
+        """
+        Open a stored model blob as a read-only binary stream.
+
+        Uses SQLite incremental blob I/O where available (Python 3.11+),
+        so the blob is read in buffered chunks rather than copied into
+        one bytes object; older Pythons fall back to an in-memory stream.
+
+        Args:
+            name: Model name/identifier
+
+        Yields:
+            Seekable binary file object, or None if no such model
+        """
+        if not self._conn:
+            raise RuntimeError("Database not connected")
+
+        row = self._conn.execute(_MODEL_ROWID_SQL, (name,)).fetchone()
+        if not row:
+            yield None
+            return
+
+        if not hasattr(self._conn, "blobopen"):
+            (blob,) = self._conn.execute(
+                _MODEL_BLOB_SQL, (name,)
+            ).fetchone()
+            yield io.BytesIO(blob)
+            return
+
+        with self._conn.blobopen(
+            "models", "blob", row[0], readonly=True
+        ) as blob:
+            yield io.BufferedReader(_BlobReader(blob))
+
     def write_event(
         self,
         event_type: str,
@@ -241,16 +810,50 @@ class Repository:
             raise RuntimeError("Database not connected")
 
         cursor = self._conn.execute(
-            """
-            INSERT INTO events (ts, type, score, metric_tags, explanation)
-            VALUES (?, ?, ?, ?, ?)
-            """,
+            _INSERT_EVENT_SQL,
             (now_utc_ts(), event_type, score, metric_tags, explanation),
         )
         event_id = cursor.lastrowid
         logger.info(f"Event written: {event_type} (id={event_id})")
         return event_id
 
+    def write_events_bulk(
+        self,
+        events: Iterable[Dict[str, Any]],
+        event_type: str = "anomaly",
+    ) -> int:
+        """
+        Write many events in one transaction.
+
+        Like write_event, each row is stamped with the current time.
+
+        Args:
+            events: Event dicts with optional score, metric_tags and
+                explanation keys (e.g. from extract_anomalies)
+            event_type: Event type for all rows
+
+        Returns:
+            Number of events written
+        """
+        if not self._conn:
+            raise RuntimeError("Database not connected")
+
+        ts = now_utc_ts()
+        rows = (
+            (
+                ts,
+                event_type,
+                e.get("score"),
+                e.get("metric_tags"),
+                e.get("explanation"),
+            )
+            for e in events
+        )
+
+        count = self._executemany_chunked(_INSERT_EVENT_SQL, rows)
+        logger.info(f"Events written: {event_type} (count={count})")
+        return count
+
     def read_events(
         self,
         start_ts: int,
@@ -271,18 +874,12 @@ class Repository:
         if not self._conn:
             raise RuntimeError("Database not connected")
 
-        query = """
-            SELECT id, ts, type, score, metric_tags, explanation
-            FROM events
-            WHERE ts BETWEEN ? AND ?
-        """
-        params: Tuple[Any, ...] = (start_ts, end_ts)
-
         if event_type:
-            query += " AND type = ?"
-            params = (start_ts, end_ts, event_type)
-
-        query += " ORDER BY ts DESC"
+            query = _SELECT_EVENTS_TYPE_SQL
+            params: Tuple[Any, ...] = (start_ts, end_ts, event_type)
+        else:
+            query = _SELECT_EVENTS_SQL
+            params = (start_ts, end_ts)
 
         cursor = self._conn.execute(query, params)
         events = [
@@ -299,10 +896,78 @@ class Repository:
 
         return events
 
+    def archive_samples(self) -> int:
+        """
+        Move samples from before the current month into monthly shards.
+
+        Only active with shard_by_month. Each month is copied and deleted
+        in one transaction; SQLite commits attached WAL databases
+        separately, so a crash can at worst leave a month duplicated in
+        both files, never lost.
+
+        Returns:
+            Number of rows moved
+        """
+        if not self._conn:
+            raise RuntimeError("Database not connected")
+
+        if not self.shard_by_month:
+            return 0
+
+        current_start = _month_bounds(_month_key(now_utc_ts()))[0]
+        moved = 0
+
+        while True:
+            (oldest,) = self._conn.execute(
+                "SELECT MIN(ts) FROM main.samples WHERE ts < ?",
+                (current_start,),
+            ).fetchone()
+            if oldest is None:
+                break
+
+            schema = self._attach_shard(_month_key(oldest))
+            bounds = self._shards[schema]
+
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    _ARCHIVE_SAMPLES_SQL.format(schema=schema), bounds
+                )
+                cursor = self._conn.execute(
+                    "DELETE FROM main.samples WHERE ts >= ? AND ts < ?",
+                    bounds,
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+                raise
+            moved += cursor.rowcount
+
+        if moved > 0:
+            self._release_free_pages()
+            logger.info(f"Archived {moved} samples into monthly shards")
+
+        return moved
+
+    def next_archive_ts(self) -> Optional[int]:
+        """
+        Return when archive_samples next has a finished month to move.
+
+        Returns:
+            Start of the next UTC month with shard_by_month, else None
+        """
+        if not self.shard_by_month:
+            return None
+        return _month_bounds(_month_key(now_utc_ts()))[1]
+
     def prune_old_samples(self, retention_days: int) -> int:
         """
         Delete samples older than retention period.
 
+        With shard_by_month, samples are archived first and shards whose
+        whole month is past the cutoff are removed by deleting the file.
+
         Args:
             retention_days: Number of days to retain
 
@@ -314,19 +979,74 @@ class Repository:
 
         cutoff_ts = now_utc_ts() - (retention_days * 86400)
 
-        cursor = self._conn.execute(
-            "DELETE FROM samples WHERE ts < ?", (cutoff_ts,)
-        )
-        deleted = cursor.rowcount
+        deleted = 0
+        if self.shard_by_month:
+            self.archive_samples()
+            deleted += self._drop_expired_shards(cutoff_ts)
+
+        cursor = self._conn.execute(_PRUNE_SAMPLES_SQL, (cutoff_ts,))
+        if cursor.rowcount > 0:
+            self._release_free_pages()
+        deleted += cursor.rowcount
 
         if deleted > 0:
-            self._conn.execute("VACUUM")
             logger.info(
                 f"Pruned {deleted} old samples (retention={retention_days}d)"
             )
 
         return deleted
 
+    def _drop_expired_shards(self, cutoff_ts: int) -> int:
+        """
+        Delete shard files whose month ends at or before the cutoff.
+
+        Args:
+            cutoff_ts: Retention cutoff timestamp
+
+        Returns:
+            Number of rows in the deleted shards
+        """
+        deleted = 0
+        for month in self._shard_months():
+            if _month_bounds(month)[1] > cutoff_ts:
+                continue
+
+            schema = f"{_SHARD_SCHEMA_PREFIX}{month}"
+            if schema in self._shards:
+                self._detach_shard(schema)
+
+            path = self._shard_path(month)
+            with closing(sqlite3.connect(path)) as shard:
+                (count,) = shard.execute(
+                    "SELECT COUNT(*) FROM samples"
+                ).fetchone()
+
+            path.unlink()
+            for suffix in ("-wal", "-shm"):
+                Path(f"{path}{suffix}").unlink(missing_ok=True)
+
+            deleted += count
+            logger.info(f"Removed expired sample shard {path.name}")
+
+        return deleted
+
+    def _release_free_pages(self) -> None:
+        """Return pages freed by bulk deletes to the filesystem."""
+        if not self._conn:
+            raise RuntimeError("Database not connected")
+
+        (auto_vacuum,) = self._conn.execute("PRAGMA auto_vacuum").fetchone()
+        if auto_vacuum == _AUTO_VACUUM_INCREMENTAL:
+            # Release freed pages without rewriting the whole file.
+            # The pragma frees one page per VM step and execute()
+            # steps only once, so run it through executescript.
+            self._conn.executescript(
+                f"PRAGMA incremental_vacuum({_VACUUM_PAGES});"
+            )
+        else:
+            # Databases created before incremental auto_vacuum
+            self._conn.execute("VACUUM")
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Get database statistics.
@@ -337,14 +1057,9 @@ class Repository:
         if not self._conn:
             raise RuntimeError("Database not connected")
 
-        cursor = self._conn.execute("SELECT COUNT(*) FROM samples")
-        sample_count = cursor.fetchone()[0]
-
-        cursor = self._conn.execute("SELECT COUNT(*) FROM models")
-        model_count = cursor.fetchone()[0]
-
-        cursor = self._conn.execute("SELECT COUNT(*) FROM events")
-        event_count = cursor.fetchone()[0]
+        sample_count, model_count, event_count = self._conn.execute(
+            _STATS_SQL
+        ).fetchone()
 
         db_size = self.db_path.stat().st_size if self.db_path.exists() else 0
 
@@ -354,3 +1069,19 @@ class Repository:
             "event_count": event_count,
             "db_size_mb": db_size / (1024 * 1024),
         }
+
+
+def _month_key(ts: int) -> str:
+    """Return the UTC YYYYMM month key for a timestamp."""
+    return ts_to_utc(ts).strftime("%Y%m")
+
+
+def _month_bounds(month: str) -> Tuple[int, int]:
+    """Return the [start_ts, end_ts) UTC range of a YYYYMM month key."""
+    year, mon = int(month[:4]), int(month[4:])
+    start = datetime(year, mon, 1, tzinfo=timezone.utc)
+    if mon == 12:
+        end = datetime(year + 1, 1, 1, tzinfo=timezone.utc)
+    else:
+        end = datetime(year, mon + 1, 1, tzinfo=timezone.utc)
+    return int(start.timestamp()), int(end.timestamp())
@@ -1,23 +1,30 @@
 -- SQLite schema for system monitoring
--- Version: 1.0
+-- Version: 2.0
+
+-- Hosts table: interns host names referenced by samples
+CREATE TABLE IF NOT EXISTS hosts (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
 
 -- Samples table: stores time-series metrics
 CREATE TABLE IF NOT EXISTS samples (
     ts INTEGER NOT NULL,
-    host TEXT NOT NULL,
+    host_id INTEGER NOT NULL REFERENCES hosts(id),
     cpu_pct REAL NOT NULL,
     mem_pct REAL NOT NULL,
-    disk_read_bps REAL NOT NULL,
-    disk_write_bps REAL NOT NULL,
-    net_up_bps REAL NOT NULL,
-    net_down_bps REAL NOT NULL,
+    -- I/O rates are whole bytes/s; INTEGER packs them in 1-6 bytes
+    disk_read_bps INTEGER NOT NULL,
+    disk_write_bps INTEGER NOT NULL,
+    net_up_bps INTEGER NOT NULL,
+    net_down_bps INTEGER NOT NULL,
     swap_pct REAL NOT NULL,
     proc_count INTEGER NOT NULL,
     cpu_temp REAL
 );
 
 CREATE INDEX IF NOT EXISTS idx_samples_ts ON samples(ts);
-CREATE INDEX IF NOT EXISTS idx_samples_host_ts ON samples(host, ts);
+CREATE INDEX IF NOT EXISTS idx_samples_host_ts ON samples(host_id, ts);
 
 -- Models table: stores serialized ML models
 CREATE TABLE IF NOT EXISTS models (
@@ -40,7 +47,9 @@ CREATE TABLE IF NOT EXISTS events (
 );
 
 CREATE INDEX IF NOT EXISTS idx_events_ts ON events(ts);
-CREATE INDEX IF NOT EXISTS idx_events_type ON events(type);
+CREATE INDEX IF NOT EXISTS idx_events_type_ts ON events(type, ts);
+-- Superseded by idx_events_type_ts (same leading column)
+DROP INDEX IF EXISTS idx_events_type;
 
 -- Schema version tracking
 CREATE TABLE IF NOT EXISTS schema_version (
@@ -49,3 +58,4 @@ CREATE TABLE IF NOT EXISTS schema_version (
 );
 
 INSERT OR IGNORE INTO schema_version (version, applied_at) VALUES (1, strftime('%s', 'now'));
+INSERT OR IGNORE INTO schema_version (version, applied_at) VALUES (2, strftime('%s', 'now'));
@@ -2,6 +2,7 @@
 
 from .calibrator import (
     compute_fpr_tpr,
+    compute_fpr_tpr_sweep,
     compute_precision_recall,
     find_threshold_for_fpr,
 )
@@ -14,5 +15,6 @@ __all__ = [
     "ForecastEvent",
     "find_threshold_for_fpr",
     "compute_fpr_tpr",
+    "compute_fpr_tpr_sweep",
     "compute_precision_recall",
 ]
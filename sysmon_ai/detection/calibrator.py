@@ -5,26 +5,33 @@ from typing import Tuple
 
 import numpy as np
 
+from sysmon_ai.utils.stats import quantile
+
 logger = logging.getLogger(__name__)
 
 
 def find_threshold_for_fpr(
     scores: np.ndarray,
     target_fpr: float,
+    *,
+    presorted: bool = False,
 ) -> float:
     """
     Find score threshold that achieves target false positive rate.
 
+    When sweeping several target rates, sort once with np.sort and pass
+    presorted=True so each lookup is a direct index instead of a
+    selection pass.
+
     Args:
         scores: Anomaly scores (lower = more anomalous)
         target_fpr: Target false positive rate (0-1)
+        presorted: Whether scores are already sorted ascending
 
     Returns:
         Threshold value
     """
-    percentile = target_fpr * 100
-    threshold = np.percentile(scores, percentile)
-    return float(threshold)
+    return quantile(scores, target_fpr, presorted=presorted)
 
 
 def compute_fpr_tpr(
@@ -43,12 +50,7 @@ def compute_fpr_tpr(
     Returns:
         Tuple of (fpr, tpr)
     """
-    predictions = (scores < threshold).astype(int)
-
-    tp = np.sum((predictions == 1) & (labels == 1))
-    fp = np.sum((predictions == 1) & (labels == 0))
-    tn = np.sum((predictions == 0) & (labels == 0))
-    fn = np.sum((predictions == 0) & (labels == 1))
+    tp, fp, fn, tn = _confusion(scores, labels, threshold)
 
     fpr = fp / (fp + tn) if (fp + tn) > 0 else 0.0
     tpr = tp / (tp + fn) if (tp + fn) > 0 else 0.0
@@ -56,6 +58,51 @@ def compute_fpr_tpr(
     return fpr, tpr
 
 
+def compute_fpr_tpr_sweep(
+    scores: np.ndarray,
+    labels: np.ndarray,
+    thresholds: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute FPR and TPR for many thresholds at once.
+
+    Sorts scores once and reads the confusion counts for every threshold
+    from cumulative label sums, instead of rescanning the data per
+    threshold as repeated compute_fpr_tpr calls would.
+
+    Args:
+        scores: Anomaly scores
+        labels: True labels (1=anomaly, 0=normal)
+        thresholds: Detection thresholds
+
+    Returns:
+        Tuple of (fpr, tpr) arrays aligned with thresholds
+    """
+    scores = np.asarray(scores, dtype=np.float64).ravel()
+    actual = np.asarray(labels).ravel() == 1
+
+    order = np.argsort(scores, kind="stable")
+    sorted_scores = scores[order]
+    cum_pos = np.concatenate(([0], np.cumsum(actual[order])))
+
+    # Predictions are scores < threshold, i.e. the first k sorted scores
+    pred_pos = np.searchsorted(
+        sorted_scores,
+        np.asarray(thresholds, dtype=np.float64),
+        side="left",
+    )
+    tp = cum_pos[pred_pos]
+    fp = pred_pos - tp
+
+    actual_pos = int(cum_pos[-1])
+    actual_neg = scores.size - actual_pos
+
+    fpr = fp / actual_neg if actual_neg > 0 else np.zeros(len(fp))
+    tpr = tp / actual_pos if actual_pos > 0 else np.zeros(len(tp))
+
+    return fpr, tpr
+
+
 def compute_precision_recall(
     scores: np.ndarray,
     labels: np.ndarray,
@@ -72,13 +119,42 @@ def compute_precision_recall(
     Returns:
         Tuple of (precision, recall)
     """
-    predictions = (scores < threshold).astype(int)
-
-    tp = np.sum((predictions == 1) & (labels == 1))
-    fp = np.sum((predictions == 1) & (labels == 0))
-    fn = np.sum((predictions == 0) & (labels == 1))
+    tp, fp, fn, _ = _confusion(scores, labels, threshold)
 
     precision = tp / (tp + fp) if (tp + fp) > 0 else 0.0
     recall = tp / (tp + fn) if (tp + fn) > 0 else 0.0
 
     return precision, recall
+
+
+def _confusion(
+    scores: np.ndarray,
+    labels: np.ndarray,
+    threshold: float,
+) -> Tuple[int, int, int, int]:
+    """
+    Compute confusion matrix counts at threshold.
+
+    Only the positive-prediction, positive-label and true-positive
+    counts are taken from the data; the rest follow arithmetically.
+
+    Args:
+        scores: Anomaly scores
+        labels: True labels (1=anomaly, 0=normal)
+        threshold: Detection threshold
+
+    Returns:
+        Tuple of (tp, fp, fn, tn)
+    """
+    predictions = np.asarray(scores) < threshold
+    actual = np.asarray(labels) == 1
+
+    pred_pos = int(np.count_nonzero(predictions))
+    actual_pos = int(np.count_nonzero(actual))
+    tp = int(np.count_nonzero(predictions & actual))
+
+    fp = pred_pos - tp
+    fn = actual_pos - tp
+    tn = len(actual) - pred_pos - fn
+
+    return tp, fp, fn, tn
@@ -16,6 +16,34 @@ from sysmon_ai.models import (
 
 logger = logging.getLogger(__name__)
 
+# Metrics inspected when tagging/explaining anomalies
+_PCT_COLUMNS = ("cpu_pct", "mem_pct")
+_BPS_COLUMNS = (
+    "disk_read_bps",
+    "disk_write_bps",
+    "net_up_bps",
+    "net_down_bps",
+)
+_EXPLAIN_COLUMNS = _PCT_COLUMNS + _BPS_COLUMNS
+
+# Per-column limits above which a metric is flagged (> 80%, > 10MB/s)
+_FLAG_LIMITS = np.array(
+    [80.0] * len(_PCT_COLUMNS) + [1e7] * len(_BPS_COLUMNS)
+)
+
+
+def _tags_for_flags(flags: int) -> str:
+    """Tag string for a metric flag bitmask (see _FLAG_LIMITS)."""
+    # Simple heuristic: flag high percentage metrics, else very high I/O
+    hot = [c for i, c in enumerate(_EXPLAIN_COLUMNS) if flags >> i & 1]
+    pct = [c for c in hot if c in _PCT_COLUMNS]
+    return ",".join(pct or hot) or "general"
+
+
+_TAGS_BY_FLAGS = tuple(
+    _tags_for_flags(flags) for flags in range(1 << len(_EXPLAIN_COLUMNS))
+)
+
 
 class AnomalyDetector:
     """
@@ -74,6 +102,30 @@ class AnomalyDetector:
 
         logger.info(f"Loaded {len(df)} samples for training")
 
+        return self.train_from_df(df, val_split)
+
+    def train_from_df(
+        self,
+        df: pd.DataFrame,
+        val_split: float = 0.2,
+    ) -> Dict[str, Any]:
+        """
+        Train anomaly detection model on an in-memory sample frame.
+
+        Same as ``train`` but skips the repository read, so callers that
+        already hold the samples (e.g. the evaluator) avoid a SQLite round
+        trip.
+
+        Args:
+            df: Samples DataFrame in ``read_samples`` layout
+            val_split: Validation split ratio for calibration
+
+        Returns:
+            Training metrics dict
+        """
+        if df.empty:
+            raise ValueError("No training data available")
+
         # Split train/val
         split_idx = int(len(df) * (1 - val_split))
         train_df = df.iloc[:split_idx]
@@ -125,15 +177,32 @@ class AnomalyDetector:
         # Load data
         df = self.repository.read_samples(start_ts, end_ts, host)
 
+        return self.detect_from_df(df)
+
+    def detect_from_df(
+        self, df: pd.DataFrame
+    ) -> Tuple[pd.DataFrame, np.ndarray, np.ndarray]:
+        """
+        Run anomaly detection on an in-memory sample frame.
+
+        Args:
+            df: Samples DataFrame in ``read_samples`` layout
+
+        Returns:
+            Tuple of (samples_df, scores, is_anomaly)
+        """
+        if not self.model.is_fitted():
+            raise RuntimeError("Model not trained")
+
         if df.empty:
             return df, np.array([]), np.array([])
 
         # Transform
         X = self.feature_transformer.transform(df)
 
-        # Score
+        # Score once and threshold the scores
         scores = self.model.score_samples(X)
-        is_anomaly = self.model.predict_with_threshold(X)
+        is_anomaly = self.model.apply_threshold(scores)
 
         return df, scores, is_anomaly
 
@@ -153,9 +222,10 @@ class AnomalyDetector:
         if not self.model.is_fitted():
             raise RuntimeError("Model not trained")
 
-        X = self.feature_transformer.transform(df)
+        # The features are scored right away, so reuse one buffer per tick
+        X = self.feature_transformer.transform(df, reuse_buffer=True)
         scores = self.model.score_samples(X)
-        is_anomaly = self.model.predict_with_threshold(X)
+        is_anomaly = self.model.apply_threshold(scores)
 
         return scores, is_anomaly
 
@@ -176,65 +246,57 @@ class AnomalyDetector:
         Returns:
             List of anomaly event dicts
         """
-        anomalies = []
+        idx = np.flatnonzero(is_anomaly)
+        if idx.size == 0:
+            return []
+
+        rows = df.iloc[idx]
+        values = rows[list(_EXPLAIN_COLUMNS)].to_numpy(dtype=np.float64)
 
-        for idx in np.where(is_anomaly)[0]:
-            sample = df.iloc[idx]
-            score = scores[idx]
-
-            # Find most anomalous metrics
-            metric_values = {
-                "cpu_pct": sample["cpu_pct"],
-                "mem_pct": sample["mem_pct"],
-                "disk_read_bps": sample["disk_read_bps"],
-                "disk_write_bps": sample["disk_write_bps"],
-                "net_up_bps": sample["net_up_bps"],
-                "net_down_bps": sample["net_down_bps"],
-            }
-
-            # Simple heuristic: flag high percentage metrics
-            flagged_metrics = [
-                k for k, v in metric_values.items() if "pct" in k and v > 80
-            ]
-
-            if not flagged_metrics:
-                # Flag I/O metrics if very high
-                flagged_metrics = [
-                    k
-                    for k, v in metric_values.items()
-                    if "bps" in k and v > 10**7  # > 10MB/s
-                ]
+        # One bit per metric (bit i = column i over its limit), decoded
+        # through a precomputed table of all 64 tag strings
+        flags = np.packbits(
+            values > _FLAG_LIMITS, axis=1, bitorder="little"
+        )[:, 0]
 
+        anomalies = []
+        for ts, score, row, flag in zip(
+            rows["ts"].tolist(),
+            scores[idx].tolist(),
+            values.tolist(),
+            flags.tolist(),
+        ):
             anomalies.append(
                 {
-                    "ts": int(sample["ts"]),
-                    "score": float(score),
-                    "metric_tags": (
-                        ",".join(flagged_metrics)
-                        if flagged_metrics
-                        else "general"
-                    ),
-                    "explanation": self._explain_anomaly(sample, score),
+                    "ts": int(ts),
+                    "score": score,
+                    "metric_tags": _TAGS_BY_FLAGS[flag],
+                    "explanation": self._explain_anomaly(row, score),
                 }
             )
 
         return anomalies
 
-    def _explain_anomaly(self, sample: pd.Series, score: float) -> str:
-        """Generate human-readable explanation."""
+    def _explain_anomaly(self, row: List[float], score: float) -> str:
+        """
+        Generate human-readable explanation.
+
+        Args:
+            row: Metric values in _EXPLAIN_COLUMNS order
+            score: Anomaly score
+        """
+        cpu_pct, mem_pct, _, disk_write_bps, _, net_down_bps = row
         parts = []
 
-        if sample["cpu_pct"] > 80:
-            parts.append(f"high CPU ({sample['cpu_pct']:.1f}%)")
-        if sample["mem_pct"] > 80:
-            parts.append(f"high memory ({sample['mem_pct']:.1f}%)")
-        if sample["disk_write_bps"] > 10**7:
-            parts.append(
-                f"high disk write ({sample['disk_write_bps']/1e6:.1f} MB/s)"
-            )
-        if sample["net_down_bps"] > 10**7:
+        if cpu_pct > 80:
+            parts.append(f"high CPU ({cpu_pct:.1f}%)")
+        if mem_pct > 80:
+            parts.append(f"high memory ({mem_pct:.1f}%)")
+        if disk_write_bps > 10**7:
+            parts.append(f"high disk write ({disk_write_bps/1e6:.1f} MB/s)")
+        if net_down_bps > 10**7:
             parts.append(
-                f"high network download ({sample['net_down_bps']/1e6:.1f} MB/s)"
+                f"high network download ({net_down_bps/1e6:.1f} MB/s)"
             )
 
         if parts:
@@ -275,19 +337,17 @@ class AnomalyDetector:
             True if loaded successfully
         """
         # Load model
-        model_data = self.repository.load_model("isolation_forest")
-        if not model_data:
-            return False
-
-        self.model = deserialize_model(model_data["blob"])
+        with self.repository.open_model_blob("isolation_forest") as blob:
+            if blob is None:
+                return False
+            self.model = deserialize_model(blob)
         logger.info("Loaded isolation forest model")
 
         # Load transformer
-        transformer_data = self.repository.load_model("feature_transformer")
-        if not transformer_data:
-            return False
-
-        self.feature_transformer = deserialize_model(transformer_data["blob"])
+        with self.repository.open_model_blob("feature_transformer") as blob:
+            if blob is None:
+                return False
+            self.feature_transformer = deserialize_model(blob)
         logger.info("Loaded feature transformer")
 
         return True
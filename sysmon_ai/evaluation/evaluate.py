@@ -3,13 +3,13 @@
 import json
 import logging
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
-import matplotlib
-import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
 
-from sysmon_ai.data import Repository
+from sysmon_ai.data import SAMPLE_COLUMNS, Repository
 from sysmon_ai.detection import AnomalyDetector
 from sysmon_ai.evaluation.metrics import (
     compute_classification_metrics,
@@ -19,10 +19,10 @@ from sysmon_ai.evaluation.metrics import (
 )
 from sysmon_ai.evaluation.simulate import SyntheticDataGenerator
 
-matplotlib.use("Agg")  # Non-interactive backend
-
 logger = logging.getLogger(__name__)
 
+_PLOT_DPI = 100
+
 
 class Evaluator:
     """
@@ -50,11 +50,17 @@ class Evaluator:
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # One figure reused by all plots; Figure renders through Agg
+        # directly, without pyplot's global figure manager
+        self._fig: Optional[Figure] = None
+        self._ax: Optional[Axes] = None
+
     def run_evaluation(
         self,
         n_train: int = 100000,
         n_test: int = 20000,
         contamination: float = 0.05,
+        persist: bool = False,
     ) -> Dict[str, Any]:
         """
         Run full evaluation pipeline.
@@ -63,6 +69,8 @@ class Evaluator:
             n_train: Number of training samples
             n_test: Number of test samples
             contamination: Anomaly contamination rate
+            persist: Write synthetic samples to the repository and run the
+                detector through it instead of on the in-memory frames
 
         Returns:
             Evaluation results dict
@@ -72,13 +80,17 @@ class Evaluator:
         # Generate synthetic data
         generator = SyntheticDataGenerator()
 
+        # One contiguous batch for both splits; the memory trend restarts
+        # at the split and the test slice is reindexed from zero for
+        # anomaly injection
         start_ts = 1000000000
-        train_df = generator.generate_baseline(n_train, start_ts, interval=1)
+        full_df = generator.generate_baseline(
+            n_train + n_test, start_ts, interval=1, trend_reset=n_train
+        )
+        train_df = full_df.iloc[:n_train]
 
         test_start_ts = start_ts + n_train
-        test_df_clean = generator.generate_baseline(
-            n_test, test_start_ts, interval=1
-        )
+        test_df_clean = full_df.iloc[n_train:].reset_index(drop=True)
 
         # Inject anomalies into test set
         anomaly_types = [
@@ -91,26 +103,37 @@ class Evaluator:
             test_df_clean, anomaly_types, contamination
         )
 
-        # Write to repository
-        logger.info("Writing training data to repository...")
-        self.repository.write_samples(train_df.to_dict("records"))
-
-        logger.info("Writing test data to repository...")
-        self.repository.write_samples(test_df.to_dict("records"))
-
-        # Train model
-        logger.info("Training model...")
-        train_metrics = self.detector.train(
-            start_ts=start_ts,
-            end_ts=start_ts + n_train - 1,
-        )
-
-        # Detect on test set
-        logger.info("Running detection on test set...")
-        _, y_scores, y_pred = self.detector.detect(
-            start_ts=test_start_ts,
-            end_ts=test_start_ts + n_test - 1,
-        )
+        if persist:
+            # Write to repository
+            logger.info("Writing training data to repository...")
+            self.repository.write_samples_df(train_df)
+
+            logger.info("Writing test data to repository...")
+            self.repository.write_samples_df(test_df)
+
+            # Train model
+            logger.info("Training model...")
+            train_metrics = self.detector.train(
+                start_ts=start_ts,
+                end_ts=start_ts + n_train - 1,
+            )
+
+            # Detect on test set
+            logger.info("Running detection on test set...")
+            _, y_scores, y_pred = self.detector.detect(
+                start_ts=test_start_ts,
+                end_ts=test_start_ts + n_test - 1,
+            )
+        else:
+            logger.info("Training model...")
+            train_metrics = self.detector.train_from_df(
+                train_df.loc[:, list(SAMPLE_COLUMNS)]
+            )
+
+            logger.info("Running detection on test set...")
+            _, y_scores, y_pred = self.detector.detect_from_df(
+                test_df.loc[:, list(SAMPLE_COLUMNS)]
+            )
 
         # Compute metrics
         logger.info("Computing evaluation metrics...")
@@ -144,77 +167,88 @@ class Evaluator:
 
         return results
 
+    def _axes(self, figsize: Tuple[float, float]) -> Axes:
+        """Return the shared plot axes, cleared and resized."""
+        fig, ax = self._fig, self._ax
+        if fig is None or ax is None:
+            fig = Figure()
+            ax = fig.add_subplot()
+            self._fig, self._ax = fig, ax
+
+        fig.set_size_inches(figsize)
+        ax.clear()
+        return ax
+
+    def _save_plot(self, filename: str) -> Path:
+        """Render the shared figure to a PNG in the output directory."""
+        if self._fig is None:
+            raise RuntimeError("No plot has been drawn")
+
+        output_path = self.output_dir / filename
+        self._fig.savefig(output_path, dpi=_PLOT_DPI)
+        return output_path
+
     def _plot_roc_curve(
         self, y_true: np.ndarray, y_scores: np.ndarray
     ) -> None:
         """Plot ROC curve."""
         fpr, tpr, _ = compute_roc_curve(y_true, y_scores)
 
-        plt.figure(figsize=(8, 6))
-        plt.plot(fpr, tpr, linewidth=2, label="ROC curve")
-        plt.plot([0, 1], [0, 1], "k--", label="Random")
-        plt.xlabel("False Positive Rate")
-        plt.ylabel("True Positive Rate")
-        plt.title("ROC Curve")
-        plt.legend()
-        plt.grid(True, alpha=0.3)
-
-        output_path = self.output_dir / "roc_curve.png"
-        plt.savefig(output_path, dpi=150, bbox_inches="tight")
-        plt.close()
+        ax = self._axes((8, 6))
+        ax.plot(fpr, tpr, linewidth=2, label="ROC curve")
+        ax.plot([0, 1], [0, 1], "k--", label="Random")
+        ax.set_xlabel("False Positive Rate")
+        ax.set_ylabel("True Positive Rate")
+        ax.set_title("ROC Curve")
+        ax.legend()
+        ax.grid(True, alpha=0.3)
 
+        output_path = self._save_plot("roc_curve.png")
         logger.info(f"ROC curve saved to {output_path}")
 
     def _plot_pr_curve(self, y_true: np.ndarray, y_scores: np.ndarray) -> None:
         """Plot precision-recall curve."""
         precision, recall, _ = compute_pr_curve(y_true, y_scores)
 
-        plt.figure(figsize=(8, 6))
-        plt.plot(recall, precision, linewidth=2, label="PR curve")
-        plt.xlabel("Recall")
-        plt.ylabel("Precision")
-        plt.title("Precision-Recall Curve")
-        plt.legend()
-        plt.grid(True, alpha=0.3)
-
-        output_path = self.output_dir / "pr_curve.png"
-        plt.savefig(output_path, dpi=150, bbox_inches="tight")
-        plt.close()
+        ax = self._axes((8, 6))
+        ax.plot(recall, precision, linewidth=2, label="PR curve")
+        ax.set_xlabel("Recall")
+        ax.set_ylabel("Precision")
+        ax.set_title("Precision-Recall Curve")
+        ax.legend()
+        ax.grid(True, alpha=0.3)
 
+        output_path = self._save_plot("pr_curve.png")
         logger.info(f"PR curve saved to {output_path}")
 
     def _plot_score_distribution(
         self, y_true: np.ndarray, y_scores: np.ndarray
     ) -> None:
         """Plot anomaly score distributions."""
-        normal_scores = y_scores[y_true == 0]
-        anomaly_scores = y_scores[y_true == 1]
-
-        plt.figure(figsize=(10, 6))
-        plt.hist(
-            normal_scores,
-            bins=50,
-            alpha=0.5,
-            label="Normal",
-            color="blue",
-            density=True,
-        )
-        plt.hist(
-            anomaly_scores,
-            bins=50,
-            alpha=0.5,
-            label="Anomaly",
-            color="red",
-            density=True,
-        )
-        plt.xlabel("Anomaly Score")
-        plt.ylabel("Density")
-        plt.title("Score Distribution")
-        plt.legend()
-        plt.grid(True, alpha=0.3)
-
-        output_path = self.output_dir / "score_distribution.png"
-        plt.savefig(output_path, dpi=150, bbox_inches="tight")
-        plt.close()
-
+        ax = self._axes((10, 6))
+
+        # Histograms as single step patches rather than one bar per bin
+        for label, color, scores in (
+            ("Normal", "blue", y_scores[y_true == 0]),
+            ("Anomaly", "red", y_scores[y_true == 1]),
+        ):
+            if scores.size == 0:
+                continue
+            density, edges = np.histogram(scores, bins=50, density=True)
+            ax.stairs(
+                density,
+                edges,
+                fill=True,
+                alpha=0.5,
+                label=label,
+                color=color,
+            )
+
+        ax.set_xlabel("Anomaly Score")
+        ax.set_ylabel("Density")
+        ax.set_title("Score Distribution")
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+
+        output_path = self._save_plot("score_distribution.png")
         logger.info(f"Score distribution saved to {output_path}")
@@ -4,17 +4,13 @@ import logging
 from typing import Dict, Tuple
 
 import numpy as np
-from sklearn.metrics import (
-    accuracy_score,
-    precision_recall_curve,
-    precision_score,
-    recall_score,
-    roc_auc_score,
-    roc_curve,
-)
+from sklearn.metrics import precision_recall_curve, roc_curve
 
 logger = logging.getLogger(__name__)
 
+# Samples after an anomaly start within which a detection counts
+_LEAD_TIME_WINDOW = 100
+
 
 def compute_classification_metrics(
     y_true: np.ndarray,
@@ -32,25 +28,31 @@ def compute_classification_metrics(
     Returns:
         Dict with accuracy, precision, recall, fpr, auc
     """
-    # Convert scores to higher-is-more-anomalous
-    y_scores_inverted = -y_scores
+    y_true = np.asarray(y_true).astype(np.intp)
+    y_pred = np.asarray(y_pred).astype(np.intp)
+
+    # Confusion counts in one pass: index = 2 * actual + predicted
+    tn, fp, fn, tp = np.bincount(2 * y_true + y_pred, minlength=4).tolist()
 
     # Basic metrics
-    accuracy = accuracy_score(y_true, y_pred)
-    precision = precision_score(y_true, y_pred, zero_division=0)
-    recall = recall_score(y_true, y_pred, zero_division=0)
+    accuracy = (tp + tn) / y_true.size if y_true.size else 0.0
+    precision = tp / (tp + fp) if (tp + fp) > 0 else 0.0
+    recall = tp / (tp + fn) if (tp + fn) > 0 else 0.0
 
     # FPR
-    tn = np.sum((y_pred == 0) & (y_true == 0))
-    fp = np.sum((y_pred == 1) & (y_true == 0))
     fpr = fp / (fp + tn) if (fp + tn) > 0 else 0.0
 
-    # AUC
-    try:
-        auc = roc_auc_score(y_true, y_scores_inverted)
-    except Exception as e:
-        logger.warning(f"Could not compute AUC: {e}")
+    # AUC, with scores flipped to higher-is-more-anomalous. Degenerate
+    # inputs are caught by cheap checks instead of an exception path.
+    scores = -np.asarray(y_scores, dtype=np.float64)
+    if tp + fn == 0 or fp + tn == 0:
+        logger.warning("Could not compute AUC: only one class in y_true")
+        auc = 0.0
+    elif not np.isfinite(scores).all():
+        logger.warning("Could not compute AUC: non-finite scores")
         auc = 0.0
+    else:
+        auc = _binary_auc(y_true == 1, scores)
 
     return {
         "accuracy": accuracy,
@@ -114,25 +116,51 @@ def compute_lead_time(
     Returns:
         Dict with mean/median lead time in seconds
     """
-    lead_times = []
-
     # Find true anomaly runs
-    anomaly_starts = np.where(np.diff(y_true, prepend=0) == 1)[0]
+    anomaly_starts = np.flatnonzero(np.diff(y_true, prepend=0) == 1)
+    detections = np.flatnonzero(np.asarray(y_pred) == 1)
 
-    for start_idx in anomaly_starts:
-        # Find first detection in window after start
-        detection_window = y_pred[start_idx : start_idx + 100]
-        detected_indices = np.where(detection_window == 1)[0]
+    # First detection at or after each start, if within the window
+    pos = np.searchsorted(detections, anomaly_starts)
+    found = pos < detections.size
+    first = detections[pos[found]]
+    starts = anomaly_starts[found]
+    in_window = first < starts + _LEAD_TIME_WINDOW
 
-        if len(detected_indices) > 0:
-            first_detection = start_idx + detected_indices[0]
-            lead_time = timestamps[first_detection] - timestamps[start_idx]
-            lead_times.append(lead_time)
+    timestamps = np.asarray(timestamps)
+    lead_times = timestamps[first[in_window]] - timestamps[starts[in_window]]
 
-    if not lead_times:
+    if lead_times.size == 0:
         return {"mean_lead_time": 0.0, "median_lead_time": 0.0}
 
     return {
         "mean_lead_time": float(np.mean(lead_times)),
         "median_lead_time": float(np.median(lead_times)),
     }
+
+
+def _binary_auc(positive: np.ndarray, scores: np.ndarray) -> float:
+    """
+    ROC AUC via the Mann-Whitney U statistic.
+
+    AUC = (sum of positive ranks - n_pos * (n_pos + 1) / 2)
+    / (n_pos * n_neg), with tied scores sharing their average rank.
+    Equals sklearn's roc_auc_score from a single sort.
+
+    Args:
+        positive: Boolean mask of positive samples (both classes present)
+        scores: Scores, higher = more likely positive
+
+    Returns:
+        AUC value
+    """
+    _, inverse, counts = np.unique(scores, return_inverse=True, return_counts=True)
+    # 1-based average rank of each distinct value
+    avg_rank = np.cumsum(counts) - (counts - 1) / 2.0
+    ranks = avg_rank[inverse]
+
+    n_pos = int(np.count_nonzero(positive))
+    n_neg = positive.size - n_pos
+    rank_sum = float(ranks[positive].sum())
+
+    return (rank_sum - n_pos * (n_pos + 1) / 2.0) / (n_pos * n_neg)
@@ -1,8 +1,7 @@
 """Synthetic data generation and anomaly injection."""
 
 import logging
-import random
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -10,6 +9,21 @@ import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Columns overwritten by each anomaly type, with uniform value ranges
+_ANOMALY_EFFECTS = {
+    "cpu_spike": (("cpu_pct", 90, 100),),
+    "memory_leak": (("mem_pct", 85, 100),),
+    "io_storm": (
+        ("disk_read_bps", 10**8, 10**9),
+        ("disk_write_bps", 10**8, 10**9),
+    ),
+    "network_flood": (
+        ("net_up_bps", 10**8, 10**9),
+        ("net_down_bps", 10**8, 10**9),
+    ),
+    "swap_pressure": (("swap_pct", 80, 100),),
+}
+
 
 class SyntheticDataGenerator:
     """
@@ -28,14 +42,14 @@ class SyntheticDataGenerator:
         """
         self.host = host
         self.random_state = random_state
-        random.seed(random_state)
-        np.random.seed(random_state)
+        self._rng = np.random.default_rng(random_state)
 
     def generate_baseline(
         self,
         n_samples: int,
         start_ts: int,
         interval: int = 1,
+        trend_reset: Optional[int] = None,
     ) -> pd.DataFrame:
         """
         Generate normal baseline data.
@@ -44,66 +58,84 @@ class SyntheticDataGenerator:
             n_samples: Number of samples to generate
             start_ts: Starting timestamp
             interval: Seconds between samples
+            trend_reset: Optional row index at which the memory trend
+                restarts, so one batch can hold two back-to-back windows
+                that each ramp from the same baseline
 
         Returns:
             DataFrame with synthetic samples
         """
         logger.info(f"Generating {n_samples:,} baseline samples...")
 
-        timestamps = [start_ts + i * interval for i in range(n_samples)]
+        # One int64 buffer, without the scale-and-shift temporaries
+        stop_ts = start_ts + n_samples * interval
+        timestamps = np.arange(start_ts, stop_ts, interval, dtype=np.int64)
 
         # Generate realistic patterns with daily/hourly cycles
         t = np.arange(n_samples)
 
+        # One daily cycle shared by CPU and both network directions
+        sine = np.sin(t * (2 * np.pi / (86400 / interval)))
+
         # CPU: baseline 20-40% with daily cycle
-        cpu_base = 30 + 10 * np.sin(t * 2 * np.pi / (86400 / interval))
-        cpu_noise = np.random.normal(0, 5, n_samples)
+        cpu_base = 30 + 10 * sine
+        cpu_noise = self._rng.normal(0, 5, n_samples)
         cpu_pct = np.clip(cpu_base + cpu_noise, 0, 100)
 
         # Memory: slowly growing trend
-        mem_base = 40 + (t / n_samples) * 20
-        mem_noise = np.random.normal(0, 3, n_samples)
+        if trend_reset:
+            progress = np.where(
+                t < trend_reset,
+                t / trend_reset,
+                (t - trend_reset) / max(n_samples - trend_reset, 1),
+            )
+        else:
+            progress = t / n_samples
+        mem_base = 40 + progress * 20
+        mem_noise = self._rng.normal(0, 3, n_samples)
         mem_pct = np.clip(mem_base + mem_noise, 0, 100)
 
         # Disk I/O: sporadic bursts
-        disk_read = np.abs(np.random.lognormal(10, 2, n_samples))
-        disk_write = np.abs(np.random.lognormal(10, 2, n_samples))
-
-        # Network: daytime pattern
-        net_up_base = 10**6 * (
-            1 + 0.5 * np.sin(t * 2 * np.pi / (86400 / interval))
-        )
-        net_up = np.abs(
-            np.random.lognormal(np.log(net_up_base), 0.5, n_samples)
+        disk_read = np.abs(self._rng.lognormal(10, 2, n_samples))
+        disk_write = np.abs(self._rng.lognormal(10, 2, n_samples))
+
+        # Network: daytime pattern around 1 MB/s up and 5 MB/s down.
+        # lognormal(log(base), s) is base * exp(s * N(0, 1)), so scale
+        # the known base directly instead of taking its log to undo it.
+        cycle = 1 + 0.5 * sine
+        net_up = (10**6 * cycle) * np.exp(
+            0.5 * self._rng.standard_normal(n_samples)
         )
-
-        net_down_base = (
-            5 * 10**6 * (1 + 0.5 * np.sin(t * 2 * np.pi / (86400 / interval)))
-        )
-        net_down = np.abs(
-            np.random.lognormal(np.log(net_down_base), 0.5, n_samples)
+        net_down = (5 * 10**6 * cycle) * np.exp(
+            0.5 * self._rng.standard_normal(n_samples)
         )
 
         # Swap: low and stable
-        swap_pct = np.clip(np.random.normal(5, 2, n_samples), 0, 100)
+        swap_pct = np.clip(self._rng.normal(5, 2, n_samples), 0, 100)
 
         # Process count: stable
-        proc_count = np.random.poisson(200, n_samples)
+        proc_count = self._rng.poisson(200, n_samples)
 
+        # Typed columns up front: float32 percentages, whole-byte int64
+        # rates (too large for float32's 24-bit mantissa), a one-category
+        # host column and a numeric NaN cpu_temp instead of object None
         df = pd.DataFrame(
             {
                 "ts": timestamps,
-                "host": self.host,
-                "cpu_pct": cpu_pct,
-                "mem_pct": mem_pct,
-                "disk_read_bps": disk_read,
-                "disk_write_bps": disk_write,
-                "net_up_bps": net_up,
-                "net_down_bps": net_down,
-                "swap_pct": swap_pct,
-                "proc_count": proc_count,
-                "cpu_temp": None,
-            }
+                "host": pd.Categorical.from_codes(
+                    np.zeros(n_samples, dtype=np.int8), [self.host]
+                ),
+                "cpu_pct": cpu_pct.astype(np.float32),
+                "mem_pct": mem_pct.astype(np.float32),
+                "disk_read_bps": np.rint(disk_read).astype(np.int64),
+                "disk_write_bps": np.rint(disk_write).astype(np.int64),
+                "net_up_bps": np.rint(net_up).astype(np.int64),
+                "net_down_bps": np.rint(net_down).astype(np.int64),
+                "swap_pct": swap_pct.astype(np.float32),
+                "proc_count": proc_count.astype(np.int32),
+                "cpu_temp": np.full(n_samples, np.nan, dtype=np.float32),
+            },
+            copy=False,
         )
 
         logger.info(f"Generated baseline: {len(df)} samples")
@@ -135,27 +167,23 @@ class SyntheticDataGenerator:
         labels = np.zeros(n_samples, dtype=int)
 
         # Select random indices for anomalies
-        anomaly_indices = np.random.choice(
+        anomaly_indices = self._rng.choice(
             n_samples, size=n_anomalies, replace=False
         )
 
-        for idx in anomaly_indices:
-            anomaly_type = random.choice(anomaly_types)
-
-            if anomaly_type == "cpu_spike":
-                df.at[idx, "cpu_pct"] = np.random.uniform(90, 100)
-            elif anomaly_type == "memory_leak":
-                df.at[idx, "mem_pct"] = np.random.uniform(85, 100)
-            elif anomaly_type == "io_storm":
-                df.at[idx, "disk_read_bps"] = np.random.uniform(10**8, 10**9)
-                df.at[idx, "disk_write_bps"] = np.random.uniform(10**8, 10**9)
-            elif anomaly_type == "network_flood":
-                df.at[idx, "net_up_bps"] = np.random.uniform(10**8, 10**9)
-                df.at[idx, "net_down_bps"] = np.random.uniform(10**8, 10**9)
-            elif anomaly_type == "swap_pressure":
-                df.at[idx, "swap_pct"] = np.random.uniform(80, 100)
-
-            labels[idx] = 1
+        # One draw per anomaly type and column instead of per-cell writes;
+        # types are integer codes, so no string array is built or compared
+        codes = self._rng.integers(0, len(anomaly_types), size=n_anomalies)
+        for code, anomaly_type in enumerate(anomaly_types):
+            idxs = anomaly_indices[codes == code]
+            if idxs.size == 0:
+                continue
+
+            for col, low, high in _ANOMALY_EFFECTS.get(anomaly_type, ()):
+                values = self._rng.uniform(low, high, idxs.size)
+                df.loc[idxs, col] = values.astype(df[col].dtype)
+
+        labels[anomaly_indices] = 1
 
         anomaly_counts = dict(
             zip(*np.unique(labels, return_counts=True))
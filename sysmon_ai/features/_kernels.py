@@ -0,0 +1,140 @@
+"""Block feature engineering on a contiguous metric matrix.
+
+Computes the same features as chaining the FeatureWindows methods, but
+on one float64 (n_samples, n_metrics) array: every feature group is a
+single 2-D operation across all metrics, written straight into one
+preallocated output matrix instead of copying a DataFrame per step.
+"""
+
+from typing import List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from sysmon_ai.features.windows import (
+    _ROLLING_SUFFIXES,
+    FeatureWindows,
+    move_max,
+    move_mean,
+    move_std,
+)
+
+# Parameters of the FeatureWindows method defaults used by the pipeline
+EMA_ALPHAS = (0.1, 0.3)
+SLOPE_WINDOW = 10
+BURST_WINDOW = 10
+
+
+def feature_names(
+    metric_columns: Sequence[str],
+    io_columns: Sequence[str],
+    windows: FeatureWindows,
+) -> List[str]:
+    """
+    Return engineered feature names in output column order.
+
+    Args:
+        metric_columns: Raw metric columns
+        io_columns: Columns that also get burstiness features
+        windows: Window configuration
+
+    Returns:
+        Feature names matching the columns of engineer()
+    """
+    ema_suffixes = tuple(f"ema{int(alpha*10)}" for alpha in EMA_ALPHAS)
+
+    names = list(metric_columns)
+    for suffixes in (windows._lag_suffixes, _ROLLING_SUFFIXES, ema_suffixes):
+        for col in metric_columns:
+            names += windows._names(col, suffixes)
+    names += [f"{col}_slope" for col in metric_columns]
+    names += [f"{col}_burst" for col in io_columns if col in metric_columns]
+    return names
+
+
+def engineer(
+    X: np.ndarray,
+    windows: FeatureWindows,
+    io_index: Sequence[int],
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Compute all engineered features for a metric matrix.
+
+    NaN results (leading lags, single-sample std) are written as 0.0,
+    matching the fillna(0.0) of the DataFrame pipeline.
+
+    Args:
+        X: Metric matrix (n_samples, n_metrics)
+        windows: Window configuration
+        io_index: Column indices of X that get burstiness features
+        out: Optional float64 (n_samples, n_features) array to write
+            into; every element is overwritten
+
+    Returns:
+        Feature matrix (n_samples, n_features) in feature_names() order
+    """
+    X = np.ascontiguousarray(X, dtype=np.float64)
+    n, m = X.shape
+    lags = windows.lag_periods
+    io_index = list(io_index)
+
+    n_features = m * (2 + len(lags) + 4 + len(EMA_ALPHAS)) + len(io_index)
+    shape = (n, n_features)
+    if out is None:
+        Y = np.empty(shape, dtype=np.float64)
+    elif out.shape != shape or out.dtype != np.float64:
+        raise ValueError(
+            f"out must be float64 with shape {shape}, got {out.dtype} {out.shape}",
+        )
+    else:
+        Y = out
+
+    # Raw metrics
+    Y[:, :m] = X
+    pos = m
+
+    # Groups are metric-major (col0_a, col0_b, col1_a, ...), so the
+    # feature j of every metric is the strided slice pos + j :: width
+    def group(start: int, width: int, j: int) -> slice:
+        return slice(start + j, start + m * width, width)
+
+    # Lags
+    for j, lag in enumerate(lags):
+        cols = group(pos, len(lags), j)
+        Y[:lag, cols] = 0.0
+        if lag < n:
+            Y[lag:, cols] = X[: n - lag]
+    pos += m * len(lags)
+
+    # Rolling mean/std over both windows
+    for j, size in enumerate((windows.short_window, windows.long_window)):
+        Y[:, group(pos, 4, 2 * j)] = move_mean(X, size)
+        Y[:, group(pos, 4, 2 * j + 1)] = move_std(X, size)
+    pos += m * 4
+
+    # EMA
+    frame = pd.DataFrame(X, copy=False)
+    for j, alpha in enumerate(EMA_ALPHAS):
+        ema = frame.ewm(alpha=alpha, adjust=False).mean()
+        Y[:, group(pos, len(EMA_ALPHAS), j)] = ema.to_numpy()
+    pos += m * len(EMA_ALPHAS)
+
+    # Closed-form least-squares slope (see FeatureWindows.add_slope)
+    Y[:, pos : pos + m] = 0.0
+    if n >= SLOPE_WINDOW:
+        xc = np.arange(SLOPE_WINDOW, dtype=np.float64)
+        xc -= (SLOPE_WINDOW - 1) / 2.0
+        Y[SLOPE_WINDOW - 1 :, pos : pos + m] = (
+            sliding_window_view(X, SLOPE_WINDOW, axis=0) @ xc
+        ) / float(xc @ xc)
+    pos += m
+
+    # Burstiness for I/O metrics
+    if io_index:
+        io = X[:, io_index]
+        Y[:, pos:] = move_max(io, BURST_WINDOW) / (move_mean(io, BURST_WINDOW) + 1e-6)
+
+    np.copyto(Y, 0.0, where=np.isnan(Y))
+    return Y
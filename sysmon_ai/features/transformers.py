@@ -1,12 +1,13 @@
 """Feature transformers for ML model input."""
 
 import logging
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 from sklearn.preprocessing import StandardScaler
 
+from sysmon_ai.features import _kernels
 from sysmon_ai.features.windows import FeatureWindows
 
 logger = logging.getLogger(__name__)
@@ -61,6 +62,79 @@ class FeatureTransformer:
         self.scaler = StandardScaler()
         self._feature_names: Optional[List[str]] = None
         self._is_fitted = False
+        self._init_block_layout()
+        self._init_column_plan()
+        self._init_scaling()
+
+        # Reusable transform(reuse_buffer=True) outputs, keyed by role.
+        # Not thread-safe; online detection runs on one thread.
+        self._scratch: Dict[str, np.ndarray] = {}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle without scratch buffers."""
+        state = self.__dict__.copy()
+        state.pop("_scratch", None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore pickled state, deriving cached layouts if absent."""
+        self.__dict__.update(state)
+        self._scratch = {}
+        if "_engineered_names" not in state:
+            self._init_block_layout()
+        if "_column_plan" not in state:
+            self._init_column_plan()
+        if "_inv_scale" not in state:
+            self._init_scaling()
+
+    def _init_block_layout(self) -> None:
+        """Cache engineered feature names and I/O column positions."""
+        self._engineered_names = _kernels.feature_names(
+            self.metric_columns, self.io_columns, self.windows
+        )
+        self._io_index = [
+            self.metric_columns.index(col)
+            for col in self.io_columns
+            if col in self.metric_columns
+        ]
+
+    def _init_column_plan(self) -> None:
+        """
+        Map engineered columns onto the fitted feature order.
+
+        None means the engineered matrix already has the fitted columns
+        in order. Otherwise the plan holds (source, destination) column
+        indices; fitted features that are not engineered stay zero.
+        """
+        self._column_plan: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        if not self._feature_names:
+            return
+        if self._feature_names == self._engineered_names:
+            return
+
+        source = {name: i for i, name in enumerate(self._engineered_names)}
+        pairs = [
+            (source[name], dst)
+            for dst, name in enumerate(self._feature_names)
+            if name in source
+        ]
+        src_idx, dst_idx = zip(*pairs) if pairs else ((), ())
+        self._column_plan = (
+            np.asarray(src_idx, dtype=np.intp),
+            np.asarray(dst_idx, dtype=np.intp),
+        )
+
+    def _init_scaling(self) -> None:
+        """Cache the fitted scaler's mean and reciprocal scale."""
+        self._mean: Optional[np.ndarray] = None
+        self._inv_scale: Optional[np.ndarray] = None
+        if not hasattr(self.scaler, "scale_"):
+            return
+
+        self._mean = np.asarray(self.scaler.mean_, dtype=np.float64)
+        self._inv_scale = 1.0 / np.asarray(
+            self.scaler.scale_, dtype=np.float64
+        )
 
     def fit_transform(self, df: pd.DataFrame) -> np.ndarray:
         """
@@ -72,24 +146,35 @@ class FeatureTransformer:
         Returns:
             Transformed feature matrix
         """
-        features_df = self._engineer_features(df)
+        X = self._engineer_matrix(df)
 
         # Fit scaler
-        X = features_df.values
         X_scaled = self.scaler.fit_transform(X)
 
-        self._feature_names = features_df.columns.tolist()
+        self._feature_names = list(self._engineered_names)
         self._is_fitted = True
+        self._init_column_plan()
+        self._init_scaling()
 
         logger.info(f"Fitted transformer with {X_scaled.shape[1]} features")
         return X_scaled
 
-    def transform(self, df: pd.DataFrame) -> np.ndarray:
+    def transform(
+        self,
+        df: Union[pd.DataFrame, np.ndarray],
+        reuse_buffer: bool = False,
+    ) -> np.ndarray:
         """
         Transform data using fitted transformer.
 
         Args:
-            df: Input dataframe with raw samples
+            df: Input dataframe with raw samples, or a raw metric array
+                (n_samples, n_metrics) in metric_columns order, which
+                skips pandas entirely
+            reuse_buffer: Write into a transformer-owned buffer that is
+                reused while the sample count stays the same. The result
+                is overwritten by the next such call, so only use it when
+                the matrix is consumed immediately.
 
         Returns:
             Transformed feature matrix
@@ -99,57 +184,89 @@ class FeatureTransformer:
                 "Transformer not fitted. Call fit_transform first."
             )
 
-        features_df = self._engineer_features(df)
-
-        # Ensure same columns as training
-        if self._feature_names:
-            # Add missing columns with zeros
-            for col in self._feature_names:
-                if col not in features_df.columns:
-                    features_df[col] = 0.0
-
-            # Select and reorder columns
-            features_df = features_df[self._feature_names]
-
-        X = features_df.values
-        X_scaled = self.scaler.transform(X)
-
-        return X_scaled
+        n = len(df)
+        out = None
+        if reuse_buffer:
+            out = self._scratch_buffer(
+                "engineered", (n, len(self._engineered_names))
+            )
+        X = self._engineer_matrix(df, out=out)
+
+        # Ensure same columns as training (a plan implies fitted names)
+        if self._column_plan is not None and self._feature_names:
+            src_idx, dst_idx = self._column_plan
+            shape = (n, len(self._feature_names))
+            if reuse_buffer:
+                aligned = self._scratch_buffer("aligned", shape)
+                aligned.fill(0.0)
+            else:
+                aligned = np.zeros(shape)
+            aligned[:, dst_idx] = X[:, src_idx]
+            X = aligned
+
+        if self._inv_scale is None:
+            return self.scaler.transform(X)
+
+        # X is a fresh or scratch array, so standardize it in place
+        X -= self._mean
+        X *= self._inv_scale
+        return X
 
     def _engineer_features(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Apply feature engineering pipeline.
 
+        Produces the same columns as chaining the FeatureWindows methods,
+        computed in one block pass over the metric matrix.
+
         Args:
             df: Raw samples dataframe
 
         Returns:
             DataFrame with engineered features
         """
-        # Start with raw metrics
-        features = df[self.metric_columns].copy()
-
-        # Add lags
-        features = self.windows.add_lags(features, self.metric_columns)
+        Y = self._engineer_matrix(df)
 
-        # Add rolling stats
-        features = self.windows.add_rolling_stats(
-            features, self.metric_columns
+        return pd.DataFrame(
+            Y, columns=self._engineered_names, index=df.index, copy=False
         )
 
-        # Add EMA
-        features = self.windows.add_ema(features, self.metric_columns)
-
-        # Add slopes
-        features = self.windows.add_slope(features, self.metric_columns)
-
-        # Add burstiness for I/O metrics
-        features = self.windows.add_burstiness(features, self.io_columns)
+    def _scratch_buffer(
+        self, key: str, shape: Tuple[int, int]
+    ) -> np.ndarray:
+        """Return the scratch buffer for key, reallocated on shape change."""
+        buffer = self._scratch.get(key)
+        if buffer is None or buffer.shape != shape:
+            buffer = np.empty(shape, dtype=np.float64)
+            self._scratch[key] = buffer
+        return buffer
+
+    def _engineer_matrix(
+        self,
+        data: Union[pd.DataFrame, np.ndarray],
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Return engineered features as an array in _engineered_names order.
 
-        # Drop rows with NaN (initial lag periods)
-        features = features.fillna(0.0)
+        Args:
+            data: Raw samples dataframe, or a metric array whose columns
+                follow metric_columns
+            out: Optional output array passed to the kernel
 
-        return features
+        Returns:
+            Feature matrix (n_samples, n_features)
+        """
+        if isinstance(data, pd.DataFrame):
+            X = data[self.metric_columns].to_numpy(dtype=np.float64)
+        else:
+            X = np.asarray(data, dtype=np.float64)
+            if X.ndim != 2 or X.shape[1] != len(self.metric_columns):
+                raise ValueError(
+                    f"Expected metric array with {len(self.metric_columns)} "
+                    f"columns, got shape {X.shape}"
+                )
+        return _kernels.engineer(X, self.windows, self._io_index, out=out)
 
     def get_feature_names(self) -> List[str]:
         """Get list of feature names after transformation."""
@@ -1,13 +1,21 @@
 """Windowed feature extraction from time-series data."""
 
 import logging
-from typing import List
+from typing import Any, Dict, List, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
 
+try:
+    import bottleneck as bn
+except ImportError:  # Optional; pandas rolling is the fallback
+    bn = None
+
 logger = logging.getLogger(__name__)
 
+# Column suffixes written by add_rolling_stats, in output order
+_ROLLING_SUFFIXES = ("rmean_s", "rstd_s", "rmean_l", "rstd_l")
+
 
 class FeatureWindows:
     """Creates rolling windows and computes aggregations."""
@@ -30,6 +38,28 @@ class FeatureWindows:
         self.long_window = long_window
         self.lag_periods = lag_periods
 
+        # (column, suffixes) -> output column names, filled on first use
+        self._name_cache: Dict[Tuple[str, Tuple[str, ...]], List[str]] = {}
+        self._lag_suffixes = tuple(f"lag{lag}" for lag in lag_periods)
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore pickled state, adding caches missing from old pickles."""
+        self.__dict__.update(state)
+        self.__dict__.setdefault("_name_cache", {})
+        self.__dict__.setdefault(
+            "_lag_suffixes",
+            tuple(f"lag{lag}" for lag in self.lag_periods),
+        )
+
+    def _names(self, col: str, suffixes: Tuple[str, ...]) -> List[str]:
+        """Return cached ``{col}_{suffix}`` names."""
+        key = (col, suffixes)
+        names = self._name_cache.get(key)
+        if names is None:
+            names = [f"{col}_{suffix}" for suffix in suffixes]
+            self._name_cache[key] = names
+        return names
+
     def add_lags(self, df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
         """
         Add lagged features.
@@ -41,17 +71,21 @@ class FeatureWindows:
         Returns:
             DataFrame with added lag columns
         """
-        result = df.copy()
+        new: Dict[str, np.ndarray] = {}
 
         for col in columns:
             if col not in df.columns:
                 continue
 
-            for lag in self.lag_periods:
-                lag_col = f"{col}_lag{lag}"
-                result[lag_col] = result[col].shift(lag)
+            values = df[col].to_numpy(dtype=np.float64)
+            names = self._names(col, self._lag_suffixes)
+            for lag, lag_col in zip(self.lag_periods, names):
+                lagged = np.full(len(values), np.nan)
+                if lag < len(values):
+                    lagged[lag:] = values[: len(values) - lag]
+                new[lag_col] = lagged
 
-        return result
+        return _append_columns(df, new)
 
     def add_rolling_stats(
         self,
@@ -68,43 +102,25 @@ class FeatureWindows:
         Returns:
             DataFrame with added rolling stats
         """
-        result = df.copy()
+        new: Dict[str, np.ndarray] = {}
 
         for col in columns:
             if col not in df.columns:
                 continue
 
-            # Short window
-            result[f"{col}_rmean_s"] = (
-                result[col]
-                .rolling(window=self.short_window, min_periods=1)
-                .mean()
-            )
-            result[f"{col}_rstd_s"] = (
-                result[col]
-                .rolling(window=self.short_window, min_periods=1)
-                .std()
-            )
-
-            # Long window
-            result[f"{col}_rmean_l"] = (
-                result[col]
-                .rolling(window=self.long_window, min_periods=1)
-                .mean()
-            )
-            result[f"{col}_rstd_l"] = (
-                result[col]
-                .rolling(window=self.long_window, min_periods=1)
-                .std()
-            )
-
-        return result
+            values = df[col].to_numpy(dtype=np.float64)
+            names = iter(self._names(col, _ROLLING_SUFFIXES))
+            for window in (self.short_window, self.long_window):
+                new[next(names)] = move_mean(values, window)
+                new[next(names)] = move_std(values, window)
+
+        return _append_columns(df, new)
 
     def add_ema(
         self,
         df: pd.DataFrame,
         columns: List[str],
-        alphas: List[float] = [0.1, 0.3],
+        alphas: Sequence[float] = (0.1, 0.3),
     ) -> pd.DataFrame:
         """
         Add exponential moving averages.
@@ -117,19 +133,19 @@ class FeatureWindows:
         Returns:
             DataFrame with added EMA columns
         """
-        result = df.copy()
+        new: Dict[str, np.ndarray] = {}
+        suffixes = tuple(f"ema{int(alpha*10)}" for alpha in alphas)
 
         for col in columns:
             if col not in df.columns:
                 continue
 
-            for alpha in alphas:
-                ema_col = f"{col}_ema{int(alpha*10)}"
-                result[ema_col] = (
-                    result[col].ewm(alpha=alpha, adjust=False).mean()
-                )
+            names = self._names(col, suffixes)
+            for alpha, ema_col in zip(alphas, names):
+                ema = df[col].ewm(alpha=alpha, adjust=False).mean()
+                new[ema_col] = ema.to_numpy()
 
-        return result
+        return _append_columns(df, new)
 
     def add_slope(
         self,
@@ -140,6 +156,11 @@ class FeatureWindows:
         """
         Add linear slope over recent window.
 
+        Computed in closed form: with x centered on the window midpoint,
+        the least-squares slope is sum(xc * y) / sum(xc**2), so every
+        window reduces to one sliding dot product (np.convolve) instead
+        of a polyfit per row. The first window - 1 rows are 0.0.
+
         Args:
             df: Input dataframe
             columns: Columns to compute slope
@@ -148,32 +169,28 @@ class FeatureWindows:
         Returns:
             DataFrame with added slope columns
         """
-        result = df.copy()
+        new: Dict[str, np.ndarray] = {}
+
+        n = len(df)
+        xc = np.arange(window, dtype=np.float64) - (window - 1) / 2.0
+        sxx = float(xc @ xc)
 
         for col in columns:
             if col not in df.columns:
                 continue
 
-            slopes = []
-            values = result[col].values
-
-            for i in range(len(values)):
-                if i < window - 1:
-                    slopes.append(0.0)
-                else:
-                    window_vals = values[i - window + 1 : i + 1]
-                    x = np.arange(window)
-                    # Simple linear regression
-                    slope = (
-                        np.polyfit(x, window_vals, 1)[0]
-                        if len(window_vals) == window
-                        else 0.0
-                    )
-                    slopes.append(slope)
+            slopes = np.zeros(n)
+            if n >= window and sxx > 0:
+                values = df[col].to_numpy(dtype=np.float64)
+                # convolve flips its kernel; pass xc reversed to correlate
+                slopes[window - 1 :] = (
+                    np.convolve(values, xc[::-1], mode="valid") / sxx
+                )
 
-            result[f"{col}_slope"] = slopes
+            (slope_col,) = self._names(col, ("slope",))
+            new[slope_col] = slopes
 
-        return result
+        return _append_columns(df, new)
 
     def add_burstiness(
         self,
@@ -192,21 +209,127 @@ class FeatureWindows:
         Returns:
             DataFrame with burstiness features
         """
-        result = df.copy()
+        new: Dict[str, np.ndarray] = {}
 
         for col in io_columns:
             if col not in df.columns:
                 continue
 
-            rolling_max = (
-                result[col].rolling(window=window, min_periods=1).max()
-            )
-            rolling_mean = (
-                result[col].rolling(window=window, min_periods=1).mean()
-            )
+            values = df[col].to_numpy(dtype=np.float64)
+            rolling_max = move_max(values, window)
+            rolling_mean = move_mean(values, window)
 
             # Avoid division by zero
-            burst_ratio = rolling_max / (rolling_mean + 1e-6)
-            result[f"{col}_burst"] = burst_ratio
+            (burst_col,) = self._names(col, ("burst",))
+            new[burst_col] = rolling_max / (rolling_mean + 1e-6)
+
+        return _append_columns(df, new)
+
 
-        return result
+def move_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing rolling mean with min_periods=1 along axis 0.
+
+    Uses bottleneck's C kernel when installed, otherwise pandas.
+
+    Args:
+        values: 1-D or 2-D float array
+        window: Window size
+
+    Returns:
+        Array shaped like values
+    """
+    result: np.ndarray
+    if bn is not None and len(values):
+        window = _bottleneck_window(values, window)
+        result = bn.move_mean(values, window, min_count=1, axis=0)
+    else:
+        result = _pandas_rolling(values, window).mean().to_numpy()
+    return result
+
+
+def move_std(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing rolling sample std (ddof=1) with min_periods=1 along axis 0.
+
+    Args:
+        values: 1-D or 2-D float array
+        window: Window size
+
+    Returns:
+        Array shaped like values; NaN where the window holds one value
+    """
+    result: np.ndarray
+    if bn is not None and len(values):
+        window = _bottleneck_window(values, window)
+        result = bn.move_std(values, window, min_count=1, axis=0, ddof=1)
+    else:
+        result = _pandas_rolling(values, window).std().to_numpy()
+    return result
+
+
+def move_max(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing rolling max with min_periods=1 along axis 0.
+
+    Args:
+        values: 1-D or 2-D float array
+        window: Window size
+
+    Returns:
+        Array shaped like values
+    """
+    result: np.ndarray
+    if bn is not None and len(values):
+        window = _bottleneck_window(values, window)
+        result = bn.move_max(values, window, min_count=1, axis=0)
+    else:
+        result = _pandas_rolling(values, window).max().to_numpy()
+    return result
+
+
+def _bottleneck_window(values: np.ndarray, window: int) -> int:
+    """
+    Clip a window to the input length for bottleneck.
+
+    bottleneck rejects windows longer than the array, while pandas
+    accepts them; with min_count=1 the trailing results are the same.
+
+    Args:
+        values: Non-empty 1-D or 2-D float array
+        window: Window size
+
+    Returns:
+        Window size of at most len(values)
+    """
+    return min(window, len(values))
+
+
+def _pandas_rolling(values: np.ndarray, window: int) -> Any:
+    """Wrap values in a Series/DataFrame rolling window."""
+    wrapped = pd.Series(values) if values.ndim == 1 else pd.DataFrame(values)
+    return wrapped.rolling(window=window, min_periods=1)
+
+
+def _append_columns(
+    df: pd.DataFrame, new: Dict[str, np.ndarray]
+) -> pd.DataFrame:
+    """
+    Return df with new columns appended in one concat.
+
+    Assigning columns one at a time would reallocate the frame's blocks
+    for each one. Existing columns with a new column's name are
+    replaced, as assignment would.
+
+    Args:
+        df: Input dataframe
+        new: Column name -> values aligned with df
+
+    Returns:
+        New DataFrame with the added columns
+    """
+    stale = [col for col in new if col in df.columns]
+    if stale:
+        df = df.drop(columns=stale)
+
+    return pd.concat([df, pd.DataFrame(new, index=df.index)], axis=1)
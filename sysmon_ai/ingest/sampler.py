@@ -1,15 +1,17 @@
 """System metrics sampler using psutil."""
 
 import logging
-import time
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 import psutil
 
-from sysmon_ai.utils import now_utc_ts, supports_cpu_temp
+from sysmon_ai.utils import now_utc_ns, supports_cpu_temp
 
 logger = logging.getLogger(__name__)
 
+# Common CPU sensor names, in lookup order
+_CPU_TEMP_SENSORS = ("coretemp", "k10temp", "zenpower", "cpu_thermal")
+
 
 class MetricsSampler:
     """Samples system metrics via psutil."""
@@ -26,6 +28,10 @@ class MetricsSampler:
         self._last_net_io: Optional[Any] = None
         self._last_sample_time: Optional[float] = None
 
+        # Sensor that last produced a reading; resolved on first hit
+        self._temp_key: Optional[str] = None
+        self._cpu_temp_fn = self._make_cpu_temp_fn()
+
     def sample(self) -> Dict[str, Any]:
         """
         Sample current system metrics.
@@ -33,9 +39,11 @@ class MetricsSampler:
         Returns:
             Dict with metric values and timestamp
         """
-        current_time = time.time()
+        # One clock read for both the stored timestamp and the rate deltas
+        now_ns = now_utc_ns()
+        current_time = now_ns / 1e9
         sample_data = {
-            "ts": now_utc_ts(),
+            "ts": now_ns // 1_000_000_000,
             "host": self.host,
             "cpu_pct": self._get_cpu_pct(),
             "mem_pct": self._get_mem_pct(),
@@ -57,10 +65,7 @@ class MetricsSampler:
         sample_data.update(net_io)
 
         # CPU temperature (optional)
-        if supports_cpu_temp():
-            sample_data["cpu_temp"] = self._get_cpu_temp()
-        else:
-            sample_data["cpu_temp"] = None
+        sample_data["cpu_temp"] = self._cpu_temp_fn()
 
         self._last_sample_time = current_time
 
@@ -99,9 +104,9 @@ class MetricsSampler:
             logger.warning(f"Failed to get process count: {e}")
             return 0
 
-    def _get_disk_io_rates(self, time_delta: float) -> Dict[str, float]:
+    def _get_disk_io_rates(self, time_delta: float) -> Dict[str, int]:
         """
-        Calculate disk I/O rates in bytes/sec.
+        Calculate disk I/O rates in whole bytes/sec.
 
         Args:
             time_delta: Time since last sample
@@ -125,16 +130,16 @@ class MetricsSampler:
             self._last_disk_io = current_io
 
             return {
-                "disk_read_bps": max(0.0, read_bps),
-                "disk_write_bps": max(0.0, write_bps),
+                "disk_read_bps": max(0, round(read_bps)),
+                "disk_write_bps": max(0, round(write_bps)),
             }
         except Exception as e:
             logger.warning(f"Failed to get disk I/O: {e}")
-            return {"disk_read_bps": 0.0, "disk_write_bps": 0.0}
+            return {"disk_read_bps": 0, "disk_write_bps": 0}
 
-    def _get_net_io_rates(self, time_delta: float) -> Dict[str, float]:
+    def _get_net_io_rates(self, time_delta: float) -> Dict[str, int]:
         """
-        Calculate network I/O rates in bytes/sec.
+        Calculate network I/O rates in whole bytes/sec.
 
         Args:
             time_delta: Time since last sample
@@ -158,28 +163,44 @@ class MetricsSampler:
             self._last_net_io = current_io
 
             return {
-                "net_up_bps": max(0.0, up_bps),
-                "net_down_bps": max(0.0, down_bps),
+                "net_up_bps": max(0, round(up_bps)),
+                "net_down_bps": max(0, round(down_bps)),
             }
         except Exception as e:
             logger.warning(f"Failed to get network I/O: {e}")
-            return {"net_up_bps": 0.0, "net_down_bps": 0.0}
+            return {"net_up_bps": 0, "net_down_bps": 0}
+
+    def _make_cpu_temp_fn(self) -> Callable[[], Optional[float]]:
+        """
+        Resolve CPU temperature support once.
+
+        Returns:
+            Callable returning the current CPU temperature or None
+        """
+        if not supports_cpu_temp() or not hasattr(
+            psutil, "sensors_temperatures"
+        ):
+            return lambda: None
+        return self._get_cpu_temp
 
     def _get_cpu_temp(self) -> Optional[float]:
         """Get CPU temperature (Linux only)."""
         try:
-            if hasattr(psutil, "sensors_temperatures"):
-                temps = psutil.sensors_temperatures()
-                if temps:
-                    # Try common sensor names
-                    for key in [
-                        "coretemp",
-                        "k10temp",
-                        "zenpower",
-                        "cpu_thermal",
-                    ]:
-                        if key in temps and temps[key]:
-                            return temps[key][0].current
+            temps = psutil.sensors_temperatures()
+            if not temps:
+                return None
+
+            # Read the sensor found last time directly
+            if self._temp_key:
+                entries = temps.get(self._temp_key)
+                if entries:
+                    return entries[0].current
+
+            # Try common sensor names
+            for key in _CPU_TEMP_SENSORS:
+                if temps.get(key):
+                    self._temp_key = key
+                    return temps[key][0].current
             return None
         except Exception as e:
             logger.debug(f"Failed to get CPU temp: {e}")
@@ -1,12 +1,13 @@
 """Batching writer with backpressure handling."""
 
 import logging
-import queue
 import threading
 import time
-from typing import Any, Dict, List
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, List
 
-from sysmon_ai.data import Repository
+from sysmon_ai.data import SAMPLE_COLUMNS, Repository
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +17,11 @@ class BatchWriter:
     Batching writer that accumulates samples and writes to repository.
 
     Handles backpressure by dropping oldest samples when queue is full.
+    The queue is a bounded deque: appends are atomic and evict the
+    oldest entry on their own, so producers never take a lock. Drops
+    are counted under the consumer lock as samples appended minus
+    samples drained minus samples still queued, assuming one producer
+    thread (the collector loop).
     """
 
     def __init__(
@@ -39,14 +45,24 @@ class BatchWriter:
         self.max_queue_size = max_queue_size
         self.flush_interval = flush_interval
 
-        self._queue: queue.Queue[Dict[str, Any]] = queue.Queue(
-            maxsize=max_queue_size
+        # maxsize <= 0 meant unbounded for queue.Queue; keep that
+        self._queue: Deque[Dict[str, Any]] = deque(
+            maxlen=max_queue_size if max_queue_size > 0 else None
         )
+        self._lock = threading.Lock()  # Serializes consumers
+        self._wake = threading.Event()  # Set when a full batch is queued
         self._running = False
         self._thread: threading.Thread | None = None
-        self._dropped_count = 0
+        self._appended_count = 0  # Producer side
+        self._drained_count = 0  # Under _lock
+        self._dropped = 0  # Last count taken under _lock
         self._written_count = 0
 
+        # Repositories without the columnar path get lists of dicts
+        self._write_columnar = getattr(
+            repository, "write_samples_columnar", None
+        )
+
     def start(self) -> None:
         """Start background writer thread."""
         if self._running:
@@ -69,6 +85,7 @@ class BatchWriter:
             return
 
         self._running = False
+        self._wake.set()
 
         if self._thread:
             self._thread.join(timeout=timeout)
@@ -78,7 +95,7 @@ class BatchWriter:
 
         logger.info(
             f"Batch writer stopped (written={self._written_count}, "
-            f"dropped={self._dropped_count})"
+            f"dropped={self.get_stats()['dropped']})"
         )
 
     def enqueue(self, sample: Dict[str, Any]) -> bool:
@@ -89,57 +106,59 @@ class BatchWriter:
             sample: Sample dict to write
 
         Returns:
-            True if enqueued, False if dropped due to backpressure
+            True if enqueued, False if the oldest queued sample was dropped
+            to make room. Best-effort while the writer thread drains: a
+            pop between the two length reads can hide or fake a drop.
+            get_stats() counts drops exactly.
         """
-        try:
-            self._queue.put_nowait(sample)
-            return True
-        except queue.Full:
-            self._dropped_count += 1
-            if self._dropped_count % 1000 == 0:
-                logger.warning(
-                    f"Queue full, dropped {self._dropped_count} samples total"
-                )
-            return False
+        queue = self._queue
+        before = len(queue)
+        queue.append(sample)
+        self._appended_count += 1
+        after = len(queue)
+
+        # Signal once per crossing; the flush timeout covers any miss
+        if after == self.batch_size:
+            self._wake.set()
+
+        return not (before == queue.maxlen and after == before)
+
+    @contextmanager
+    def paused(self) -> Iterator[None]:
+        """
+        Hold off flushes while the caller uses the repository directly.
+
+        The writer thread shares the repository's connection, so other
+        transactions on it (e.g. archive_samples) must not interleave
+        with a batch write. Samples keep queueing meanwhile.
+        """
+        with self._lock:
+            yield
 
     def _writer_loop(self) -> None:
         """Background writer loop."""
-        batch: List[Dict[str, Any]] = []
-        last_flush = time.time()
-
-        while self._running or not self._queue.empty():
+        while self._running:
             try:
-                # Get sample with timeout to allow periodic flushes
-                try:
-                    sample = self._queue.get(timeout=0.1)
-                    batch.append(sample)
-                except queue.Empty:
-                    pass
-
-                # Flush if batch full or interval elapsed
-                now = time.time()
-                should_flush = len(batch) >= self.batch_size or (
-                    batch and now - last_flush >= self.flush_interval
-                )
-
-                if should_flush and batch:
-                    self._write_batch(batch)
-                    batch.clear()
-                    last_flush = now
+                # Wake on a full batch or once per flush interval
+                self._wake.wait(timeout=self.flush_interval)
+                self._wake.clear()
+                self._flush()
 
             except Exception as e:
                 logger.error(f"Writer loop error: {e}", exc_info=True)
                 time.sleep(0.1)
 
         # Final flush
-        if batch:
-            self._write_batch(batch)
+        self._flush()
 
     def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
         """Write batch to repository."""
         try:
             start = time.time()
-            count = self.repository.write_samples(batch)
+            if self._write_columnar is not None:
+                count = self._write_columnar(_to_columns(batch))
+            else:
+                count = self.repository.write_samples(batch)
             elapsed = time.time() - start
 
             self._written_count += count
@@ -156,23 +175,59 @@ class BatchWriter:
 
     def _flush(self) -> None:
         """Flush all queued samples."""
-        batch = []
-        while not self._queue.empty():
-            try:
-                batch.append(self._queue.get_nowait())
-                if len(batch) >= self.batch_size:
-                    self._write_batch(batch)
-                    batch.clear()
-            except queue.Empty:
-                break
+        with self._lock:
+            while batch := self._drain(self.batch_size):
+                self._write_batch(batch)
+
+            previous = self._dropped
+            dropped = self._count_drops()
+            if dropped // 1000 > previous // 1000:
+                logger.warning(f"Queue full, dropped {dropped} samples total")
+
+    def _drain(self, limit: int) -> List[Dict[str, Any]]:
+        """Pop up to limit samples, oldest first."""
+        popleft = self._queue.popleft
+        batch = [popleft() for _ in range(min(limit, len(self._queue)))]
+        self._drained_count += len(batch)
+        return batch
+
+    def _count_drops(self) -> int:
+        """
+        Update and return the number of samples evicted so far.
+
+        Call with _lock held, so no samples are drained meanwhile. The
+        appended count is read before the queue length, so an append
+        racing this call can only make it one low, and the running
+        maximum corrects that on the next call.
 
-        if batch:
-            self._write_batch(batch)
+        Returns:
+            Number of dropped samples
+        """
+        appended = self._appended_count
+        queued = len(self._queue)
+        total = appended - self._drained_count - queued
+        self._dropped = max(self._dropped, total)
+        return self._dropped
 
     def get_stats(self) -> Dict[str, int]:
         """Get writer statistics."""
+        # Mid-flush, report the count from the last flush rather than
+        # block the producer behind a batch write
+        if self._lock.acquire(blocking=False):
+            try:
+                dropped = self._count_drops()
+            finally:
+                self._lock.release()
+        else:
+            dropped = self._dropped
+
         return {
             "written": self._written_count,
-            "dropped": self._dropped_count,
-            "queued": self._queue.qsize(),
+            "dropped": dropped,
+            "queued": len(self._queue),
         }
+
+
+def _to_columns(batch: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """Transpose sample dicts into one list per SAMPLE_COLUMNS column."""
+    return {col: [s.get(col) for s in batch] for col in SAMPLE_COLUMNS}
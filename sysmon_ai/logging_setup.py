@@ -1,11 +1,16 @@
 """Logging configuration with rotating file handler."""
 
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Optional
 
+# Background thread writing queued records to the log file
+_listener: Optional[QueueListener] = None
+
 
 def setup_logging(
     level: str = "INFO",
@@ -16,6 +21,10 @@ def setup_logging(
     """
     Configure application logging with console and file handlers.
 
+    File writes happen on a QueueListener thread: the file logger only
+    enqueues records, so sampling and rendering never block on disk I/O.
+    Console output stays synchronous.
+
     Args:
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Path to log file. If None, logs to console only.
@@ -29,6 +38,7 @@ def setup_logging(
     logger.setLevel(getattr(logging, level.upper()))
 
     # Remove existing handlers
+    stop_logging()
     logger.handlers.clear()
 
     # Format
@@ -55,6 +65,29 @@ def setup_logging(
         )
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+
+        records: queue.Queue = queue.Queue(-1)
+        queue_handler = QueueHandler(records)
+        queue_handler.setLevel(logging.DEBUG)
+        logger.addHandler(queue_handler)
+
+        global _listener
+        _listener = QueueListener(records, file_handler, respect_handler_level=True)
+        _listener.start()
 
     return logger
+
+
+def stop_logging() -> None:
+    """Flush queued file records and stop the listener thread, if any."""
+    global _listener
+    if _listener is None:
+        return
+
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+atexit.register(stop_logging)
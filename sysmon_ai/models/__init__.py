@@ -1,10 +1,26 @@
-"""Models package."""
+"""Models package.
+
+Estimators are imported on first attribute access (PEP 562), so
+importing the package for persistence alone does not load sklearn.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
 from .base import BaseModel
-from .forecaster import MultiMetricForecaster, TimeToThresholdForecaster
-from .isolation_forest import IsolationForestModel
 from .persistence import deserialize_model, serialize_model
 
+if TYPE_CHECKING:
+    from .forecaster import MultiMetricForecaster, TimeToThresholdForecaster
+    from .isolation_forest import IsolationForestModel
+
+# Lazily imported name -> defining submodule
+_LAZY_IMPORTS = {
+    "IsolationForestModel": ".isolation_forest",
+    "TimeToThresholdForecaster": ".forecaster",
+    "MultiMetricForecaster": ".forecaster",
+}
+
 __all__ = [
     "BaseModel",
     "IsolationForestModel",
@@ -13,3 +29,19 @@ __all__ = [
     "serialize_model",
     "deserialize_model",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import estimator classes on first access."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List public names, including not yet imported ones."""
+    return sorted(set(globals()) | set(__all__))
@@ -1,22 +1,25 @@
 """Time-to-threshold forecasting models."""
 
 import logging
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
-from sklearn.ensemble import GradientBoostingRegressor
+from sklearn.ensemble import HistGradientBoostingRegressor
 from sklearn.linear_model import LinearRegression
 
 from sysmon_ai.models.base import BaseModel
 
 logger = logging.getLogger(__name__)
 
+# Names accepted for the gradient boosting forecaster ("gbr" is legacy)
+_BOOSTING_ALGOS = ("gbr", "hgb")
+
 
 class TimeToThresholdForecaster(BaseModel):
     """
     Forecasts time until metric reaches threshold.
 
-    Supports linear regression and gradient boosting.
+    Supports linear regression and histogram gradient boosting.
     """
 
     def __init__(
@@ -29,7 +32,8 @@ class TimeToThresholdForecaster(BaseModel):
         Initialize forecaster.
 
         Args:
-            algo: Algorithm to use ('linear' or 'gbr')
+            algo: Algorithm to use ('linear', or 'hgb'/'gbr' for
+                histogram gradient boosting)
             random_state: Random seed
             confidence_level: Confidence level for intervals
         """
@@ -39,10 +43,14 @@ class TimeToThresholdForecaster(BaseModel):
 
         if algo == "linear":
             self._model = LinearRegression()
-        elif algo == "gbr":
-            self._model = GradientBoostingRegressor(
-                n_estimators=100,
+        elif algo in _BOOSTING_ALGOS:
+            # Binned, multi-threaded split finding; early stopping turns
+            # on by itself for large training sets
+            self._model = HistGradientBoostingRegressor(
+                max_iter=100,
                 max_depth=3,
+                learning_rate=0.1,
+                early_stopping="auto",
                 random_state=random_state,
             )
         else:
@@ -50,6 +58,24 @@ class TimeToThresholdForecaster(BaseModel):
 
         self._std: Optional[float] = None
 
+        # Fitted (coef, intercept) of the linear model, see predict()
+        self._linear: Optional[Tuple[np.ndarray, float]] = None
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore pickled state, deriving linear weights if absent."""
+        self.__dict__.update(state)
+        if "_linear" not in state:
+            self._init_linear()
+
+    def _init_linear(self) -> None:
+        """Cache the fitted linear model's coefficients and intercept."""
+        self._linear = None
+        if self.algo == "linear" and self._is_fitted:
+            self._linear = (
+                np.asarray(self._model.coef_, dtype=np.float64),
+                float(self._model.intercept_),
+            )
+
     def fit(
         self,
         X: np.ndarray,
@@ -69,13 +95,16 @@ class TimeToThresholdForecaster(BaseModel):
             f"Training {self.algo} forecaster on {X.shape[0]} samples..."
         )
         self._model.fit(X, y)
+        self._is_fitted = True
+        self._init_linear()
 
-        # Compute residual std for confidence intervals
-        predictions = self._model.predict(X)
-        residuals = y - predictions
-        self._std = np.std(residuals)
+        # Residual std for confidence intervals, centred in place in the
+        # prediction buffer instead of allocating residual temporaries
+        residuals = np.asarray(self.predict(X), dtype=np.float64)
+        np.subtract(y, residuals, out=residuals)
+        residuals -= residuals.mean()
+        self._std = float(np.sqrt(residuals @ residuals / residuals.size))
 
-        self._is_fitted = True
         logger.info(f"Forecaster training complete (std={self._std:.2f})")
         return self
 
@@ -92,6 +121,12 @@ class TimeToThresholdForecaster(BaseModel):
         if not self._is_fitted:
             raise RuntimeError("Model not fitted")
 
+        # Linear predictions are one matmul; skip sklearn's validation
+        if self._linear is not None:
+            coef, intercept = self._linear
+            minutes: np.ndarray = np.asarray(X, dtype=np.float64) @ coef + intercept
+            return minutes
+
         return self._model.predict(X)
 
     def predict_with_confidence(
@@ -109,18 +144,26 @@ class TimeToThresholdForecaster(BaseModel):
         """
         predictions = self.predict(X)
 
-        if self._std is None:
+        margin = self.interval_margin()
+        if margin is None:
             # No confidence intervals available
             return predictions, predictions, predictions
 
-        # Simple prediction interval using residual std
-        z_score = 1.96 if self.confidence_level >= 0.95 else 1.645
-        margin = z_score * self._std
+        return _with_interval(predictions, margin)
 
-        lower = np.maximum(0, predictions - margin)
-        upper = predictions + margin
+    def interval_margin(self) -> Optional[float]:
+        """
+        Half-width of the prediction interval.
 
-        return predictions, lower, upper
+        Returns:
+            z * residual std, or None before fitting
+        """
+        if self._std is None:
+            return None
+
+        # Simple prediction interval using residual std
+        z_score = 1.96 if self.confidence_level >= 0.95 else 1.645
+        return z_score * self._std
 
     def get_params(self) -> Dict[str, Any]:
         """Get model parameters."""
@@ -173,6 +216,11 @@ class MultiMetricForecaster:
             for metric in metrics
         }
 
+        # Stacked linear weights for predict_all, rebuilt after any fit
+        self._stacked: Optional[
+            Tuple[List[str], np.ndarray, np.ndarray]
+        ] = None
+
     def fit_metric(
         self,
         metric: str,
@@ -191,6 +239,7 @@ class MultiMetricForecaster:
             raise ValueError(f"Unknown metric: {metric}")
 
         self._forecasters[metric].fit(X, y)
+        self._stacked = None
 
     def predict_metric(
         self,
@@ -212,6 +261,89 @@ class MultiMetricForecaster:
 
         return self._forecasters[metric].predict_with_confidence(X)
 
+    def predict_all(
+        self,
+        X: np.ndarray,
+    ) -> Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Predict time-to-threshold for every fitted metric.
+
+        Linear forecasters share one (n_metrics, n_features) weight
+        matrix, so all metrics are predicted with a single matmul.
+
+        Args:
+            X: Feature matrix
+
+        Returns:
+            Dict mapping metric to (predictions, lower, upper)
+        """
+        if self.algo != "linear":
+            return {
+                metric: forecaster.predict_with_confidence(X)
+                for metric, forecaster in self._forecasters.items()
+                if forecaster.is_fitted()
+            }
+
+        names, weights, intercepts = self._stacked_linear()
+        if not names:
+            return {}
+
+        predictions = X @ weights.T + intercepts
+
+        results = {}
+        for j, metric in enumerate(names):
+            pred = predictions[:, j]
+            margin = self._forecasters[metric].interval_margin()
+            if margin is None:
+                results[metric] = (pred, pred, pred)
+            else:
+                results[metric] = _with_interval(pred, margin)
+        return results
+
+    def _stacked_linear(self) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """Stack coefficients and intercepts of fitted linear forecasters."""
+        if self._stacked is None:
+            fitted = [
+                (metric, forecaster._model)
+                for metric, forecaster in self._forecasters.items()
+                if forecaster.is_fitted()
+            ]
+            names = [metric for metric, _ in fitted]
+            if fitted:
+                weights = np.stack([model.coef_ for _, model in fitted])
+                intercepts = np.array(
+                    [model.intercept_ for _, model in fitted]
+                )
+            else:
+                weights = np.empty((0, 0))
+                intercepts = np.empty(0)
+            self._stacked = (names, weights, intercepts)
+        return self._stacked
+
     def is_fitted(self, metric: str) -> bool:
         """Check if metric forecaster is fitted."""
         return self._forecasters[metric].is_fitted()
+
+
+def _with_interval(
+    predictions: np.ndarray, margin: float
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Build (predictions, lower, upper) as rows of one (3, n) array.
+
+    Lower bounds are clipped at zero in place, so the interval costs one
+    allocation instead of a temporary per bound.
+
+    Args:
+        predictions: Predicted minutes
+        margin: Interval half-width
+
+    Returns:
+        Tuple of (predictions, lower_bounds, upper_bounds) views
+    """
+    out = np.empty((3, predictions.shape[0]), dtype=np.float64)
+    out[0] = predictions
+    np.subtract(out[0], margin, out=out[1])
+    np.maximum(out[1], 0, out=out[1])
+    np.add(out[0], margin, out=out[2])
+    return out[0], out[1], out[2]
@@ -1,15 +1,23 @@
 """Isolation Forest anomaly detection model."""
 
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, ContextManager, Dict, Optional
 
+import joblib
 import numpy as np
 from sklearn.ensemble import IsolationForest as SklearnIF
 
 from sysmon_ai.models.base import BaseModel
+from sysmon_ai.utils import get_cpu_count
+from sysmon_ai.utils.stats import quantile
 
 logger = logging.getLogger(__name__)
 
+# Thread cap for tree building/scoring, and the size below which one
+# thread is faster than dispatching work to several
+_MAX_JOBS = 4
+_PARALLEL_MIN_SAMPLES = 2048
+
 
 class IsolationForestModel(BaseModel):
     """
@@ -44,7 +52,7 @@ class IsolationForestModel(BaseModel):
             max_samples=max_samples,
             contamination=contamination,
             random_state=random_state,
-            n_jobs=-1,
+            n_jobs=None,  # Set per call by _parallel()
         )
 
         self._threshold: Optional[float] = None
@@ -63,7 +71,8 @@ class IsolationForestModel(BaseModel):
             Self for chaining
         """
         logger.info(f"Training Isolation Forest on {X.shape[0]} samples...")
-        self._model.fit(X)
+        with _parallel(X.shape[0]):
+            self._model.fit(X)
         self._is_fitted = True
         logger.info("Isolation Forest training complete")
         return self
@@ -81,7 +90,8 @@ class IsolationForestModel(BaseModel):
         if not self._is_fitted:
             raise RuntimeError("Model not fitted")
 
-        return self._model.predict(X)
+        with _parallel(X.shape[0]):
+            return self._model.predict(X)
 
     def score_samples(self, X: np.ndarray) -> np.ndarray:
         """
@@ -96,7 +106,8 @@ class IsolationForestModel(BaseModel):
         if not self._is_fitted:
             raise RuntimeError("Model not fitted")
 
-        return self._model.score_samples(X)
+        with _parallel(X.shape[0]):
+            return self._model.score_samples(X)
 
     def decision_function(self, X: np.ndarray) -> np.ndarray:
         """
@@ -126,10 +137,7 @@ class IsolationForestModel(BaseModel):
             Calibrated threshold
         """
         scores = self.score_samples(X_val)
-
-        # Find threshold at target percentile
-        percentile = target_fpr * 100
-        threshold = np.percentile(scores, percentile)
+        threshold = quantile(scores, target_fpr)
 
         self._threshold = threshold
         logger.info(
@@ -145,14 +153,29 @@ class IsolationForestModel(BaseModel):
         Args:
             X: Feature matrix
 
+        Returns:
+            Boolean array (True = anomaly)
+        """
+        return self.apply_threshold(self.score_samples(X))
+
+    def apply_threshold(self, scores: np.ndarray) -> np.ndarray:
+        """
+        Apply calibrated threshold to precomputed scores.
+
+        Lets callers that already hold score_samples output get labels
+        without scoring the feature matrix a second time.
+
+        Args:
+            scores: Anomaly scores from score_samples
+
         Returns:
             Boolean array (True = anomaly)
         """
         if self._threshold is None:
             raise RuntimeError("Threshold not calibrated")
 
-        scores = self.score_samples(X)
-        return scores < self._threshold
+        labels: np.ndarray = np.less(scores, self._threshold)
+        return labels
 
     def get_threshold(self) -> Optional[float]:
         """Get current threshold."""
@@ -171,3 +194,24 @@ class IsolationForestModel(BaseModel):
             "random_state": self.random_state,
             "threshold": self._threshold,
         }
+
+
+def _parallel(n_samples: int) -> ContextManager[Any]:
+    """
+    joblib context for sklearn's parallel loops over trees.
+
+    Uses threads (the tree code releases the GIL), at most _MAX_JOBS of
+    them, and a single one for small inputs.
+
+    Args:
+        n_samples: Number of rows being fitted or scored
+
+    Returns:
+        parallel_backend context manager
+    """
+    if n_samples < _PARALLEL_MIN_SAMPLES:
+        n_jobs = 1
+    else:
+        n_jobs = min(_MAX_JOBS, get_cpu_count())
+    backend: ContextManager[Any] = joblib.parallel_backend("threading", n_jobs=n_jobs)
+    return backend
@@ -2,17 +2,49 @@
 
 import io
 import logging
-from typing import Any
+from types import ModuleType
+from typing import Any, BinaryIO, Optional, Union
 
 import joblib
 
+# Declared up front: zstandard ships type hints, so the None fallback
+# would not type-check against the module type
+zstandard: Optional[ModuleType]
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import lz4
+except ImportError:
+    lz4 = None
+
 logger = logging.getLogger(__name__)
 
+# Frame magic number of zstd-compressed blobs
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+_ZSTD_LEVEL = 6
+
+# Pickles up to this size are stored uncompressed
+_COMPRESS_MIN_BYTES = 64 * 1024
+
+# joblib's own codec when zstandard is missing: lz4 if available
+_JOBLIB_COMPRESS: Any = ("lz4", 3) if lz4 is not None else 3
+
 
 def serialize_model(model: Any) -> bytes:
     """
     Serialize model to bytes using joblib.
 
+    With zstandard installed the uncompressed joblib pickle is wrapped in
+    a zstd frame, which is smaller and much faster to decompress than
+    joblib's zlib. Otherwise joblib compresses with lz4 when installed
+    (several times faster than zlib at similar ratios on model arrays),
+    falling back to zlib. Pickles of at most _COMPRESS_MIN_BYTES (e.g. a
+    linear forecaster) are returned uncompressed, since compressing them
+    costs more than it saves.
+
     Args:
         model: Model object to serialize
 
@@ -20,19 +52,51 @@ def serialize_model(model: Any) -> bytes:
         Serialized model bytes
     """
     buffer = io.BytesIO()
-    joblib.dump(model, buffer, compress=3)
-    return buffer.getvalue()
+    joblib.dump(model, buffer)
+
+    if buffer.tell() <= _COMPRESS_MIN_BYTES:
+        return buffer.getvalue()
 
+    if zstandard is None:
+        buffer = io.BytesIO()
+        joblib.dump(model, buffer, compress=_JOBLIB_COMPRESS)
+        return buffer.getvalue()
 
-def deserialize_model(blob: bytes) -> Any:
+    compressor = zstandard.ZstdCompressor(level=_ZSTD_LEVEL)
+    compressed: bytes = compressor.compress(buffer.getbuffer())
+    return compressed
+
+
+def deserialize_model(blob: Union[bytes, BinaryIO]) -> Any:
     """
-    Deserialize model from bytes.
+    Deserialize model from bytes or a binary stream.
+
+    Accepts both zstd-wrapped blobs and plain joblib output (including
+    blobs written before zstd support), detected by magic number; joblib
+    identifies its own zlib or lz4 codec from the stream header.
 
     Args:
-        blob: Serialized model bytes
+        blob: Serialized model bytes, or a seekable binary file object
+            (e.g. from Repository.open_model_blob)
 
     Returns:
         Deserialized model object
     """
-    buffer = io.BytesIO(blob)
-    return joblib.load(buffer)
+    if isinstance(blob, (bytes, bytearray, memoryview)):
+        fileobj: BinaryIO = io.BytesIO(blob)
+    else:
+        fileobj = blob
+
+    magic = fileobj.read(len(_ZSTD_MAGIC))
+    fileobj.seek(-len(magic), io.SEEK_CUR)
+
+    if magic == _ZSTD_MAGIC:
+        if zstandard is None:
+            raise RuntimeError(
+                "Model blob is zstd-compressed but zstandard is not "
+                "installed (pip install zstandard)"
+            )
+        decompressor = zstandard.ZstdDecompressor()
+        fileobj = io.BytesIO(decompressor.decompress(fileobj.read()))
+
+    return joblib.load(fileobj)
@@ -1,7 +1,29 @@
-"""UI package."""
+"""UI package.
 
-from .dashboard import Dashboard
-from .panels import AlertsPanel, ForecastPanel, MetricPanel, SystemStatsPanel
+Dashboard and panels are imported on first attribute access (PEP 562),
+so importing the package does not load Rich.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .dashboard import Dashboard
+    from .panels import (
+        AlertsPanel,
+        ForecastPanel,
+        MetricPanel,
+        SystemStatsPanel,
+    )
+
+# Lazily imported name -> defining submodule
+_LAZY_IMPORTS = {
+    "Dashboard": ".dashboard",
+    "MetricPanel": ".panels",
+    "SystemStatsPanel": ".panels",
+    "AlertsPanel": ".panels",
+    "ForecastPanel": ".panels",
+}
 
 __all__ = [
     "Dashboard",
@@ -10,3 +32,19 @@ __all__ = [
     "AlertsPanel",
     "ForecastPanel",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import UI classes on first access."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List public names, including not yet imported ones."""
+    return sorted(set(globals()) | set(__all__))
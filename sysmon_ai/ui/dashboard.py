@@ -3,8 +3,9 @@
 import logging
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 from rich.console import Console
 from rich.layout import Layout
 from rich.live import Live
@@ -16,6 +17,31 @@ from sysmon_ai.utils import format_duration, get_hostname
 
 logger = logging.getLogger(__name__)
 
+# Sample fields kept in the history matrix, in sample-row order
+_HISTORY_FIELDS = (
+    "cpu_pct",
+    "mem_pct",
+    "disk_read_bps",
+    "disk_write_bps",
+    "net_up_bps",
+    "net_down_bps",
+)
+
+# Position of each metric in sample rows and history; columns from disk_read
+# onward are in MB/s
+_HISTORY_INDEX = {
+    "cpu": 0,
+    "mem": 1,
+    "disk_read": 2,
+    "disk_write": 3,
+    "net_up": 4,
+    "net_down": 5,
+}
+_FIRST_RATE_COLUMN = 2
+
+# Sparkline axis of the percentage panels
+_PCT_BOUNDS = (0.0, 100.0)
+
 
 class Dashboard:
     """
@@ -40,25 +66,71 @@ class Dashboard:
         self.show_forecasts = show_forecasts
         self.console = Console()
 
-        # Metric history
-        self._history: Dict[str, List[float]] = {
-            "cpu": [],
-            "mem": [],
-            "disk_read": [],
-            "disk_write": [],
-            "net_up": [],
-            "net_down": [],
-        }
+        # Metric history: a fixed float32 ring buffer with one slot per
+        # frame, so a frame never grows, slices or reallocates it. Stored
+        # metric-major, so each metric's history is one contiguous run
+        # for the sparkline reductions (2.4 KB in total)
         self._max_history = 100
+        self._history = np.zeros(
+            (len(_HISTORY_FIELDS), self._max_history), dtype=np.float32
+        )
+        self._write_idx = 0
+        self._filled = 0
 
-        # Panels
-        self.cpu_panel = MetricPanel("CPU", "%")
-        self.mem_panel = MetricPanel("Memory", "%")
+        # Panels; percentages are drawn on a fixed 0-100 axis
+        self.cpu_panel = MetricPanel("CPU", "%", bounds=_PCT_BOUNDS)
+        self.mem_panel = MetricPanel("Memory", "%", bounds=_PCT_BOUNDS)
         self.disk_panel = MetricPanel("Disk I/O", "MB/s")
         self.net_panel = MetricPanel("Network", "MB/s")
 
         self._start_time = time.time()
 
+        # (epoch second, uptime, clock) strings shown in the header
+        self._time_cache: Tuple[int, str, str] = (-1, "", "")
+
+        # Footer: static controls text, and the last (stats, panel) pair
+        self._footer_static = self._build_footer_controls()
+        self._footer_cache: Optional[Tuple[Any, Panel]] = None
+
+        # Layout tree, built once; frames only update its leaves
+        self._layout = self._build_layout()
+
+        # Frame key of the last rendered frame (see _frame_key)
+        self._last_key: Optional[Tuple[Any, ...]] = None
+
+    @staticmethod
+    def _build_layout() -> Layout:
+        """Build the dashboard layout skeleton."""
+        layout = Layout()
+        layout.split_column(
+            Layout(name="header", size=3),
+            Layout(name="body"),
+            Layout(name="footer", size=3),
+        )
+
+        # Body: metrics on the left, alerts and forecasts on the right
+        layout["body"].split_row(
+            Layout(name="left"),
+            Layout(name="right"),
+        )
+        layout["left"].split_row(
+            Layout(name="cpu_mem"),
+            Layout(name="io"),
+        )
+        layout["cpu_mem"].split_column(
+            Layout(name="cpu"),
+            Layout(name="mem"),
+        )
+        layout["io"].split_column(
+            Layout(name="disk"),
+            Layout(name="net"),
+        )
+        layout["right"].split_column(
+            Layout(name="alerts", ratio=2),
+            Layout(name="forecasts", ratio=1),
+        )
+        return layout
+
     def render_frame(
         self,
         sample: Dict[str, Any],
@@ -80,72 +152,40 @@ class Dashboard:
         Returns:
             Rendered Layout
         """
-        # Update history
-        self._update_history(sample)
-
-        # Create layout
-        layout = Layout()
-        layout.split_column(
-            Layout(name="header", size=3),
-            Layout(name="body"),
-            Layout(name="footer", size=3),
+        # Read the displayed fields once, as one float32 row
+        row = self._sample_row(sample)
+        self._update_history(row)
+        cpu, mem, disk_read_mb, disk_write_mb, net_up_mb, net_down_mb = (
+            row.tolist()
         )
 
+        layout = self._layout
+
         # Header
         layout["header"].update(self._render_header(sample))
 
-        # Body
-        body_layout = Layout()
-        body_layout.split_row(
-            Layout(name="left"),
-            Layout(name="right"),
-        )
-
-        # Left: metrics
-        left_layout = Layout()
-        left_layout.split_row(
-            Layout(name="cpu_mem"),
-            Layout(name="io"),
-        )
-
-        cpu_mem_layout = Layout()
-        cpu_mem_layout.split_column(
-            Layout(name="cpu"),
-            Layout(name="mem"),
-        )
-
-        io_layout = Layout()
-        io_layout.split_column(
-            Layout(name="disk"),
-            Layout(name="net"),
-        )
-
         # Render metric panels
         anomalies = anomalies or {}
 
-        cpu_mem_layout["cpu"].update(
+        layout["cpu"].update(
             self.cpu_panel.render(
-                sample.get("cpu_pct", 0),
-                self._history["cpu"],
+                cpu,
+                self._view("cpu"),
                 threshold=90,
                 is_anomaly=anomalies.get("cpu", False),
             )
         )
 
-        cpu_mem_layout["mem"].update(
+        layout["mem"].update(
             self.mem_panel.render(
-                sample.get("mem_pct", 0),
-                self._history["mem"],
+                mem,
+                self._view("mem"),
                 threshold=90,
                 is_anomaly=anomalies.get("mem", False),
             )
         )
 
-        disk_read_mb = sample.get("disk_read_bps", 0) / 1e6
-        disk_write_mb = sample.get("disk_write_bps", 0) / 1e6
-        disk_read_mb + disk_write_mb
-
-        io_layout["disk"].update(
+        layout["disk"].update(
             Panel(
                 Text(f"Read:  {disk_read_mb:>8.2f} MB/s\n", style="cyan")
                 + Text(f"Write: {disk_write_mb:>8.2f} MB/s", style="magenta"),
@@ -154,10 +194,7 @@ class Dashboard:
             )
         )
 
-        net_up_mb = sample.get("net_up_bps", 0) / 1e6
-        net_down_mb = sample.get("net_down_bps", 0) / 1e6
-
-        io_layout["net"].update(
+        layout["net"].update(
             Panel(
                 Text(f"Upload:   {net_up_mb:>8.2f} MB/s\n", style="cyan")
                 + Text(f"Download: {net_down_mb:>8.2f} MB/s", style="magenta"),
@@ -166,27 +203,13 @@ class Dashboard:
             )
         )
 
-        left_layout["cpu_mem"].update(cpu_mem_layout)
-        left_layout["io"].update(io_layout)
-
-        # Right: alerts and forecasts
-        right_layout = Layout()
+        # Right: alerts, with forecasts hidden when off or empty
+        show_forecasts = bool(self.show_forecasts and forecasts)
+        layout["forecasts"].visible = show_forecasts
+        if show_forecasts and forecasts:
+            layout["forecasts"].update(ForecastPanel.render(forecasts))
 
-        if self.show_forecasts and forecasts:
-            right_layout.split_column(
-                Layout(name="alerts", ratio=2),
-                Layout(name="forecasts", ratio=1),
-            )
-            right_layout["forecasts"].update(ForecastPanel.render(forecasts))
-        else:
-            right_layout.split_column(Layout(name="alerts"))
-
-        right_layout["alerts"].update(AlertsPanel.render(alerts or []))
-
-        body_layout["left"].update(left_layout)
-        body_layout["right"].update(right_layout)
-
-        layout["body"].update(body_layout)
+        layout["alerts"].update(AlertsPanel.render(alerts or []))
 
         # Footer
         layout["footer"].update(self._render_footer(db_stats))
@@ -195,9 +218,10 @@ class Dashboard:
 
     def _render_header(self, sample: Dict[str, Any]) -> Panel:
         """Render header bar."""
-        uptime = format_duration(time.time() - self._start_time)
-        host = sample.get("host", get_hostname())
-        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        uptime, now = self._header_times()
+        host = sample.get("host")
+        if host is None:
+            host = get_hostname()
 
         header_text = Text()
         header_text.append("🖥️  ", style="bold")
@@ -210,8 +234,21 @@ class Dashboard:
 
         return Panel(header_text, style="bold white on blue")
 
-    def _render_footer(self, db_stats: Optional[Dict[str, Any]]) -> Panel:
-        """Render footer bar."""
+    def _header_times(self) -> Tuple[str, str]:
+        """Return uptime and clock strings, recomputed once per second."""
+        current = time.time()
+        second = int(current)
+        if second != self._time_cache[0]:
+            self._time_cache = (
+                second,
+                format_duration(current - self._start_time),
+                datetime.fromtimestamp(current).strftime("%Y-%m-%d %H:%M:%S"),
+            )
+        return self._time_cache[1], self._time_cache[2]
+
+    @staticmethod
+    def _build_footer_controls() -> Text:
+        """Build the footer's static controls text."""
         footer_text = Text()
         footer_text.append("Controls: ", style="bold")
         footer_text.append("[q]", style="bold red")
@@ -220,31 +257,91 @@ class Dashboard:
         footer_text.append(" toggle forecast  ", style="dim")
         footer_text.append("[r]", style="bold green")
         footer_text.append(" reload", style="dim")
+        return footer_text
 
+    def _render_footer(self, db_stats: Optional[Dict[str, Any]]) -> Panel:
+        """Render footer bar, reusing the last panel if stats are unchanged."""
+        stats = None
         if db_stats:
-            samples = db_stats.get("sample_count", 0)
-            size_mb = db_stats.get("db_size_mb", 0)
+            stats = (
+                db_stats.get("sample_count", 0),
+                db_stats.get("db_size_mb", 0),
+            )
+
+        if self._footer_cache is not None and self._footer_cache[0] == stats:
+            return self._footer_cache[1]
+
+        footer_text = self._footer_static.copy()
+        if stats is not None:
+            samples, size_mb = stats
             footer_text.append(
                 f"  |  DB: {samples:,} samples, {size_mb:.1f} MB", style="dim"
             )
 
-        return Panel(footer_text, style="white on black")
+        panel = Panel(footer_text, style="white on black")
+        self._footer_cache = (stats, panel)
+        return panel
+
+    @staticmethod
+    def _sample_row(sample: Dict[str, Any]) -> np.ndarray:
+        """
+        Convert a sample to a float32 row in _HISTORY_FIELDS order.
 
-    def _update_history(self, sample: Dict[str, Any]) -> None:
-        """Update metric history."""
-        self._history["cpu"].append(sample.get("cpu_pct", 0))
-        self._history["mem"].append(sample.get("mem_pct", 0))
-        self._history["disk_read"].append(sample.get("disk_read_bps", 0) / 1e6)
-        self._history["disk_write"].append(
-            sample.get("disk_write_bps", 0) / 1e6
+        Missing fields are 0; byte rates are converted to MB/s.
+        """
+        row = np.array(
+            [sample.get(field, 0) for field in _HISTORY_FIELDS],
+            dtype=np.float32,
         )
-        self._history["net_up"].append(sample.get("net_up_bps", 0) / 1e6)
-        self._history["net_down"].append(sample.get("net_down_bps", 0) / 1e6)
+        row[_FIRST_RATE_COLUMN:] /= 1e6
+        return row
+
+    def _update_history(self, row: np.ndarray) -> None:
+        """Update metric history with a _sample_row() row."""
+        i = self._write_idx
+        self._history[:, i] = row
 
-        # Trim history
-        for key in self._history:
-            if len(self._history[key]) > self._max_history:
-                self._history[key] = self._history[key][-self._max_history :]
+        self._write_idx = (i + 1) % self._max_history
+        self._filled = min(self._filled + 1, self._max_history)
+
+    def _view(self, key: str) -> np.ndarray:
+        """
+        Return a metric's history oldest first.
+
+        Args:
+            key: History key
+
+        Returns:
+            float32 array of up to _max_history values
+        """
+        buffer: np.ndarray = self._history[_HISTORY_INDEX[key]]
+        if self._filled < self._max_history:
+            return buffer[: self._filled]
+        i = self._write_idx
+        return np.concatenate((buffer[i:], buffer[:i]))
+
+    def _frame_key(
+        self,
+        sample: Dict[str, Any],
+        alerts: Optional[List[Dict[str, Any]]],
+    ) -> Tuple[Any, ...]:
+        """
+        Summarize what a frame shows, to skip re-rendering idle frames.
+
+        The timestamp is included so a new sample with unchanged values
+        is still rendered and recorded in the history.
+        """
+        return (
+            sample.get("ts"),
+            sample.get("cpu_pct"),
+            sample.get("mem_pct"),
+            sample.get("disk_read_bps"),
+            sample.get("disk_write_bps"),
+            sample.get("net_up_bps"),
+            sample.get("net_down_bps"),
+            len(alerts or ()),
+            self.show_forecasts,
+        )
 
     def run_live(
         self,
@@ -255,10 +352,15 @@ class Dashboard:
         Run live dashboard with data callback.
 
         Args:
-            data_callback: Callable that returns
-                (sample, anomalies, alerts, forecasts, db_stats)
+            data_callback: Callable that returns a sequence of
+                (sample, anomalies, alerts, forecasts, db_stats); it may
+                reuse the same sequence between calls
             stop_event: Threading event to signal stop
         """
+        if not self.console.is_terminal:
+            self._run_headless(data_callback, stop_event)
+            return
+
         with Live(
             self.render_frame({}, {}, [], {}, {}),
             refresh_per_second=1 / self.refresh_rate,
@@ -269,13 +371,47 @@ class Dashboard:
                     data = data_callback()
                     if data:
                         sample, anomalies, alerts, forecasts, db_stats = data
-                        layout = self.render_frame(
-                            sample, anomalies, alerts, forecasts, db_stats
-                        )
-                        live.update(layout)
+                        key = self._frame_key(sample, alerts)
+                        if key != self._last_key:
+                            layout = self.render_frame(
+                                sample, anomalies, alerts, forecasts, db_stats
+                            )
+                            live.update(layout)
+                            self._last_key = key
                 except KeyboardInterrupt:
                     break
                 except Exception as e:
                     logger.error(f"Dashboard error: {e}", exc_info=True)
 
                 time.sleep(self.refresh_rate)
+
+    def _run_headless(
+        self,
+        data_callback: Any,
+        stop_event: Any,
+    ) -> None:
+        """
+        Log a one-line summary per refresh instead of rendering.
+
+        Used when the console is not a terminal (piped output, CI), where
+        a full Rich render per frame would be wasted work.
+
+        Args:
+            data_callback: Same callback as run_live()
+            stop_event: Threading event to signal stop
+        """
+        while not stop_event.is_set():
+            try:
+                data = data_callback()
+                if data:
+                    sample = data[0]
+                    logger.info(
+                        f"cpu={sample.get('cpu_pct', 0.0):.1f}% "
+                        f"mem={sample.get('mem_pct', 0.0):.1f}%"
+                    )
+            except KeyboardInterrupt:
+                break
+            except Exception as e:
+                logger.error(f"Dashboard error: {e}", exc_info=True)
+
+            time.sleep(self.refresh_rate)
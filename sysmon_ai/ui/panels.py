@@ -1,8 +1,10 @@
 """Rich terminal dashboard panels."""
 
 import logging
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
+import numpy as np
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
@@ -15,21 +17,29 @@ logger = logging.getLogger(__name__)
 class MetricPanel:
     """Base metric panel for dashboard."""
 
-    def __init__(self, title: str, unit: str = "%"):
+    def __init__(
+        self,
+        title: str,
+        unit: str = "%",
+        bounds: Optional[Tuple[float, float]] = None,
+    ):
         """
         Initialize metric panel.
 
         Args:
             title: Panel title
             unit: Measurement unit
+            bounds: Fixed (min, max) sparkline axis; if None, the axis
+                follows the history's own range
         """
         self.title = title
         self.unit = unit
+        self.bounds = bounds
 
     def render(
         self,
         current: float,
-        history: List[float],
+        history: Union[Sequence[float], np.ndarray],
         threshold: Optional[float] = None,
         is_anomaly: bool = False,
     ) -> Panel:
@@ -60,8 +70,11 @@ class MetricPanel:
         content.append(f"{current:.1f}{self.unit}\n", style=f"bold {color}")
 
         # Sparkline
-        if history:
-            spark = sparkline(history)
+        if len(history):
+            if self.bounds is None:
+                spark = sparkline(history)
+            else:
+                spark = sparkline(history, *self.bounds)
             content.append(f"Trend: {spark}\n", style="dim")
 
         # Bar
@@ -128,8 +141,7 @@ class AlertsPanel:
             )
 
         content = Text()
-        for alert in alerts[:max_alerts]:
-            alert.get("ts", 0)
+        for alert in islice(alerts, max_alerts):
             msg = alert.get("explanation", "Unknown")
             alert_type = alert.get("type", "anomaly")
 
@@ -139,7 +151,7 @@ class AlertsPanel:
 
         border_color = (
             "red"
-            if any(a.get("type") == "anomaly" for a in alerts[:3])
+            if any(a.get("type") == "anomaly" for a in islice(alerts, 3))
             else "yellow"
         )
 
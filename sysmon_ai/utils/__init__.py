@@ -1,10 +1,14 @@
 """Utilities package."""
 
+from typing import Any
+
+from . import platform as _platform
 from .platform import (
     can_render_unicode,
     get_cpu_count,
     get_hostname,
     get_os_info,
+    get_os_version,
     get_platform,
     is_linux,
     is_macos,
@@ -16,6 +20,7 @@ from .timeutils import (
     format_duration,
     get_time_range,
     now_utc,
+    now_utc_ns,
     now_utc_ts,
     parse_duration,
     ts_to_local,
@@ -27,6 +32,7 @@ __all__ = [
     "horizontal_bar",
     "mini_histogram",
     "now_utc_ts",
+    "now_utc_ns",
     "now_utc",
     "ts_to_utc",
     "ts_to_local",
@@ -41,5 +47,18 @@ __all__ = [
     "get_cpu_count",
     "get_hostname",
     "get_os_info",
+    "get_os_version",
     "can_render_unicode",
+    "HOSTNAME",
+    "CPU_COUNT",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Forward the lazy platform constants (HOSTNAME, CPU_COUNT)."""
+    if name not in _platform._LAZY_CONSTANTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(_platform, name)
+    globals()[name] = value
+    return value
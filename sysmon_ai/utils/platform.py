@@ -2,6 +2,8 @@
 
 import platform
 import sys
+from functools import lru_cache
+from typing import Any, Callable
 
 
 def get_platform() -> str:
@@ -29,10 +31,13 @@ def is_windows() -> bool:
     return sys.platform == "win32"
 
 
+@lru_cache(maxsize=1)
 def supports_cpu_temp() -> bool:
     """
     Check if platform supports CPU temperature reading.
 
+    The answer cannot change within a process, so it is computed once.
+
     Returns:
         True if CPU temp is available
     """
@@ -40,15 +45,17 @@ def supports_cpu_temp() -> bool:
     return is_linux()
 
 
+@lru_cache(maxsize=1)
 def get_cpu_count() -> int:
-    """Get number of CPU cores."""
+    """Get number of CPU cores (looked up once per process)."""
     import os
 
     return os.cpu_count() or 1
 
 
+@lru_cache(maxsize=1)
 def get_hostname() -> str:
-    """Get system hostname."""
+    """Get system hostname (looked up once per process)."""
     return platform.node()
 
 
@@ -56,21 +63,47 @@ def get_os_info() -> dict[str, str]:
     """
     Get OS information.
 
+    The platform lookups are done once; each call returns a fresh copy.
+    The detailed OS version is left out because it can be slow to query
+    (see get_os_version).
+
     Returns:
-        Dict with system, release, version, machine
+        Dict with system, release, machine
     """
-    return {
-        "system": platform.system(),
-        "release": platform.release(),
-        "version": platform.version(),
-        "machine": platform.machine(),
-    }
+    return dict(_os_info())
+
 
+@lru_cache(maxsize=1)
+def _os_info() -> tuple[tuple[str, str], ...]:
+    """Query OS information once per process."""
+    return (
+        ("system", platform.system()),
+        ("release", platform.release()),
+        ("machine", platform.machine()),
+    )
 
+
+@lru_cache(maxsize=1)
+def get_os_version() -> str:
+    """
+    Get the detailed OS version string.
+
+    platform.version() runs sw_vers on macOS and reads the registry on
+    Windows, so it is only queried on demand, once per process.
+
+    Returns:
+        OS version string (may be empty if unknown)
+    """
+    return platform.version()
+
+
+@lru_cache(maxsize=1)
 def can_render_unicode() -> bool:
     """
     Check if terminal supports Unicode rendering.
 
+    The check runs against the stdout of the first call and is cached.
+
     Returns:
         True if Unicode is supported
     """
@@ -81,3 +114,22 @@ def can_render_unicode() -> bool:
         return True
     except (AttributeError, UnicodeEncodeError):
         return False
+
+
+# Module constants resolved on first access (PEP 562), so importing this
+# module does not look up values a command may never use
+_LAZY_CONSTANTS: dict[str, Callable[[], Any]] = {
+    "HOSTNAME": get_hostname,
+    "CPU_COUNT": get_cpu_count,
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve HOSTNAME and CPU_COUNT on first access."""
+    getter = _LAZY_CONSTANTS.get(name)
+    if getter is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getter()
+    globals()[name] = value
+    return value
@@ -1,10 +1,47 @@
-"""ASCII sparkline generation for terminal display."""
+"""ASCII sparkline generation for terminal display.
 
-from typing import List, Optional
+numpy is imported inside the array functions: sysmon_ai.utils is loaded
+by every CLI command, most of which never draw a sparkline.
+"""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple, Union
+
+from sysmon_ai.utils.platform import can_render_unicode
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Block characters (8 levels)
+_BLOCKS = (" ", "▁", "▂", "▃", "▄", "▅", "▆", "▇", "█")
+
+# Same levels for terminals that cannot encode the block characters
+_ASCII_BLOCKS = " .:-=+*#@"
+
+
+def _level_table() -> Tuple[Sequence[str], "np.ndarray", str]:
+    """Return the level table the current terminal can render."""
+    return _build_level_table(can_render_unicode())
+
+
+@lru_cache(maxsize=2)
+def _build_level_table(unicode: bool) -> Tuple[Sequence[str], "np.ndarray", str]:
+    """
+    Build a (characters, code points, codec) table for decoding levels.
+
+    The Unicode code points come from viewing a '<U1' array, which stores
+    exactly one little-endian UTF-32 code point per character.
+    """
+    import numpy as np
+
+    if unicode:
+        return _BLOCKS, np.array(_BLOCKS, dtype="<U1").view("<u4"), "utf-32-le"
+    codes = np.frombuffer(_ASCII_BLOCKS.encode("ascii"), dtype=np.uint8)
+    return _ASCII_BLOCKS, codes, "ascii"
 
 
 def sparkline(
-    data: List[float],
+    data: Union[Sequence[float], "np.ndarray"],
     min_val: Optional[float] = None,
     max_val: Optional[float] = None,
     height: int = 1,
@@ -13,7 +50,7 @@ def sparkline(
     Generate ASCII sparkline from data.
 
     Args:
-        data: List of numeric values
+        data: Sequence of numeric values (list or 1-D array)
         min_val: Minimum value for scaling. If None, uses min(data)
         max_val: Maximum value for scaling. If None, uses max(data)
         height: Height of sparkline (1-8)
@@ -23,31 +60,43 @@ def sparkline(
 
     Examples:
         >>> sparkline([1, 2, 3, 4, 5])
-        '▁▂▃▅█'
+        ' ▂▄▆█'
         >>> sparkline([5, 4, 3, 2, 1])
-        '█▅▃▂▁'
+        '█▆▄▂ '
     """
-    if not data:
+    if len(data) == 0:
         return ""
 
+    blocks, codes, codec = _level_table()
     if len(data) == 1:
-        return "▄"
+        return blocks[4]
 
-    # Block characters (8 levels)
-    blocks = [" ", "▁", "▂", "▃", "▄", "▅", "▆", "▇", "█"]
+    # A fixed axis (e.g. 0-100 for percentages) needs no min/max scan,
+    # but values may then fall outside it and must be clamped
+    clamp = min_val is not None or max_val is not None
+    if min_val is not None and max_val is not None and max_val == min_val:
+        return blocks[4] * len(data)
 
-    min_val = min_val if min_val is not None else min(data)
-    max_val = max_val if max_val is not None else max(data)
+    import numpy as np
 
-    if max_val == min_val:
-        return "▄" * len(data)
+    values = np.asarray(data, dtype=np.float64)
+    if min_val is None:
+        min_val = float(values.min())
+    if max_val is None:
+        max_val = float(values.max())
 
-    # Normalize to 0-8 range
-    normalized = [
-        int(((val - min_val) / (max_val - min_val)) * 8) for val in data
-    ]
+    if max_val == min_val:
+        return blocks[4] * len(values)
 
-    return "".join(blocks[min(n, 8)] for n in normalized)
+    # Normalize to 0-8 levels in one pass, then gather the code points
+    # into one output buffer of len(data) and decode it as a single string.
+    # Dividing before scaling keeps the maximum at exactly 8; scaling by a
+    # precomputed 8 / range can round it down to 7.999... (level 7)
+    levels = (values - min_val) / (max_val - min_val)
+    levels *= 8
+    if clamp:
+        np.clip(levels, 0, 8, out=levels)
+    return codes[levels.astype(np.uint8)].tobytes().decode(codec)
 
 
 def horizontal_bar(
@@ -77,10 +126,14 @@ def horizontal_bar(
     if max_value <= 0:
         return empty * width
 
-    filled_width = int((value / max_value) * width)
-    filled_width = min(filled_width, width)
+    filled_width = min(int((value / max_value) * width), width)
+    return _bar_table(width, filled, empty)[max(filled_width, 0)]
+
 
-    return filled * filled_width + empty * (width - filled_width)
+@lru_cache(maxsize=32)
+def _bar_table(width: int, filled: str, empty: str) -> tuple[str, ...]:
+    """Return every bar of a given style, indexed by filled width."""
+    return tuple(filled * i + empty * (width - i) for i in range(width + 1))
 
 
 def mini_histogram(
@@ -100,32 +153,31 @@ def mini_histogram(
     if not data:
         return [" " * bins]
 
-    min_val = min(data)
-    max_val = max(data)
+    import numpy as np
+
+    values = np.asarray(data, dtype=np.float64)
+    min_val = float(values.min())
+    max_val = float(values.max())
 
     if max_val == min_val:
         return [" " * bins for _ in range(height)]
 
-    # Create bins
-    bin_width = (max_val - min_val) / bins
-    counts = [0] * bins
+    # Same bin assignment as int((val - min) / bin_width) clamped to the
+    # last bin; bincount avoids np.histogram's edge-correction passes
+    bin_idx = ((values - min_val) / ((max_val - min_val) / bins)).astype(
+        np.intp
+    )
+    np.minimum(bin_idx, bins - 1, out=bin_idx)
+    counts = np.bincount(bin_idx, minlength=bins)
 
-    for val in data:
-        bin_idx = int((val - min_val) / bin_width)
-        bin_idx = min(bin_idx, bins - 1)
-        counts[bin_idx] += 1
-
-    max_count = max(counts)
+    max_count = int(counts.max())
     if max_count == 0:
         return [" " * bins for _ in range(height)]
 
-    # Generate lines
-    lines = []
-    for h in range(height, 0, -1):
-        line = ""
-        threshold = (h / height) * max_count
-        for count in counts:
-            line += "█" if count >= threshold else " "
-        lines.append(line)
-
-    return lines
+    # Row h (top first) fills the bins whose count reaches h/height of the
+    # tallest bin; the whole grid is decoded at once and split into lines
+    thresholds = np.arange(height, 0, -1) / height * max_count
+    mask = counts[None, :] >= thresholds[:, None]
+    _, codes, codec = _level_table()
+    text = codes[[0, -1]][mask.view(np.uint8)].tobytes().decode(codec)
+    return [text[i : i + bins] for i in range(0, height * bins, bins)]
@@ -0,0 +1,37 @@
+"""Numeric helpers shared by model and detection code.
+
+Not re-exported from sysmon_ai.utils, so that importing the package (and
+with it the CLI) does not pull in numpy.
+"""
+
+import numpy as np
+
+
+def quantile(values: np.ndarray, q: float, presorted: bool = False) -> float:
+    """
+    Linearly interpolated quantile via partial selection.
+
+    Matches np.percentile(values, q * 100) with the default "linear"
+    method, but selects only the two bracketing order statistics with
+    np.partition instead of going through the general percentile path.
+    Sorted input is indexed directly.
+
+    Args:
+        values: 1-D array of values
+        q: Quantile in [0, 1]
+        presorted: Whether values are already sorted ascending
+
+    Returns:
+        Quantile value
+    """
+    values = np.asarray(values, dtype=np.float64).ravel()
+    if values.size == 0:
+        raise ValueError("Cannot compute quantile of empty array")
+
+    pos = q * (values.size - 1)
+    lo = int(np.floor(pos))
+    hi = min(lo + 1, values.size - 1)
+
+    part = values if presorted else np.partition(values, (lo, hi))
+    frac = pos - lo
+    return float(part[lo] + (part[hi] - part[lo]) * frac)
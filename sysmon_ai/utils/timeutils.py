@@ -1,13 +1,31 @@
 """Time utilities for UTC/local conversions and parsing."""
 
+import re
 import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional, Union
 
+# Integer value with an optional unit suffix (bare numbers are seconds)
+_DURATION_RE = re.compile(r"^\s*([+-]?\d+)\s*([smhdw]?)\s*$", re.IGNORECASE)
+_DURATION_UNITS = {
+    "": 1,
+    "s": 1,
+    "m": 60,
+    "h": 3600,
+    "d": 86400,
+    "w": 604800,
+}
+
 
 def now_utc_ts() -> int:
     """Return current UTC timestamp in seconds."""
-    return int(time.time())
+    return time.time_ns() // 1_000_000_000
+
+
+def now_utc_ns() -> int:
+    """Return current UTC timestamp in nanoseconds."""
+    return time.time_ns()
 
 
 def now_utc() -> datetime:
@@ -25,6 +43,7 @@ def ts_to_local(ts: int) -> datetime:
     return datetime.fromtimestamp(ts)
 
 
+@lru_cache(maxsize=128)
 def parse_duration(duration: str) -> int:
     """
     Parse duration string to seconds.
@@ -41,20 +60,12 @@ def parse_duration(duration: str) -> int:
         >>> parse_duration('7d')
         604800
     """
-    units = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}
-    duration = duration.strip().lower()
-
-    if duration[-1] in units:
-        try:
-            value = int(duration[:-1])
-            return value * units[duration[-1]]
-        except ValueError:
-            raise ValueError(f"Invalid duration format: {duration}")
-    else:
-        try:
-            return int(duration)  # Assume seconds if no unit
-        except ValueError:
-            raise ValueError(f"Invalid duration format: {duration}")
+    match = _DURATION_RE.match(duration)
+    if match is None:
+        raise ValueError(f"Invalid duration format: {duration.strip()}")
+
+    value, unit = match.groups()
+    return int(value) * _DURATION_UNITS[unit.lower()]
 
 
 def format_duration(seconds: Union[int, float]) -> str:
@@ -65,21 +76,29 @@ def format_duration(seconds: Union[int, float]) -> str:
         seconds: Duration in seconds
 
     Returns:
-        Formatted string like '2d 3h 15m'
+        Formatted string like '2d 3h', '5h 12m' or '45s'
     """
-    seconds = int(seconds)
+    return _format_whole_seconds(int(seconds))
+
+
+@lru_cache(maxsize=256)
+def _format_whole_seconds(seconds: int) -> str:
+    """Format whole seconds; cached, as UI callers repeat recent values."""
     if seconds < 60:
         return f"{seconds}s"
-    elif seconds < 3600:
-        return f"{seconds // 60}m"
-    elif seconds < 86400:
-        hours = seconds // 3600
-        mins = (seconds % 3600) // 60
-        return f"{hours}h {mins}m" if mins else f"{hours}h"
-    else:
-        days = seconds // 86400
-        hours = (seconds % 86400) // 3600
-        return f"{days}d {hours}h" if hours else f"{days}d"
+
+    # Largest non-zero unit plus the next unit down when that is non-zero;
+    # seconds are only shown below one minute
+    minutes = seconds // 60
+    hours, minutes = divmod(minutes, 60)
+    days, hours = divmod(hours, 24)
+    parts = ((days, "d"), (hours, "h"), (minutes, "m"), (0, "s"))
+    first = 0 if days else 1 if hours else 2
+
+    (major, major_unit), (minor, minor_unit) = parts[first : first + 2]
+    if minor:
+        return f"{major}{major_unit} {minor}{minor_unit}"
+    return f"{major}{major_unit}"
 
 
 def get_time_range(
@@ -1,9 +1,34 @@
 """Test fixtures and configuration."""
 
+import tempfile
+from pathlib import Path
+
 import pytest
 
+from sysmon_ai.data import Repository
+
 
 def pytest_configure(config: pytest.Config) -> None:
     """Configure pytest."""
     config.addinivalue_line("markers", "slow: marks tests as slow")
     config.addinivalue_line("markers", "integration: marks integration tests")
+
+
+@pytest.fixture
+def temp_db() -> Path:
+    """Create temporary database file."""
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        db_path = Path(f.name)
+    yield db_path
+    if db_path.exists():
+        db_path.unlink()
+
+
+@pytest.fixture
+def repository(temp_db: Path) -> Repository:
+    """Create and initialize repository."""
+    repo = Repository(str(temp_db))
+    repo.connect()
+    repo.initialize_schema()
+    yield repo
+    repo.close()
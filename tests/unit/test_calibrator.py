@@ -0,0 +1,43 @@
+"""Unit tests for threshold calibration."""
+
+import numpy as np
+import pytest
+
+from sysmon_ai.detection import (
+    compute_fpr_tpr,
+    compute_fpr_tpr_sweep,
+    find_threshold_for_fpr,
+)
+
+
+@pytest.fixture
+def scored() -> tuple:
+    """Create scores with labels, anomalies skewed to low scores."""
+    rng = np.random.default_rng(42)
+    labels = (rng.uniform(0, 1, 1000) > 0.9).astype(int)
+    scores = rng.normal(0, 1, 1000) - labels * 1.5
+    return scores, labels
+
+
+def test_find_threshold_for_fpr_presorted(scored: tuple) -> None:
+    """Test presorted lookup matches percentile for a sweep of rates."""
+    scores, _ = scored
+    sorted_scores = np.sort(scores)
+
+    for fpr in (0.0, 0.01, 0.05, 0.1, 0.5, 1.0):
+        expected = np.percentile(scores, fpr * 100)
+        assert find_threshold_for_fpr(scores, fpr) == pytest.approx(expected)
+        presorted = find_threshold_for_fpr(sorted_scores, fpr, presorted=True)
+        assert presorted == pytest.approx(expected)
+
+
+def test_compute_fpr_tpr_sweep_matches_pointwise(scored: tuple) -> None:
+    """Test sweep matches per-threshold confusion counts."""
+    scores, labels = scored
+    thresholds = np.concatenate((np.linspace(-4, 3, 50), scores[:10]))
+
+    fpr, tpr = compute_fpr_tpr_sweep(scores, labels, thresholds)
+    expected = [compute_fpr_tpr(scores, labels, t) for t in thresholds]
+
+    np.testing.assert_allclose(fpr, [e[0] for e in expected])
+    np.testing.assert_allclose(tpr, [e[1] for e in expected])
@@ -0,0 +1,91 @@
+"""Unit tests for CLI commands."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from sysmon_ai.cli import app
+from sysmon_ai.config import Config
+from sysmon_ai.data import Repository
+from sysmon_ai.utils import now_utc_ts
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    """Create a database holding a few recent samples."""
+    path = tmp_path / "sysmon.db"
+    repo = Repository(str(path))
+    repo.connect()
+    repo.initialize_schema()
+
+    now = now_utc_ts()
+    repo.write_samples(
+        [
+            {
+                "ts": now - 60 + i,
+                "host": "test",
+                "cpu_pct": 50.0 + i,
+                "mem_pct": 60.0,
+                "disk_read_bps": 1024 * i,
+                "disk_write_bps": 0,
+                "net_up_bps": 0,
+                "net_down_bps": 0,
+                "swap_pct": 0.0,
+                "proc_count": 200,
+                "cpu_temp": None,
+            }
+            for i in range(10)
+        ]
+    )
+    repo.close()
+    return path
+
+
+def _export_json(db_path: Path, output: Path) -> list:
+    """Run export --format json and parse the written file."""
+    args = ["export", "--db", str(db_path), "--to", str(output)]
+    result = CliRunner().invoke(app, [*args, "--window", "1h", "--format", "json"])
+    assert result.exit_code == 0, result.output
+    return json.loads(output.read_text())
+
+
+def test_export_json_orjson_matches_pandas(
+    db_path: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the orjson export writes the same records as pandas."""
+    pytest.importorskip("orjson")
+    fast = _export_json(db_path, tmp_path / "fast.json")
+
+    monkeypatch.setitem(sys.modules, "orjson", None)  # Import raises
+    fallback = _export_json(db_path, tmp_path / "fallback.json")
+
+    assert len(fast) == 10
+    assert fast == fallback
+
+
+def test_export_reads_archived_shards(tmp_path: Path) -> None:
+    """Test export --config attaches monthly shards for long windows."""
+    path = tmp_path / "sysmon.db"
+    config = Config()
+    config.storage.db_path = str(path)
+    config.storage.shard_by_month = True
+    config_path = tmp_path / "config.yaml"
+    config.save(config_path)
+
+    repo = Repository(str(path), shard_by_month=True)
+    repo.connect()
+    repo.initialize_schema()
+    now = now_utc_ts()
+    row = ("test", 50.0, 60.0, 0, 0, 0, 0, 0.0, 200, None)
+    repo.write_sample_rows([(now - 40 * 86400, *row), (now - 60, *row)])
+    assert repo.archive_samples() == 1
+    repo.close()
+
+    output = tmp_path / "export.csv"
+    args = ["export", "--db", str(path), "--config", str(config_path)]
+    result = CliRunner().invoke(app, [*args, "--window", "60d", "--to", str(output)])
+    assert result.exit_code == 0, result.output
+    assert len(output.read_text().splitlines()) == 3  # Header and two rows
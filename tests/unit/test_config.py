@@ -0,0 +1,89 @@
+"""Unit tests for Config."""
+
+import os
+import platform
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from sysmon_ai.config import Config, _parse_env_value
+
+
+def test_config_load_reflects_file_changes(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test cached loads pick up edits and env overrides."""
+    monkeypatch.delenv("SYSMON_DB_PATH", raising=False)
+    path = tmp_path / "config.yaml"
+
+    config = Config()
+    config.storage.db_path = "first.db"
+    config.save(path)
+    assert Config.load(path).storage.db_path == "first.db"
+
+    # Loaded configs are independent instances
+    Config.load(path).storage.db_path = "mutated.db"
+    assert Config.load(path).storage.db_path == "first.db"
+
+    config.storage.db_path = "second.db"
+    config.save(path)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert Config.load(path).storage.db_path == "second.db"
+
+    monkeypatch.setenv("SYSMON_DB_PATH", "env.db")
+    assert Config.load(path).storage.db_path == "env.db"
+
+
+def test_config_save_round_trips_storage(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test every storage field survives save and load."""
+    monkeypatch.delenv("SYSMON_DB_PATH", raising=False)
+    path = tmp_path / "config.yaml"
+    config = Config()
+    config.storage.shard_by_month = True
+    config.storage.retention_days = 90
+    config.save(path)
+
+    assert Config.load(path).storage == config.storage
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("true", True),
+        ("NO", False),
+        ("1", True),
+        ("0", False),
+        ("42", 42),
+        ("-7", -7),
+        ("0.5", 0.5),
+        ("1e3", 1000.0),
+        ("host-01", "host-01"),
+        ("/var/lib/sysmon.db", "/var/lib/sysmon.db"),
+    ],
+)
+def test_parse_env_value(raw: str, expected: object) -> None:
+    """Test env values are coerced to bool, int, float or str."""
+    value = _parse_env_value(raw)
+    assert value == expected
+    assert type(value) is type(expected)
+
+
+def test_config_imports_without_os_uname() -> None:
+    """Test the default host does not depend on POSIX-only os.uname."""
+    code = (
+        "import os, platform; del os.uname; "
+        "from sysmon_ai.config import Config; "
+        "print(Config().host == platform.node())"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "True"
+    assert Config().host == platform.node()
@@ -4,25 +4,32 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from sysmon_ai.features import FeatureTransformer
+from sysmon_ai.features import FeatureTransformer, FeatureWindows
 
 
 @pytest.fixture
 def sample_df() -> pd.DataFrame:
     """Create sample dataframe for testing."""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     n = 100
 
+    # Column -> (low, high) of its uniform distribution
+    ranges = {
+        "cpu_pct": (20, 80),
+        "mem_pct": (30, 70),
+        "disk_read_bps": (0, 10**7),
+        "disk_write_bps": (0, 10**7),
+        "net_up_bps": (0, 10**6),
+        "net_down_bps": (0, 10**6),
+        "swap_pct": (0, 10),
+    }
+    lows, highs = np.array(list(ranges.values()), dtype=np.float64).T
+    values = rng.uniform(lows, highs, (n, len(ranges)))
+
     return pd.DataFrame({
         "ts": np.arange(1000000, 1000000 + n),
         "host": ["test"] * n,
-        "cpu_pct": np.random.uniform(20, 80, n),
-        "mem_pct": np.random.uniform(30, 70, n),
-        "disk_read_bps": np.random.uniform(0, 10**7, n),
-        "disk_write_bps": np.random.uniform(0, 10**7, n),
-        "net_up_bps": np.random.uniform(0, 10**6, n),
-        "net_down_bps": np.random.uniform(0, 10**6, n),
-        "swap_pct": np.random.uniform(0, 10, n),
+        **dict(zip(ranges, values.T)),
     })
 
 
@@ -53,6 +60,10 @@ def test_feature_transformer_transform(sample_df: pd.DataFrame) -> None:
     assert X_test.shape[1] == X_train.shape[1]
     assert not np.isnan(X_test).any()
 
+    # Inlined standardization matches the fitted scaler
+    features = transformer._engineer_features(test_df).to_numpy()
+    np.testing.assert_allclose(X_test, transformer.scaler.transform(features))
+
 
 def test_feature_transformer_get_feature_names(sample_df: pd.DataFrame) -> None:
     """Test feature name retrieval."""
@@ -67,3 +78,135 @@ def test_feature_transformer_get_feature_names(sample_df: pd.DataFrame) -> None:
     assert any("rmean" in name for name in feature_names)  # Rolling stats
     assert any("ema" in name for name in feature_names)  # EMA features
     assert any("slope" in name for name in feature_names)  # Slope features
+
+
+def test_feature_windows_add_slope_matches_polyfit(
+    sample_df: pd.DataFrame,
+) -> None:
+    """Test closed-form slope matches per-window polyfit."""
+    windows = FeatureWindows()
+    result = windows.add_slope(sample_df, ["cpu_pct", "disk_read_bps"])
+
+    for col in ("cpu_pct", "disk_read_bps"):
+        values = sample_df[col].to_numpy()
+        expected = np.zeros(len(values))
+        for i in range(9, len(values)):
+            expected[i] = np.polyfit(np.arange(10), values[i - 9 : i + 1], 1)[0]
+
+        np.testing.assert_allclose(
+            result[f"{col}_slope"], expected, rtol=1e-9, atol=1e-9
+        )
+
+
+def test_feature_transformer_matches_windows_pipeline(
+    sample_df: pd.DataFrame,
+) -> None:
+    """Test block feature engineering matches chained FeatureWindows."""
+    transformer = FeatureTransformer()
+    columns = transformer.metric_columns
+    windows = transformer.windows
+
+    expected = sample_df[columns].copy()
+    expected = windows.add_lags(expected, columns)
+    expected = windows.add_rolling_stats(expected, columns)
+    expected = windows.add_ema(expected, columns)
+    expected = windows.add_slope(expected, columns)
+    expected = windows.add_burstiness(expected, transformer.io_columns)
+    expected = expected.fillna(0.0)
+
+    result = transformer._engineer_features(sample_df)
+
+    assert result.columns.tolist() == expected.columns.tolist()
+    np.testing.assert_allclose(
+        result.to_numpy(), expected.to_numpy(), rtol=1e-9, atol=1e-9
+    )
+
+
+def test_feature_transformer_transform_reorders_columns(
+    sample_df: pd.DataFrame,
+) -> None:
+    """Test transform follows a fitted feature order that differs."""
+    transformer = FeatureTransformer()
+    transformer.fit_transform(sample_df)
+    expected = transformer.transform(sample_df)
+
+    names = transformer.get_feature_names()
+    perm = np.arange(len(names))[::-1]
+    transformer._feature_names = [names[i] for i in perm]
+    transformer.scaler.mean_ = transformer.scaler.mean_[perm]
+    transformer.scaler.scale_ = transformer.scaler.scale_[perm]
+    transformer._init_column_plan()
+    transformer._init_scaling()
+
+    np.testing.assert_allclose(
+        transformer.transform(sample_df), expected[:, perm]
+    )
+
+
+def test_feature_transformer_transform_ndarray(sample_df: pd.DataFrame) -> None:
+    """Test a raw metric array transforms like the dataframe."""
+    transformer = FeatureTransformer()
+    transformer.fit_transform(sample_df)
+
+    values = sample_df[transformer.metric_columns].to_numpy()
+
+    np.testing.assert_array_equal(
+        transformer.transform(values), transformer.transform(sample_df)
+    )
+    with pytest.raises(ValueError):
+        transformer.transform(values[:, :3])
+
+
+def test_feature_transformer_transform_reuses_buffer(
+    sample_df: pd.DataFrame,
+) -> None:
+    """Test reuse_buffer returns the same scratch array with fresh values."""
+    transformer = FeatureTransformer()
+    transformer.fit_transform(sample_df)
+
+    first = transformer.transform(sample_df.iloc[:20], reuse_buffer=True)
+    np.testing.assert_array_equal(
+        first, transformer.transform(sample_df.iloc[:20])
+    )
+
+    second = transformer.transform(sample_df.iloc[20:40], reuse_buffer=True)
+    assert second is first
+    np.testing.assert_array_equal(
+        second, transformer.transform(sample_df.iloc[20:40])
+    )
+    assert "_scratch" not in transformer.__getstate__()
+
+
+@pytest.mark.parametrize("n", [0, 1, 5, 29, 30, 100])
+def test_rolling_kernels_bottleneck_matches_pandas(
+    monkeypatch: pytest.MonkeyPatch,
+    n: int,
+) -> None:
+    """Test the bottleneck path matches pandas, including short inputs."""
+    pytest.importorskip("bottleneck")
+    from sysmon_ai.features import windows
+
+    assert windows.bn is not None
+    values = np.random.default_rng(n).standard_normal((n, 3))
+    kernels = (windows.move_mean, windows.move_std, windows.move_max)
+
+    fast = [kernel(values, 30) for kernel in kernels]
+    fast_1d = [kernel(values[:, 0], 30) for kernel in kernels]
+
+    monkeypatch.setattr(windows, "bn", None)
+    for kernel, result, result_1d in zip(kernels, fast, fast_1d):
+        np.testing.assert_allclose(result, kernel(values, 30), atol=1e-12)
+        np.testing.assert_allclose(result_1d, kernel(values[:, 0], 30), atol=1e-12)
+
+
+def test_feature_transformer_short_frame_with_bottleneck(
+    sample_df: pd.DataFrame,
+) -> None:
+    """Test frames shorter than the long window transform via bottleneck."""
+    pytest.importorskip("bottleneck")
+    transformer = FeatureTransformer()
+    transformer.fit_transform(sample_df)
+
+    features = transformer.transform(sample_df.iloc[:10])
+    assert features.shape[0] == 10
+    assert np.isfinite(features).all()
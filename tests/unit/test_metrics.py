@@ -0,0 +1,70 @@
+"""Unit tests for evaluation metrics."""
+
+import numpy as np
+import pytest
+from sklearn.metrics import (
+    accuracy_score,
+    precision_score,
+    recall_score,
+    roc_auc_score,
+)
+
+from sysmon_ai.evaluation import (
+    compute_classification_metrics,
+    compute_lead_time,
+)
+
+
+@pytest.fixture
+def predictions() -> tuple:
+    """Create labels, tied scores and thresholded predictions."""
+    rng = np.random.default_rng(42)
+    y_true = (rng.uniform(0, 1, 2000) < 0.1).astype(int)
+    y_scores = np.round(rng.normal(0, 1, 2000) - y_true, 1)
+    return y_true, y_scores < -1.0, y_scores
+
+
+def test_classification_metrics_match_sklearn(predictions: tuple) -> None:
+    """Test confusion-count metrics and rank AUC match sklearn."""
+    y_true, y_pred, y_scores = predictions
+
+    metrics = compute_classification_metrics(y_true, y_pred, y_scores)
+
+    assert metrics["accuracy"] == pytest.approx(accuracy_score(y_true, y_pred))
+    assert metrics["precision"] == pytest.approx(precision_score(y_true, y_pred))
+    assert metrics["recall"] == pytest.approx(recall_score(y_true, y_pred))
+    assert metrics["auc"] == pytest.approx(roc_auc_score(y_true, -y_scores))
+
+
+def test_classification_metrics_degenerate_auc() -> None:
+    """Test AUC falls back to 0.0 for one class or non-finite scores."""
+    y_true = np.zeros(10, dtype=int)
+
+    metrics = compute_classification_metrics(
+        y_true, np.zeros(10, dtype=bool), np.linspace(-1, 0, 10)
+    )
+
+    assert metrics["auc"] == 0.0
+    assert metrics["accuracy"] == 1.0
+
+    # NaN scores are rejected the same way sklearn would
+    y_true[0] = 1
+    scores = np.full(10, np.nan)
+    metrics = compute_classification_metrics(y_true, y_true == 1, scores)
+    assert metrics["auc"] == 0.0
+
+
+def test_compute_lead_time() -> None:
+    """Test lead time counts first detections within the window only."""
+    y_true = np.zeros(400, dtype=int)
+    y_pred = np.zeros(400, dtype=bool)
+    timestamps = np.arange(400) * 5
+
+    y_true[[10, 11, 12, 150, 300]] = 1
+    y_pred[[5, 14, 280, 399]] = True  # 150 has no detection in window
+
+    metrics = compute_lead_time(y_true, y_pred, timestamps)
+
+    # Starts 10 -> 14 (20s) and 300 -> 399 (495s)
+    assert metrics["mean_lead_time"] == pytest.approx((20 + 495) / 2)
+    assert metrics["median_lead_time"] == pytest.approx((20 + 495) / 2)
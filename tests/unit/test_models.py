@@ -1,23 +1,29 @@
-"""Unit tests for IsolationForestModel."""
+"""Unit tests for IsolationForestModel and forecasters."""
 
 import numpy as np
 import pytest
 
-from sysmon_ai.models import IsolationForestModel
+from sysmon_ai.models import (
+    IsolationForestModel,
+    MultiMetricForecaster,
+    TimeToThresholdForecaster,
+    deserialize_model,
+    serialize_model,
+)
 
 
 @pytest.fixture
 def sample_data() -> np.ndarray:
     """Create sample feature matrix."""
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     # Normal data
-    X_normal = np.random.randn(1000, 10)
+    X_normal = rng.standard_normal((1000, 10))
 
     # Add some anomalies
-    X_anomaly = np.random.randn(50, 10) * 5 + 10
+    X_anomaly = rng.standard_normal((50, 10)) * 5 + 10
 
     X = np.vstack([X_normal, X_anomaly])
-    np.random.shuffle(X)
+    rng.shuffle(X)
 
     return X
 
@@ -59,7 +65,7 @@ def test_isolation_forest_calibrate_threshold(sample_data: np.ndarray) -> None:
     model.fit(sample_data)
 
     # Calibrate on validation set (assumed normal)
-    X_val = np.random.randn(200, 10)
+    X_val = np.random.default_rng(0).standard_normal((200, 10))
     threshold = model.calibrate_threshold(X_val, target_fpr=0.05)
 
     assert isinstance(threshold, float)
@@ -71,7 +77,7 @@ def test_isolation_forest_predict_with_threshold(sample_data: np.ndarray) -> Non
     model = IsolationForestModel(n_estimators=50, random_state=42)
     model.fit(sample_data)
 
-    X_val = np.random.randn(200, 10)
+    X_val = np.random.default_rng(0).standard_normal((200, 10))
     model.calibrate_threshold(X_val, target_fpr=0.05)
 
     predictions = model.predict_with_threshold(sample_data)
@@ -79,3 +85,100 @@ def test_isolation_forest_predict_with_threshold(sample_data: np.ndarray) -> Non
     assert predictions.shape[0] == sample_data.shape[0]
     assert predictions.dtype == bool
     assert 0 < predictions.sum() < len(predictions)  # Some anomalies detected
+
+    scores = model.score_samples(sample_data)
+    assert np.array_equal(model.apply_threshold(scores), predictions)
+
+
+def test_serialize_deserialize_model(sample_data: np.ndarray) -> None:
+    """Test model round-trips through serialization."""
+    model = IsolationForestModel(n_estimators=10, random_state=42)
+    model.fit(sample_data)
+
+    restored = deserialize_model(serialize_model(model))
+
+    np.testing.assert_array_equal(
+        restored.score_samples(sample_data), model.score_samples(sample_data)
+    )
+
+
+def test_serialize_model_zstd(sample_data: np.ndarray) -> None:
+    """Test large models are wrapped in a zstd frame and round-trip."""
+    pytest.importorskip("zstandard")
+    model = IsolationForestModel(n_estimators=10, random_state=42)
+    model.fit(sample_data)
+
+    blob = serialize_model(model)
+    assert blob[:4] == b"\x28\xb5\x2f\xfd"  # zstd frame magic
+
+    restored = deserialize_model(blob)
+    np.testing.assert_array_equal(
+        restored.score_samples(sample_data), model.score_samples(sample_data)
+    )
+
+
+def test_serialize_model_lz4_without_zstd(
+    sample_data: np.ndarray, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test joblib's lz4 codec is used when zstandard is missing."""
+    pytest.importorskip("lz4")
+    from sysmon_ai.models import persistence
+
+    monkeypatch.setattr(persistence, "zstandard", None)
+    model = IsolationForestModel(n_estimators=10, random_state=42)
+    model.fit(sample_data)
+
+    blob = serialize_model(model)
+    assert blob[:4] == b"\x04\x22\x4d\x18"  # lz4 frame magic
+
+    restored = deserialize_model(blob)
+    np.testing.assert_array_equal(
+        restored.score_samples(sample_data), model.score_samples(sample_data)
+    )
+
+
+def test_serialize_small_model_uncompressed() -> None:
+    """Test tiny models are stored as a plain pickle and round-trip."""
+    X = np.arange(30, dtype=float).reshape(10, 3)
+    model = TimeToThresholdForecaster().fit(X, X.sum(axis=1))
+
+    blob = serialize_model(model)
+    assert blob[:1] == b"\x80"  # Pickle protocol header, no codec
+
+    restored = deserialize_model(blob)
+    np.testing.assert_allclose(restored.predict(X), model.predict(X))
+
+
+def test_forecaster_gbr_alias_uses_hist_boosting() -> None:
+    """Test 'gbr' and 'hgb' build the same histogram boosting model."""
+    rng = np.random.default_rng(42)
+    X = rng.uniform(0, 1, (200, 3))
+    y = X @ np.array([10.0, 20.0, 30.0])
+
+    legacy = TimeToThresholdForecaster(algo="gbr").fit(X, y)
+    hist = TimeToThresholdForecaster(algo="hgb").fit(X, y)
+
+    np.testing.assert_array_equal(legacy.predict(X), hist.predict(X))
+    _, lower, upper = hist.predict_with_confidence(X)
+    assert np.all(lower <= upper)
+
+    with pytest.raises(ValueError):
+        TimeToThresholdForecaster(algo="unknown")
+
+
+@pytest.mark.parametrize("algo", ["linear", "hgb"])
+def test_multi_metric_predict_all_matches_predict_metric(algo: str) -> None:
+    """Test batched prediction matches per-metric prediction."""
+    rng = np.random.default_rng(42)
+    X = rng.uniform(0, 1, (200, 3))
+    metrics = ["cpu_pct", "mem_pct", "swap_pct"]
+    forecaster = MultiMetricForecaster(metrics, {m: 90.0 for m in metrics}, algo=algo)
+    for i, metric in enumerate(metrics[:2]):
+        forecaster.fit_metric(metric, X, X[:, i] * 100 + rng.normal(0, 1, 200))
+
+    results = forecaster.predict_all(X)
+
+    assert list(results) == metrics[:2]  # Unfitted metrics are skipped
+    for metric, batched in results.items():
+        for got, expected in zip(batched, forecaster.predict_metric(metric, X)):
+            np.testing.assert_allclose(got, expected)
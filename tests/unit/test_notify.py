@@ -0,0 +1,43 @@
+"""Unit tests for Notifier."""
+
+import pytest
+
+from sysmon_ai.alerts import Notifier, RuleEngine
+from sysmon_ai.config import ThresholdConfig
+
+
+def test_notify_batch_matches_notify(capsys: pytest.CaptureFixture) -> None:
+    """Test batched output matches per-alert output."""
+    alerts = [
+        {"severity": "critical", "message": "CPU high"},
+        {"severity": "warning", "message": "Memory high"},
+        {"severity": "info", "message": "Anomaly"},
+    ]
+    notifier = Notifier()
+
+    for alert in alerts:
+        notifier.notify(alert)
+    expected = capsys.readouterr().err
+
+    notifier.notify_batch(alerts)
+    err = capsys.readouterr().err
+
+    assert err == expected
+    assert "\033[91m[CRITICAL] CPU high\033[0m" in err
+
+
+def test_notify_batch_accepts_alert_tuples(
+    capsys: pytest.CaptureFixture,
+) -> None:
+    """Test tuples from RuleEngine.iter_alerts format like dicts."""
+    data = {"cpu_pct": 99.0, "is_anomaly": True, "score": -0.7}
+    notifier = Notifier()
+
+    dicts = RuleEngine(ThresholdConfig()).evaluate(data, 1000000)
+    notifier.notify_batch(dicts)
+    expected = capsys.readouterr().err
+
+    tuples = RuleEngine(ThresholdConfig()).iter_alerts(data, 1000000)
+    notifier.notify_batch(tuples)
+
+    assert capsys.readouterr().err == expected
@@ -1,32 +1,13 @@
 """Unit tests for Repository."""
 
-import tempfile
+import sqlite3
 from pathlib import Path
 
 import pandas as pd
 import pytest
 
 from sysmon_ai.data import Repository
-
-
-@pytest.fixture
-def temp_db() -> Path:
-    """Create temporary database file."""
-    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
-        db_path = Path(f.name)
-    yield db_path
-    if db_path.exists():
-        db_path.unlink()
-
-
-@pytest.fixture
-def repository(temp_db: Path) -> Repository:
-    """Create and initialize repository."""
-    repo = Repository(str(temp_db))
-    repo.connect()
-    repo.initialize_schema()
-    yield repo
-    repo.close()
+from sysmon_ai.models import deserialize_model, serialize_model
 
 
 def test_repository_initialization(repository: Repository) -> None:
@@ -77,6 +58,22 @@ def test_repository_write_samples(repository: Repository) -> None:
     assert stats["sample_count"] == 2
 
 
+def test_repository_host_ids_survive_caller_rollback(
+    repository: Repository,
+) -> None:
+    """Test a host first written in a rolled-back transaction is re-added."""
+    row = ("edge-1", 50.0, 60.0, 0, 0, 0, 0, 0.0, 200, None)
+
+    repository._conn.execute("BEGIN")
+    repository.write_sample_rows([(1000000, *row)])
+    repository._conn.execute("ROLLBACK")
+
+    assert repository.write_sample_rows([(1000001, *row)]) == 1
+    df = repository.read_samples(1000000, 1000001)
+    assert df["ts"].tolist() == [1000001]
+    assert df["host"].tolist() == ["edge-1"]
+
+
 def test_repository_read_samples(repository: Repository) -> None:
     """Test reading samples."""
     # Write samples
@@ -107,6 +104,132 @@ def test_repository_read_samples(repository: Repository) -> None:
     assert df["cpu_pct"].iloc[0] == 50.0
 
 
+def test_repository_write_samples_df(repository: Repository) -> None:
+    """Test writing samples from a DataFrame."""
+    df = pd.DataFrame(
+        {
+            "ts": [1000000 + i for i in range(5)],
+            "host": "test",
+            "cpu_pct": [50.0 + i for i in range(5)],
+            "mem_pct": 60.0,
+            "disk_read_bps": 1000.0,
+            "disk_write_bps": 2000.0,
+            "net_up_bps": 500.0,
+            "net_down_bps": 1500.0,
+            "swap_pct": 5.0,
+            "proc_count": 200,
+        }
+    )
+
+    count = repository.write_samples_df(df)
+    assert count == 5
+
+    result = repository.read_samples(1000000, 1000004, downcast=False)
+    assert result["cpu_pct"].tolist() == df["cpu_pct"].tolist()
+    assert result["cpu_temp"].isna().all()
+
+
+def test_repository_write_samples_columnar(repository: Repository) -> None:
+    """Test writing samples given as one list per column."""
+    columns = {
+        "ts": [1000000, 1000001, 1000002],
+        "host": ["a", "b", "a"],
+        "cpu_pct": [10.0, 20.0, 30.0],
+        "mem_pct": [60.0] * 3,
+        "disk_read_bps": [0] * 3,
+        "disk_write_bps": [0] * 3,
+        "net_up_bps": [0] * 3,
+        "net_down_bps": [0] * 3,
+        "swap_pct": [0.0] * 3,
+        "proc_count": [200] * 3,
+    }
+
+    assert repository.write_samples_columnar(columns) == 3
+
+    result = repository.read_samples(1000000, 1000002, host="a")
+    assert result["cpu_pct"].tolist() == [10.0, 30.0]
+    assert result["cpu_temp"].isna().all()
+
+
+def test_repository_migrates_host_column(temp_db: Path) -> None:
+    """Test version 1 databases move host names into the hosts table."""
+    with sqlite3.connect(temp_db) as conn:
+        conn.executescript("""
+            CREATE TABLE samples (
+                ts INTEGER NOT NULL, host TEXT NOT NULL,
+                cpu_pct REAL NOT NULL, mem_pct REAL NOT NULL,
+                disk_read_bps INTEGER NOT NULL,
+                disk_write_bps INTEGER NOT NULL,
+                net_up_bps INTEGER NOT NULL, net_down_bps INTEGER NOT NULL,
+                swap_pct REAL NOT NULL, proc_count INTEGER NOT NULL,
+                cpu_temp REAL
+            );
+            CREATE INDEX idx_samples_ts ON samples(ts);
+            CREATE INDEX idx_samples_host_ts ON samples(host, ts);
+            INSERT INTO samples VALUES
+                (1000000, 'a', 10.0, 20.0, 0, 0, 0, 0, 0.0, 100, NULL),
+                (1000001, 'b', 11.0, 21.0, 0, 0, 0, 0, 0.0, 100, NULL);
+            """)
+    conn.close()
+
+    # connect() upgrades on its own, so every command can open the file
+    repo = Repository(str(temp_db))
+    repo.connect()
+
+    info = repo._conn.execute("PRAGMA table_info(samples)").fetchall()
+    columns = {row[1] for row in info}
+    assert "host" not in columns
+
+    df = repo.read_samples(1000000, 1000001)
+    assert df["host"].tolist() == ["a", "b"]
+
+    df = repo.read_samples(1000000, 1000001, host="b")
+    assert df["cpu_pct"].tolist() == [11.0]
+
+    # Initializing an upgraded database keeps its rows
+    repo.initialize_schema()
+    assert repo.get_stats()["sample_count"] == 2
+    repo.close()
+
+
+def test_repository_monthly_shards(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test archiving past months into shards, reading and pruning them."""
+    jan, feb, mar = 1704067200, 1706745600, 1709251200  # 2024-01/02/03
+    monkeypatch.setattr("sysmon_ai.data.repository.now_utc_ts", lambda: mar + 3600)
+
+    repo = Repository(str(tmp_path / "sysmon.db"), shard_by_month=True)
+    repo.connect()
+    repo.initialize_schema()
+    repo.write_sample_rows(
+        (ts + i, "test", 50.0, 60.0, 0, 0, 0, 0, 0.0, 200, None)
+        for ts in (jan, feb, mar)
+        for i in range(10)
+    )
+
+    assert repo.next_archive_ts() == 1711929600  # 2024-04
+    assert repo.archive_samples() == 20
+    assert repo.get_stats()["sample_count"] == 10
+    assert (tmp_path / "sysmon_202401.db").exists()
+    assert (tmp_path / "sysmon_202402.db").exists()
+
+    # Reconnect picks up the shards and reads span all of them
+    repo.close()
+    repo.connect()
+    df = repo.read_samples(jan, mar + 9)
+    assert len(df) == 30
+    assert df["ts"].is_monotonic_increasing
+    assert len(repo.read_samples(feb, feb + 4)) == 5
+
+    # Cutoff in mid-February removes only the January shard file
+    assert repo.prune_old_samples(retention_days=20) == 10
+    assert not (tmp_path / "sysmon_202401.db").exists()
+    assert len(repo.read_samples(jan, mar + 9)) == 20
+    repo.close()
+
+
 def test_repository_save_load_model(repository: Repository) -> None:
     """Test model persistence."""
     blob = b"fake_model_data"
@@ -129,6 +252,23 @@ def test_repository_save_load_model(repository: Repository) -> None:
     assert loaded["meta"] == meta
 
 
+def test_repository_open_model_blob(repository: Repository) -> None:
+    """Test streaming a stored model blob."""
+    model = {"weights": list(range(1000))}
+    repository.save_model(
+        name="test_model",
+        algo="test",
+        version="1.0",
+        blob=serialize_model(model),
+    )
+
+    with repository.open_model_blob("test_model") as blob:
+        assert deserialize_model(blob) == model
+
+    with repository.open_model_blob("missing") as blob:
+        assert blob is None
+
+
 def test_repository_write_read_events(repository: Repository) -> None:
     """Test event persistence."""
     event_id = repository.write_event(
@@ -145,3 +285,53 @@ def test_repository_write_read_events(repository: Repository) -> None:
     assert len(events) == 1
     assert events[0]["type"] == "anomaly"
     assert events[0]["score"] == 0.95
+
+
+def test_repository_write_events_bulk(repository: Repository) -> None:
+    """Test bulk event persistence."""
+    events = [
+        {"score": -0.6, "metric_tags": "cpu_pct", "explanation": "high CPU"},
+        {"score": -0.7, "metric_tags": "general", "explanation": "unusual"},
+    ]
+
+    assert repository.write_events_bulk(events) == 2
+
+    saved = repository.read_events(0, 2000000000, event_type="anomaly")
+    assert sorted(e["score"] for e in saved) == [-0.7, -0.6]
+    assert {e["metric_tags"] for e in saved} == {"cpu_pct", "general"}
+
+
+def test_repository_write_samples_rolls_back(repository: Repository) -> None:
+    """Test a failing batch leaves no partial rows behind."""
+    sample = {
+        "ts": 1000000,
+        "host": "test",
+        "cpu_pct": 50.0,
+        "mem_pct": 60.0,
+        "disk_read_bps": 1000.0,
+        "disk_write_bps": 2000.0,
+        "net_up_bps": 500.0,
+        "net_down_bps": 1500.0,
+        "swap_pct": 5.0,
+        "proc_count": 200,
+    }
+    bad = {**sample, "ts": 1000001, "cpu_pct": None}
+
+    with pytest.raises(sqlite3.IntegrityError):
+        repository.write_samples([sample, bad])
+
+    assert repository.get_stats()["sample_count"] == 0
+    assert repository.write_samples([sample]) == 1
+
+
+def test_repository_prune_old_samples(repository: Repository) -> None:
+    """Test pruning deletes old rows and releases their pages."""
+    values = ("test", 50.0, 60.0, 0.0, 0.0, 0.0, 0.0, 0.0, 200, None)
+    rows = [(1000000 + i, *values) for i in range(5000)]
+    repository.write_sample_rows(rows)
+
+    assert repository.prune_old_samples(retention_days=1) == 5000
+    assert repository.get_stats()["sample_count"] == 0
+
+    (free_pages,) = repository._conn.execute("PRAGMA freelist_count").fetchone()
+    assert free_pages == 0
@@ -0,0 +1,120 @@
+"""Unit tests for RuleEngine."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sysmon_ai.alerts import ForecastRule, RuleEngine
+from sysmon_ai.config import ThresholdConfig
+
+
+@pytest.fixture
+def samples_df() -> pd.DataFrame:
+    """Create sample dataframe with threshold breaches and anomalies."""
+    rng = np.random.default_rng(42)
+    n = 500
+
+    return pd.DataFrame(
+        {
+            "ts": np.arange(1000000, 1000000 + n * 5, 5),
+            "cpu_pct": rng.uniform(50, 100, n),
+            "mem_pct": rng.uniform(50, 100, n),
+            "swap_pct": rng.uniform(0, 100, n),
+            "is_anomaly": rng.uniform(0, 1, n) > 0.9,
+            "score": rng.uniform(-0.8, -0.3, n),
+        }
+    )
+
+
+def test_rule_engine_evaluate_threshold() -> None:
+    """Test threshold alert and cooldown."""
+    engine = RuleEngine(ThresholdConfig(cpu_pct=90.0))
+
+    alerts = engine.evaluate({"cpu_pct": 95.0}, current_ts=1000000)
+
+    assert len(alerts) == 1
+    assert alerts[0]["rule"] == "cpu_high"
+    assert alerts[0]["severity"] == "warning"
+
+    # Suppressed during cooldown
+    assert engine.evaluate({"cpu_pct": 95.0}, current_ts=1000010) == []
+    assert len(engine.evaluate({"cpu_pct": 95.0}, current_ts=1000060)) == 1
+
+
+def test_rule_engine_remove_rule() -> None:
+    """Test removed rules stop firing and the others keep their cooldowns."""
+    engine = RuleEngine(ThresholdConfig(cpu_pct=90.0, mem_pct=90.0))
+    sample = {"cpu_pct": 95.0, "mem_pct": 95.0}
+
+    assert [a["rule"] for a in engine.evaluate(sample, 1000000)] == [
+        "cpu_high",
+        "mem_high",
+    ]
+    assert isinstance(engine.rules, tuple)
+
+    assert engine.remove_rule("cpu_high")
+    assert not engine.remove_rule("cpu_high")
+    assert [rule.name for rule in engine.rules] == [
+        "mem_high",
+        "swap_high",
+        "anomaly_detected",
+    ]
+
+    assert engine.evaluate(sample, 1000010) == []
+    alerts = engine.evaluate(sample, 1000060)
+    assert [a["rule"] for a in alerts] == ["mem_high"]
+    assert alerts[0]["message"].startswith("mem_pct")
+
+
+def test_rule_engine_evaluate_batch_matches_evaluate(
+    samples_df: pd.DataFrame,
+) -> None:
+    """Test batch evaluation matches per-sample evaluation."""
+    sequential = RuleEngine(ThresholdConfig())
+    expected = []
+    for row in samples_df.to_dict("records"):
+        expected.extend(sequential.evaluate(row, row["ts"]))
+
+    batch = RuleEngine(ThresholdConfig())
+    alerts = batch.evaluate_batch(samples_df, samples_df["ts"].to_numpy())
+
+    assert len(alerts) > 0
+    assert alerts == expected
+    assert np.array_equal(batch._next_eligible, sequential._next_eligible)
+
+
+def test_rule_engine_evaluate_batch_after_remove_rule(
+    samples_df: pd.DataFrame,
+) -> None:
+    """Test batch masks follow the compiled rules after a removal."""
+    sequential = RuleEngine(ThresholdConfig())
+    sequential.remove_rule("cpu_high")
+    expected = []
+    for row in samples_df.to_dict("records"):
+        expected.extend(sequential.evaluate(row, row["ts"]))
+
+    batch = RuleEngine(ThresholdConfig())
+    batch.remove_rule("cpu_high")
+    alerts = batch.evaluate_batch(samples_df, samples_df["ts"].to_numpy())
+
+    assert {a["rule"] for a in alerts} >= {"mem_high"}
+    assert all(a["rule"] != "cpu_high" for a in alerts)
+    assert alerts == expected
+    assert np.array_equal(batch._next_eligible, sequential._next_eligible)
+
+
+def test_rule_engine_evaluate_forecast() -> None:
+    """Test forecast rules fire only when forecast data is present."""
+    engine = RuleEngine(ThresholdConfig())
+    engine.add_rule(ForecastRule("disk_full", "disk_pct", horizon_hours=24))
+
+    assert engine.evaluate({"cpu_pct": 10.0}, current_ts=1000000) == []
+
+    data = {
+        "cpu_pct": 95.0,
+        "forecast": {"disk_pct": {"time_to_threshold_minutes": 90.0}},
+    }
+    alerts = engine.evaluate(data, current_ts=1000000)
+
+    assert [a["rule"] for a in alerts] == ["cpu_high", "disk_full"]
+    assert alerts[1]["message"] == "disk_pct will reach threshold in 1.5h"
@@ -0,0 +1,121 @@
+"""Unit tests for sparkline, horizontal_bar and mini_histogram."""
+
+from importlib import import_module
+from typing import List, Optional
+
+import numpy as np
+import pytest
+
+from sysmon_ai.utils import horizontal_bar, mini_histogram, sparkline
+
+_BLOCKS = [" ", "▁", "▂", "▃", "▄", "▅", "▆", "▇", "█"]
+
+
+def _reference_sparkline(
+    data: List[float], min_val: Optional[float] = None, max_val: Optional[float] = None
+) -> str:
+    """Original per-element sparkline loop."""
+    if len(data) == 0:
+        return ""
+    if len(data) == 1:
+        return "▄"
+    min_val = min_val if min_val is not None else min(data)
+    max_val = max_val if max_val is not None else max(data)
+    if max_val == min_val:
+        return "▄" * len(data)
+    normalized = [int(((val - min_val) / (max_val - min_val)) * 8) for val in data]
+    return "".join(_BLOCKS[min(n, 8)] for n in normalized)
+
+
+def _reference_histogram(data: List[float], bins: int, height: int) -> List[str]:
+    """Original per-element mini_histogram loop."""
+    min_val, max_val = min(data), max(data)
+    if max_val == min_val:
+        return [" " * bins for _ in range(height)]
+    bin_width = (max_val - min_val) / bins
+    counts = [0] * bins
+    for val in data:
+        counts[min(int((val - min_val) / bin_width), bins - 1)] += 1
+    max_count = max(counts)
+    lines = []
+    for h in range(height, 0, -1):
+        threshold = (h / height) * max_count
+        lines.append("".join("█" if count >= threshold else " " for count in counts))
+    return lines
+
+
+@pytest.fixture(autouse=True)
+def unicode_terminal(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Render with block characters regardless of the test's stdout."""
+    module = import_module("sysmon_ai.utils.sparkline")
+    monkeypatch.setattr(module, "can_render_unicode", lambda: True)
+
+
+def test_sparkline_matches_reference() -> None:
+    """Test sparkline matches the per-element loop, peaks included."""
+    rng = np.random.default_rng(42)
+
+    for _ in range(2000):
+        n = int(rng.integers(2, 120))
+        scale, offset = rng.uniform(1, 200), rng.uniform(-50, 50)
+        data = (rng.standard_normal(n) * scale + offset).tolist()
+        result = sparkline(data)
+
+        assert result == _reference_sparkline(data)
+        assert result[int(np.argmax(data))] == "█"
+
+    # Float32 ring-buffer views and a fixed percentage axis
+    history = rng.uniform(0, 100, 100).astype(np.float32)
+    values = history.tolist()
+    assert sparkline(history) == _reference_sparkline(values)
+    assert sparkline(history, 0.0, 100.0) == _reference_sparkline(values, 0.0, 100.0)
+
+
+def test_sparkline_edge_cases() -> None:
+    """Test empty, single, flat and out-of-bounds input."""
+    assert sparkline([]) == ""
+    assert sparkline([3.0]) == "▄"
+    assert sparkline([2.0, 2.0, 2.0]) == "▄▄▄"
+    assert sparkline([1.0, 2.0], 5.0, 5.0) == "▄▄"
+    assert sparkline([-10.0, 50.0, 200.0], 0.0, 100.0) == " ▄█"
+
+
+def test_sparkline_ascii_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the ASCII level ramp when Unicode cannot be rendered."""
+    module = import_module("sysmon_ai.utils.sparkline")
+    monkeypatch.setattr(module, "can_render_unicode", lambda: False)
+
+    assert sparkline(list(range(9))) == " .:-=+*#@"
+    assert sparkline([1.0]) == "="
+    assert mini_histogram([1.0, 2.0, 3.0, 3.0], bins=4, height=2) == ["   @", "@ @@"]
+
+
+def test_horizontal_bar() -> None:
+    """Test bar widths, clamping and styles."""
+    assert horizontal_bar(50, 100, width=10) == "█████░░░░░"
+    assert horizontal_bar(150, 100, width=10) == "█" * 10
+    assert horizontal_bar(-5, 100, width=10) == "░" * 10
+    assert horizontal_bar(5, 0, width=4) == "░░░░"
+    assert horizontal_bar(2, 4, width=4, filled="#", empty=".") == "##.."
+
+    for value in np.linspace(0, 100, 301).tolist():
+        filled = int((value / 100) * 30)
+        expected = "█" * filled + "░" * (30 - filled)
+        assert horizontal_bar(value, 100, width=30) == expected
+
+
+def test_mini_histogram_matches_reference() -> None:
+    """Test mini_histogram matches the per-element loop."""
+    rng = np.random.default_rng(42)
+
+    for _ in range(300):
+        n = int(rng.integers(2, 2000))
+        bins = int(rng.integers(1, 20))
+        height = int(rng.integers(1, 8))
+        data = rng.standard_normal(n).tolist()
+
+        expected = _reference_histogram(data, bins, height)
+        assert mini_histogram(data, bins, height) == expected
+
+    assert mini_histogram([], bins=4) == ["    "]
+    assert mini_histogram([2.0, 2.0], bins=3, height=2) == ["   ", "   "]
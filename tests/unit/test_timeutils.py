@@ -0,0 +1,59 @@
+"""Unit tests for duration parsing and formatting."""
+
+import pytest
+
+from sysmon_ai.utils import format_duration, parse_duration
+
+
+def _reference_format_duration(seconds: int) -> str:
+    """Original if/elif format_duration."""
+    if seconds < 60:
+        return f"{seconds}s"
+    elif seconds < 3600:
+        return f"{seconds // 60}m"
+    elif seconds < 86400:
+        hours = seconds // 3600
+        mins = (seconds % 3600) // 60
+        return f"{hours}h {mins}m" if mins else f"{hours}h"
+    else:
+        days = seconds // 86400
+        hours = (seconds % 86400) // 3600
+        return f"{days}d {hours}h" if hours else f"{days}d"
+
+
+@pytest.mark.parametrize(
+    "duration, expected",
+    [
+        ("1h", 3600),
+        ("7d", 604800),
+        ("30m", 1800),
+        ("2w", 1209600),
+        ("45s", 45),
+        ("45", 45),
+        (" 7D ", 604800),
+        ("1 h", 3600),
+        ("-5s", -5),
+    ],
+)
+def test_parse_duration(duration: str, expected: int) -> None:
+    """Test units, bare seconds, case and whitespace."""
+    assert parse_duration(duration) == expected
+
+
+@pytest.mark.parametrize("duration", ["", "h", "1.5h", "abc", "1y"])
+def test_parse_duration_invalid(duration: str) -> None:
+    """Test malformed durations raise ValueError."""
+    with pytest.raises(ValueError, match="Invalid duration format"):
+        parse_duration(duration)
+
+
+def test_format_duration_matches_reference() -> None:
+    """Test format_duration matches the original implementation."""
+    values = list(range(-100, 200000, 7)) + [86400 * 3, 86400 * 3 + 3600, 10**9]
+
+    for seconds in values:
+        assert format_duration(seconds) == _reference_format_duration(seconds)
+
+    assert format_duration(90.7) == "1m"
+    assert format_duration(3630) == "1h"
+    assert format_duration(93784) == "1d 2h"
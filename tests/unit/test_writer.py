@@ -0,0 +1,98 @@
+"""Unit tests for BatchWriter."""
+
+import threading
+from collections import deque
+from typing import Any
+
+import pytest
+
+from sysmon_ai.data import Repository
+from sysmon_ai.ingest import BatchWriter
+
+
+def _sample(ts: int) -> dict:
+    """Build a minimal sample dict."""
+    return {
+        "ts": ts,
+        "host": "test",
+        "cpu_pct": 50.0,
+        "mem_pct": 60.0,
+        "disk_read_bps": 0,
+        "disk_write_bps": 0,
+        "net_up_bps": 0,
+        "net_down_bps": 0,
+        "swap_pct": 0.0,
+        "proc_count": 200,
+        "cpu_temp": None,
+    }
+
+
+def test_batch_writer_drops_oldest(repository: Repository) -> None:
+    """Test a full queue evicts the oldest samples."""
+    writer = BatchWriter(repository, batch_size=2, max_queue_size=3)
+
+    results = [writer.enqueue(_sample(1000000 + i)) for i in range(5)]
+    assert results == [True, True, True, False, False]
+    assert writer.get_stats() == {"written": 0, "dropped": 2, "queued": 3}
+
+    writer._flush()
+
+    df = repository.read_samples(1000000, 1000004)
+    assert df["ts"].tolist() == [1000002, 1000003, 1000004]
+
+
+@pytest.mark.parametrize(
+    "before, after, dropped",
+    [(1, 0, 0), (2, 0, 0), (0, 1, 1)],
+)
+def test_batch_writer_counts_drops_around_concurrent_drain(
+    repository: Repository, before: int, after: int, dropped: int
+) -> None:
+    """Test drops stay exact when the writer drains during an enqueue."""
+    writer = BatchWriter(repository, batch_size=10, max_queue_size=3)
+    for i in range(3):
+        writer.enqueue(_sample(1000000 + i))
+
+    class DrainingDeque(deque):
+        """Deque whose append races the writer draining samples."""
+
+        def append(self, item: Any) -> None:
+            writer._drain(before)
+            super().append(item)
+            writer._drain(after)
+
+    writer._queue = DrainingDeque(writer._queue, maxlen=3)
+    writer.enqueue(_sample(1000003))
+
+    stats = writer.get_stats()
+    assert stats["dropped"] == dropped
+    assert stats["queued"] == 4 - before - after - dropped
+
+
+def test_batch_writer_paused_holds_off_flush(repository: Repository) -> None:
+    """Test a flush waits while the writer is paused."""
+    writer = BatchWriter(repository, batch_size=2)
+    writer.enqueue(_sample(1000000))
+
+    with writer.paused():
+        flusher = threading.Thread(target=writer._flush)
+        flusher.start()
+        flusher.join(timeout=0.1)
+        assert flusher.is_alive()
+        assert writer.get_stats()["written"] == 0
+
+    flusher.join()
+    assert writer.get_stats()["written"] == 1
+
+
+def test_batch_writer_flushes_on_stop(repository: Repository) -> None:
+    """Test the background thread writes everything queued by stop()."""
+    writer = BatchWriter(repository, batch_size=10, flush_interval=0.05)
+    writer.start()
+
+    for i in range(25):
+        writer.enqueue(_sample(1000000 + i))
+    writer.stop()
+
+    assert writer.get_stats()["written"] == 25
+    assert len(repository.read_samples(1000000, 1000024)) == 25
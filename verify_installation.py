@@ -1,8 +1,19 @@
 #!/usr/bin/env python3
 """Verify installation and basic functionality."""
 
+import importlib
 import sys
 from pathlib import Path
+from typing import Optional, Tuple
+
+
+def _try_import(name: str) -> Tuple[str, Optional[ImportError]]:
+    """Import a module, returning (name, error or None)."""
+    try:
+        importlib.import_module(name)
+        return name, None
+    except ImportError as e:
+        return name, e
 
 
 def check_imports() -> bool:
@@ -21,13 +32,16 @@ def check_imports() -> bool:
         "joblib",
     ]
 
+    # Sequential: the packages share dependencies (sklearn imports numpy,
+    # scipy, pandas and joblib; pandas and matplotlib import numpy), and
+    # concurrent imports could observe partially initialized modules
     failed = []
     for package in required:
-        try:
-            __import__(package)
+        _, error = _try_import(package)
+        if error is None:
             print(f"  ✓ {package}")
-        except ImportError as e:
-            print(f"  ✗ {package}: {e}")
+        else:
+            print(f"  ✗ {package}: {error}")
             failed.append(package)
 
     if failed:
@@ -54,13 +68,15 @@ def check_sysmon_imports() -> bool:
         "sysmon_ai.cli",
     ]
 
+    # Sequential: these import each other, and concurrent imports of
+    # interdependent modules can observe partially initialized ones
     failed = []
     for module in modules:
-        try:
-            __import__(module)
+        _, error = _try_import(module)
+        if error is None:
             print(f"  ✓ {module}")
-        except ImportError as e:
-            print(f"  ✗ {module}: {e}")
+        else:
+            print(f"  ✗ {module}: {error}")
             failed.append(module)
 
     if failed: